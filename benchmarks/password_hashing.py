@@ -0,0 +1,133 @@
+"""Catalog request latency during sign in storm.
+
+Serves catalog-like requests at fixed rate while concurrent clients sign in,
+with password hashing policy of settings called inline on event loop and
+in password hasher pool, and prints catalog latency percentiles. Sign ins rejected because hashing
+queue is full are counted, as they would get 503. Postgres is not needed.
+
+Usage:
+    $ python -m benchmarks.password_hashing
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Final, List, Optional, Tuple
+
+from pizza_store import models
+from pizza_store.dependencies.hashing import hashing_policy
+from pizza_store.hashing import HashingQueueFull, PasswordHasher
+
+DURATION: Final[float] = 5.0
+# Seconds between catalog requests
+CATALOG_INTERVAL: Final[float] = 0.002
+SIGN_IN_CLIENTS: Final[int] = 16
+PASSWORD: Final[str] = "secret"
+
+PRODUCTS: Final[List[models.Product]] = [
+    models.Product(
+        id=i,
+        category_id=1,
+        name=f"Pizza {i}",
+        weight=500,
+        price=1000,
+        image=f"static/img/{i}.jpg",
+    )
+    for i in range(50)
+]
+
+CRYPT_CONTEXT: Final = hashing_policy.crypt_context()
+
+Verify = Callable[[str, str], Awaitable[bool]]
+
+
+async def catalog_request() -> None:
+    await asyncio.sleep(0)
+    models.ProductPage(items=PRODUCTS, next=None).json()
+
+
+async def serve_catalog(deadline: float) -> List[float]:
+    """Issues catalog requests on fixed schedule and returns their latencies.
+
+    Latency is counted from scheduled arrival, so time requests could not
+    even be accepted because event loop was blocked is included.
+    """
+
+    latencies: List[float] = []
+
+    async def request(arrived_at: float) -> None:
+        await catalog_request()
+        latencies.append(time.perf_counter() - arrived_at)
+
+    tasks = []
+    arrived_at = time.perf_counter()
+    while arrived_at < deadline:
+        # Requests which arrived while loop was blocked are accepted at once
+        while arrived_at <= time.perf_counter() and arrived_at < deadline:
+            tasks.append(asyncio.ensure_future(request(arrived_at)))
+            arrived_at += CATALOG_INTERVAL
+        await asyncio.sleep(max(arrived_at - time.perf_counter(), 0))
+    await asyncio.gather(*tasks)
+
+    return latencies
+
+
+async def sign_in_client(verify: Verify, password_hash: str, deadline: float) -> int:
+    rejected = 0
+    while time.perf_counter() < deadline:
+        try:
+            await verify(PASSWORD, password_hash)
+        except HashingQueueFull:
+            rejected += 1
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0)
+
+    return rejected
+
+
+async def inline_verify(password: str, password_hash: str) -> bool:
+    return CRYPT_CONTEXT.verify(password, password_hash)
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)] * 1000
+
+
+async def run(verify: Optional[Verify], password_hash: str) -> Tuple[List[float], int]:
+    deadline = time.perf_counter() + DURATION
+    clients = []
+    if verify is not None:
+        clients = [
+            sign_in_client(verify, password_hash, deadline)
+            for _ in range(SIGN_IN_CLIENTS)
+        ]
+    latencies, *rejected = await asyncio.gather(serve_catalog(deadline), *clients)
+
+    return latencies, sum(rejected)
+
+
+async def main() -> None:
+    password_hash = CRYPT_CONTEXT.hash(PASSWORD)
+    hasher = PasswordHasher(workers=1, queue_size=8, policy=hashing_policy)
+    await hasher.start()
+
+    modes: List[Tuple[str, Optional[Verify]]] = [
+        ("no sign ins", None),
+        ("inline hashing", inline_verify),
+        ("process pool", hasher.verify),
+    ]
+    try:
+        for mode, verify in modes:
+            latencies, rejected = await run(verify, password_hash)
+            print(
+                f"{mode}: catalog p50 {percentile(latencies, 0.5):.1f} ms, "
+                f"p99 {percentile(latencies, 0.99):.1f} ms, "
+                f"{len(latencies)} requests, {rejected} sign ins rejected"
+            )
+        print(hasher.metrics())
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Final, List
+from unittest import mock
+
+from pizza_store.db.db import db_url
+from pizza_store.db.models import Base
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+# Scratch schema, benchmarks never touch application tables
+BENCHMARK_SCHEMA: Final[str] = "benchmark"
+
+
+@asynccontextmanager
+async def benchmark_engine() -> AsyncIterator[AsyncEngine]:
+    """Creates engine bound to scratch schema with empty tables.
+
+    Database url is taken from BENCHMARK_DB_URL environment variable,
+    application database is used by default. Schema is dropped on exit.
+
+    Yields:
+        AsyncEngine
+    """
+
+    url = os.environ.get("BENCHMARK_DB_URL", db_url)
+    admin_engine = create_async_engine(url)
+    async with admin_engine.begin() as connection:
+        await connection.execute(
+            text(f"DROP SCHEMA IF EXISTS {BENCHMARK_SCHEMA} CASCADE")
+        )
+        await connection.execute(text(f"CREATE SCHEMA {BENCHMARK_SCHEMA}"))
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    # public is needed for pg_trgm operator classes
+    engine = create_async_engine(
+        url,
+        connect_args={"server_settings": {"search_path": f"{BENCHMARK_SCHEMA},public"}},
+    )
+    try:
+        async with engine.begin() as connection:
+            # Without checkfirst, application tables in public do not hide ours
+            await connection.run_sync(Base.metadata.create_all, checkfirst=False)
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {BENCHMARK_SCHEMA} CASCADE"))
+        await admin_engine.dispose()
+
+
+class StatementRecorder:
+    """Session stub which records statements built by CRUD instead of executing them.
+
+    Example:
+        >>> recorder = StatementRecorder()
+        >>> await ProductCRUD.get_products(recorder)
+        >>> recorder.statements[-1]
+        <sqlalchemy.sql.selectable.Select object>
+    """
+
+    def __init__(self) -> None:
+        self.statements: List[Any] = []
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        self.statements.append(statement)
+        return mock.MagicMock()
+
+    def add(self, instance: Any) -> None:
+        pass
+
+
+async def explain(session: AsyncSession, statement: Any) -> str:
+    """Executes statement with EXPLAIN (ANALYZE, BUFFERS) and returns plan.
+
+    Args:
+        session (AsyncSession)
+        statement (Any): sqlalchemy statement
+
+    Returns:
+        str: query plan
+    """
+
+    sql = statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    res = await session.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"))
+    return "\n".join(row[0] for row in res)
+
+
+async def timeit(func: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Returns mean duration of `func` call in milliseconds.
+
+    Args:
+        func (Callable[[], Awaitable[Any]])
+        repeat (int): number of calls
+
+    Returns:
+        float
+    """
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        await func()
+
+    return (time.perf_counter() - started_at) * 1000 / repeat
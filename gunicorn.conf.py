@@ -1,8 +1,16 @@
-import multiprocessing
+import asyncio
 
+from pizza_store.db.migrate import run_migrations
+from pizza_store.db.pool import get_workers_count
 from pizza_store.settings import settings
 
 wsgi_app = "pizza_store.app:app"
 bind = f"{settings.SERVER_HOST}:{settings.SERVER_PORT}"
-workers = multiprocessing.cpu_count() * 2 + 1
+# Database pools are sized from this number, do not override it with -w
+workers = get_workers_count(settings.SERVER_WORKERS)
 worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server) -> None:
+    # Once per deploy before workers fork, workers only check schema version
+    asyncio.run(run_migrations())
@@ -1,17 +1,40 @@
 import uvicorn
 from fastapi import FastAPI
 
-from pizza_store.db.db import init_models
+from pizza_store.cache import CatalogInvalidationListener
+from pizza_store.db.db import engine, listen_dsn, replica_engine
+from pizza_store.db.migrate import check_schema_version
+from pizza_store.db.warmup import warm_up_pool
+from pizza_store.dependencies.cache import catalog_cache
+from pizza_store.dependencies.hashing import password_hasher
 from pizza_store.routers import router
 from pizza_store.settings import settings
 
 app = FastAPI()
 app.include_router(router)
 
+catalog_listener = CatalogInvalidationListener(listen_dsn, catalog_cache)
+
 
 @app.on_event("startup")
 async def on_start() -> None:
-    await init_models()
+    # Schema is migrated by gunicorn master before workers start
+    await check_schema_version(engine)
+    # Worker accepts requests only after startup, so first requests
+    # do not pay for connecting and preparing statements
+    await warm_up_pool(engine, connections=settings.POSTGRES_POOL_WARMUP)
+    if replica_engine is not engine:
+        await warm_up_pool(
+            replica_engine, connections=settings.POSTGRES_POOL_WARMUP, replica=True
+        )
+    await password_hasher.start()
+    catalog_listener.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await catalog_listener.stop()
+    password_hasher.shutdown()
 
 
 if __name__ == "__main__":
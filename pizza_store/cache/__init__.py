@@ -0,0 +1,11 @@
+from pizza_store.cache.catalog import CatalogCache
+from pizza_store.cache.listener import CatalogInvalidationListener
+from pizza_store.cache.snapshot import CatalogSnapshot
+from pizza_store.cache.token import TokenCache
+
+__all__ = [
+    "CatalogCache",
+    "CatalogInvalidationListener",
+    "CatalogSnapshot",
+    "TokenCache",
+]
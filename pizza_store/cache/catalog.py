@@ -0,0 +1,223 @@
+import asyncio
+import functools
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    TypeVar,
+)
+
+import sqlalchemy as sa
+from pizza_store.constants.cache import CATALOG_CHANNEL
+from pizza_store.utils.dataloader import DataLoader
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+Loader = Callable[[AsyncSession], Awaitable[T]]
+BatchLoader = Callable[[AsyncSession, list[K]], Awaitable[Mapping[K, T]]]
+
+
+class _Entry(NamedTuple):
+    version: int
+    value: Any
+
+
+class CatalogCache:
+    """Per-worker versioned read-through cache for catalog data.
+
+    Every catalog change bumps the cache version. Entries loaded for an older
+    version are stale: they are still returned to readers while a single
+    background task reloads them (stale-while-revalidate), so a refresh never
+    stalls requests. Only a cold key makes readers wait for the loader.
+
+    Example:
+        >>> cache = CatalogCache(async_session)
+        >>> products = await cache.get("products", load_products)
+        >>> cache.invalidate()
+        >>> products = await cache.get("products", load_products)  # stale value, reload started
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._version = 0
+        self._entries: Dict[str, _Entry] = {}
+        self._loading: Dict[str, "asyncio.Task[Any]"] = {}
+        self._data_loaders: Dict[str, DataLoader[Any, Any]] = {}
+
+    @property
+    def version(self) -> int:
+        """Current catalog version of this worker."""
+
+        return self._version
+
+    async def get(self, key: str, loader: Loader[T], allow_stale: bool = True) -> T:
+        """Returns cached value for `key`, loading it with `loader` if needed.
+
+        Args:
+            key (str): cache key
+            loader (Loader[T]): coroutine function which fetches value from db
+                with passed session
+            allow_stale (bool): if False waits for reload of stale entry
+                instead of returning it
+
+        Returns:
+            T: cached value
+        """
+
+        entry = self._entries.get(key)
+        while entry is None or (not allow_stale and entry.version != self._version):
+            # Shield shared load from cancellation of a single reader
+            await asyncio.shield(self._refresh(key, loader))
+            entry = self._entries[key]
+
+        if entry.version != self._version:
+            self._refresh(key, loader)
+
+        return entry.value
+
+    async def get_items(
+        self, prefix: str, keys: Iterable[K], loader: BatchLoader[K, T]
+    ) -> Dict[K, T]:
+        """Returns cached items of `keys`, loading missing and stale ones.
+
+        Items are cached one per key. Items missing from concurrent calls
+        within one event loop iteration are loaded with a single `loader` call.
+        Stale items are not returned, they are reloaded.
+
+        NOTE: Batch loader of `prefix` is kept for the worker lifetime, so
+        `loader` must not be bound to request state, e.g. its session.
+
+        Example:
+            >>> await cache.get_items("product", [1, 2], load_products_by_ids)
+            {1: Product(id=1, ...), 2: Product(id=2, ...)}
+
+        Args:
+            prefix (str): items cache key prefix
+            keys (Iterable[K]): item keys
+            loader (BatchLoader[K, T]): coroutine function which fetches items
+                of passed keys from db with passed session. Keys which items
+                do not exist are omitted from result.
+
+        Returns:
+            Dict[K, T]: keys which items do not exist are omitted
+        """
+
+        items: Dict[K, T] = {}
+        missing = []
+        for key in keys:
+            entry = self._entries.get(f"{prefix}:{key}")
+            if entry is not None and entry.version == self._version:
+                items[key] = entry.value
+            else:
+                missing.append(key)
+
+        if missing:
+            data_loader = self._data_loaders.get(prefix)
+            if data_loader is None:
+                data_loader = self._data_loaders[prefix] = DataLoader(
+                    functools.partial(self._load_items, prefix, loader)
+                )
+            items.update(await data_loader.load_many(missing))
+
+        return items
+
+    def invalidate(self) -> None:
+        """Marks all entries as stale.
+
+        Stale entries are reloaded in background on next access.
+        """
+
+        self._version += 1
+
+    async def notify(self, session: AsyncSession) -> None:
+        """Notifies all workers that catalog has changed.
+
+        Notification is transactional: it is delivered only when
+        `session` transaction commits.
+
+        NOTE: Does not commit.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+        """
+
+        await session.execute(sa.select(sa.func.pg_notify(CATALOG_CHANNEL, "")))
+
+    def _refresh(self, key: str, loader: Loader[T]) -> "asyncio.Task[T]":
+        """Starts loading of `key` if it is not loading yet.
+
+        Args:
+            key (str): cache key
+            loader (Loader[T])
+
+        Returns:
+            asyncio.Task[T]: loading task
+        """
+
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader))
+            task.add_done_callback(self._log_load_error)
+            self._loading[key] = task
+
+        return task
+
+    async def _load(self, key: str, loader: Loader[T]) -> T:
+        """Loads value and stores it with version at which loading started.
+
+        If catalog changes while loading, entry stays stale and will be reloaded.
+
+        Args:
+            key (str): cache key
+            loader (Loader[T])
+
+        Returns:
+            T: loaded value
+        """
+
+        version = self._version
+        try:
+            async with self._session_factory() as session:
+                value = await loader(session)
+            self._entries[key] = _Entry(version=version, value=value)
+        finally:
+            del self._loading[key]
+
+        return value
+
+    async def _load_items(
+        self, prefix: str, loader: BatchLoader[K, T], keys: list[K]
+    ) -> Mapping[K, T]:
+        """Loads items and stores them with version at which loading started.
+
+        Args:
+            prefix (str): items cache key prefix
+            loader (BatchLoader[K, T])
+            keys (list[K])
+
+        Returns:
+            Mapping[K, T]: loaded items
+        """
+
+        version = self._version
+        async with self._session_factory() as session:
+            items = await loader(session, keys)
+        for key, value in items.items():
+            self._entries[f"{prefix}:{key}"] = _Entry(version=version, value=value)
+
+        return items
+
+    @staticmethod
+    def _log_load_error(task: "asyncio.Task[Any]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Catalog cache load failed", exc_info=task.exception())
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Any, Optional
+
+import asyncpg
+from pizza_store.cache.catalog import CatalogCache
+from pizza_store.constants.cache import (
+    CATALOG_CHANNEL,
+    CATALOG_LISTENER_RECONNECT_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogInvalidationListener:
+    """Invalidates worker catalog cache on Postgres catalog notifications.
+
+    Holds one dedicated connection which LISTENs `CATALOG_CHANNEL`.
+    Reconnects when connection is lost and invalidates cache after every
+    (re)connect because notifications could be missed meanwhile.
+
+    Example:
+        >>> listener = CatalogInvalidationListener(dsn, catalog_cache)
+        >>> listener.start()
+        >>> ...
+        >>> await listener.stop()
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        cache: CatalogCache,
+        reconnect_delay: float = CATALOG_LISTENER_RECONNECT_DELAY,
+    ) -> None:
+        self._dsn = dsn
+        self._cache = cache
+        self._reconnect_delay = reconnect_delay
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Starts listening in background."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops listening and closes connection."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                logger.exception("Catalog invalidation listener failed")
+
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _listen(self) -> None:
+        """Listens catalog channel until connection is lost."""
+
+        connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        try:
+            await connection.add_listener(CATALOG_CHANNEL, self._on_notification)
+            self._cache.invalidate()
+            await closed.wait()
+        finally:
+            await connection.close()
+
+    def _on_notification(self, *_: Any) -> None:
+        self._cache.invalidate()
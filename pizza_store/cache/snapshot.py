@@ -0,0 +1,72 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Generic, Optional, Sequence, Tuple, TypeVar
+
+import brotli
+from fastapi.encoders import jsonable_encoder
+from pizza_store.constants.cache import BROTLI_QUALITY, GZIP_COMPRESS_LEVEL
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot(Generic[T]):
+    """Catalog items with their rendered JSON body and strong ETag.
+
+    Body is rendered and compressed once per catalog version, so responses
+    are served without validation and serialization. ETag is a hash of body,
+    so it is equal on every worker which has the same catalog.
+    """
+
+    items: Sequence[T]
+    etag: str
+    body: bytes
+    encoded_bodies: Dict[str, bytes]
+
+    @classmethod
+    def from_items(cls, items: Sequence[T]) -> "CatalogSnapshot[T]":
+        """Renders items to JSON, compresses it and computes ETag.
+
+        NOTE: CPU bound, run in threadpool.
+
+        Args:
+            items (Sequence[T]): pydantic models
+
+        Returns:
+            CatalogSnapshot[T]
+        """
+
+        body = json.dumps(
+            jsonable_encoder(items),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+        # Ordered by server preference
+        encoded_bodies = {
+            "br": brotli.compress(body, quality=BROTLI_QUALITY),
+            "gzip": gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0),
+        }
+
+        return cls(items=items, etag=etag, body=body, encoded_bodies=encoded_bodies)
+
+    def representation(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """Returns body and ETag of representation with content `encoding`.
+
+        Every encoding has its own strong ETag.
+
+        Args:
+            encoding (Optional[str]): content encoding. If None returns identity.
+
+        Returns:
+            Tuple[bytes, str]: body and ETag
+        """
+
+        if encoding is None:
+            return self.body, self.etag
+
+        return self.encoded_bodies[encoding], f'{self.etag[:-1]}-{encoding}"'
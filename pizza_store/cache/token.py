@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from pizza_store import models
+
+
+class TokenCache:
+    """Bounded LRU cache of decoded access tokens of worker.
+
+    Keyed by raw token string, so a hit skips signature verification and
+    model validation. Entry is valid until `exp` of its token, then it is
+    dropped and token is decoded again, which rejects it as expired.
+    Only successfully decoded tokens are cached.
+
+    Dependencies which are not async run in threadpool, so access is locked.
+
+    Example:
+        >>> cache = TokenCache(maxsize=1024)
+        >>> cache.set(token, token_data)
+        >>> cache.get(token)  # until token_data.exp
+        Token(exp=..., iat=..., user=UserInToken(...))
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, models.Token]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[models.Token]:
+        """Returns decoded `token` if it is cached and not expired.
+
+        Args:
+            token (str): raw access token
+
+        Returns:
+            Optional[models.Token]
+        """
+
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+
+            expires_at, token_data = entry
+            if time.time() >= expires_at:
+                del self._entries[token]
+                return None
+
+            self._entries.move_to_end(token)
+            return token_data
+
+    def set(self, token: str, token_data: models.Token) -> None:
+        """Caches decoded `token` until its `exp`.
+
+        Least recently used entry is evicted if cache is full.
+
+        Args:
+            token (str): raw access token
+            token_data (models.Token): decoded and validated token
+        """
+
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[token] = (token_data.exp.timestamp(), token_data)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,21 @@
+from typing import Final
+
+# Postgres channel used to tell every worker that the catalog has changed
+CATALOG_CHANNEL: Final[str] = "catalog_changed"
+
+# Seconds to wait before reconnecting the catalog invalidation listener
+CATALOG_LISTENER_RECONNECT_DELAY: Final[float] = 1.0
+
+# Catalog cache keys
+PRODUCTS_CACHE_KEY: Final[str] = "products"
+CATEGORIES_CACHE_KEY: Final[str] = "categories"
+MENU_CACHE_KEY: Final[str] = "menu"
+AUTOCOMPLETE_CACHE_KEY: Final[str] = "autocomplete"
+
+# Catalog cache prefix of products cached by id
+PRODUCT_CACHE_PREFIX: Final[str] = "product"
+
+# Compression of rendered catalog bodies. Bodies are compressed once
+# per catalog version, so max levels are used.
+GZIP_COMPRESS_LEVEL: Final[int] = 9
+BROTLI_QUALITY: Final[int] = 11
@@ -0,0 +1,39 @@
+from typing import Final, FrozenSet
+
+# Requests with these methods do not write, so they are served by replica
+SAFE_METHODS: Final[FrozenSet[str]] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Cookie with unix time until which client reads from primary after its write
+PRIMARY_UNTIL_COOKIE: Final[str] = "primary_until"
+
+# Postgres advisory lock held while schema is migrated,
+# so app servers starting at the same time migrate one by one
+MIGRATION_LOCK_ID: Final[int] = 7_301_001
+
+# Largest value of integer column, greater parameters overflow int4 in query
+MAX_SERIAL_ID: Final[int] = 2**31 - 1
+
+# Migration of schema which `Base.metadata.create_all` created before migrations
+BASELINE_REVISION: Final[str] = "0001"
+
+# Refresh tokens are range partitioned by their uuid7 token, one partition
+# per UTC day of token creation, e.g. refresh_tokens_20261018. Tokens outside
+# of every range, like uuid4 ones issued before partitioning, are in default one.
+REFRESH_TOKEN_PARTITION_PREFIX: Final[str] = "refresh_tokens_"
+REFRESH_TOKEN_DEFAULT_PARTITION: Final[str] = "refresh_tokens_default"
+
+# Days refresh token partitions are created ahead, so maintenance may skip
+# runs without new tokens falling into default partition
+REFRESH_TOKEN_PARTITIONS_AHEAD: Final[int] = 7
+
+# Milliseconds maintenance waits for locks on refresh_tokens to create or detach
+# partition. Waiting maintenance blocks every sign in and refresh queued behind
+# it, so it gives up soon and the partition is handled on next run.
+REFRESH_TOKEN_PARTITION_LOCK_TIMEOUT: Final[int] = 500
+
+# Functions without side effects called by reads of the app. Slow SELECT calling
+# any other function is explained without ANALYZE, which would execute it again,
+# e.g. pg_notify would send one more notification.
+SQL_READ_ONLY_FUNCTIONS: Final[FrozenSet[str]] = frozenset(
+    {"coalesce", "count", "lower", "similarity", "unnest"}
+)
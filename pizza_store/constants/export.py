@@ -0,0 +1,20 @@
+from typing import Dict, Final, Tuple
+
+from pizza_store.enums.catalog_format import CatalogFormat
+
+# Rows fetched from server side cursor per round trip while exporting
+EXPORT_FETCH_SIZE: Final[int] = 1000
+
+EXPORT_MEDIA_TYPES: Final[Dict[CatalogFormat, str]] = {
+    CatalogFormat.NDJSON: "application/x-ndjson",
+    CatalogFormat.CSV: "text/csv",
+}
+
+PRODUCT_EXPORT_FIELDS: Final[Tuple[str, ...]] = (
+    "id",
+    "category_id",
+    "name",
+    "weight",
+    "price",
+    "image",
+)
@@ -0,0 +1,18 @@
+from typing import Final
+
+# Number of latest queue wait times password hashing metrics are computed from
+PASSWORD_HASH_WAIT_SAMPLES: Final[int] = 1_000
+
+# Seconds after which client should retry when password hashing queue is full
+PASSWORD_HASH_RETRY_AFTER: Final[int] = 1
+
+# Per hash latency which calibration picks password hashing cost for
+PASSWORD_HASH_TARGET_MS: Final[float] = 250.0
+
+# Hashes measured per calibrated cost, fastest one is taken
+CALIBRATION_REPEAT: Final[int] = 3
+
+# Calibration bounds, bcrypt below 10 rounds is too weak
+CALIBRATION_MIN_BCRYPT_ROUNDS: Final[int] = 10
+CALIBRATION_MAX_BCRYPT_ROUNDS: Final[int] = 31
+CALIBRATION_MAX_ARGON2_TIME_COST: Final[int] = 100
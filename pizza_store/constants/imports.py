@@ -0,0 +1,4 @@
+from typing import Final
+
+# Max amount of rows in product import manifest
+IMPORT_MAX_ROWS: Final[int] = 10_000
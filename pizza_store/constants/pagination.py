@@ -0,0 +1,22 @@
+from typing import Dict, Final, Tuple
+
+from pizza_store.constants.db import MAX_SERIAL_ID
+from pizza_store.enums.sort import ProductSort
+
+# Page size for paginated endpoints when client does not pass limit
+DEFAULT_PAGE_LIMIT: Final[int] = 50
+MAX_PAGE_LIMIT: Final[int] = 100
+
+# Product fields which define keyset order for each sort.
+# Last field is unique, so order is stable.
+PRODUCT_SORT_KEYS: Final[Dict[ProductSort, Tuple[str, ...]]] = {
+    ProductSort.ID: ("id",),
+    ProductSort.PRICE: ("price", "id"),
+    ProductSort.NAME: ("name",),
+}
+
+# Bounds of integer sort key fields, cursor values out of them overflow int4
+PRODUCT_SORT_KEY_RANGES: Final[Dict[str, Tuple[int, int]]] = {
+    "id": (1, MAX_SERIAL_ID),
+    "price": (0, MAX_SERIAL_ID),
+}
@@ -1,6 +1,10 @@
 from typing import Dict, Final, FrozenSet
 
-from pizza_store.enums.permissions import CategoryPermission, ProductPermission
+from pizza_store.enums.permissions import (
+    CategoryPermission,
+    MetricsPermission,
+    ProductPermission,
+)
 from pizza_store.enums.role import Role
 
 ROLES: Final[Dict[Role, FrozenSet[str]]] = {
@@ -15,6 +19,7 @@ ROLES: Final[Dict[Role, FrozenSet[str]]] = {
             CategoryPermission.READ,
             CategoryPermission.UPDATE,
             CategoryPermission.DELETE,
+            MetricsPermission.READ,
         }
     ),
 }
@@ -0,0 +1,5 @@
+from typing import Final
+
+# Max amount of products returned by search and autocomplete
+SEARCH_LIMIT: Final[int] = 20
+AUTOCOMPLETE_LIMIT: Final[int] = 10
@@ -1,8 +1,12 @@
 from typing import Optional
 
 from pizza_store.db.models.category import Category
-from sqlalchemy import delete, select
+from sqlalchemy import delete, lambda_stmt, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+category_table = Category.__table__
 
 
 class CategoryCRUD:
@@ -35,30 +39,57 @@ class CategoryCRUD:
             Optional[Category]: if None category does not exist
         """
 
-        stmt = select(Category).where(Category.id == id)
+        stmt = lambda_stmt(lambda: select(Category).where(Category.id == id))
         result = await session.execute(stmt)
         return result.scalars().first()
 
     @classmethod
-    async def get_categories(cls, session: AsyncSession) -> list[Category]:
+    async def get_categories(cls, session: AsyncSession) -> list[Row]:
         """Fetchs categories.
 
         Example:
             >>> crud = CategoryCRUD()
             >>> categories = await crud.get_categories(session)
             >>> print(categories)
-            [Category(id=1, name="Drinks), Category(id=2, name="Pizzas")]
+            [(1, "Drinks"), (2, "Pizzas")]
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+
+        Returns:
+            list[Row]: list of category rows.
+        """
+
+        stmt = lambda_stmt(lambda: select(category_table))
+        result = await session.execute(stmt)
+        return result.all()
+
+    @classmethod
+    async def get_categories_with_products(
+        cls, session: AsyncSession
+    ) -> list[Category]:
+        """Fetches categories with loaded products in single query.
+
+        Example:
+            >>> crud = CategoryCRUD()
+            >>> categories = await crud.get_categories_with_products(session)
+            >>> print(categories[0].products)
+            [Product(id=1, category_id=1, name="Tea", weight: 100, price=5_000, image="tea.jpg")]
 
         Args:
             session (AsyncSession): sqlalchemy session
 
         Returns:
-            list[Category]: list of categories.
+            list[Category]: list of categories ordered by id.
         """
 
-        stmt = select(Category)
+        stmt = (
+            select(Category)
+            .options(joinedload(Category.products))
+            .order_by(Category.id)
+        )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return result.unique().scalars().all()
 
     @classmethod
     def add_category(cls, session: AsyncSession, name: str) -> Category:
@@ -1,6 +1,7 @@
 from typing import Optional, Protocol
 
 from pizza_store.db.models.category import Category
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -35,20 +36,33 @@ class ICategoryCRUD(Protocol):
         """
 
     @classmethod
-    async def get_categories(cls, session: AsyncSession) -> list[Category]:
+    async def get_categories(cls, session: AsyncSession) -> list[Row]:
         """Fetchs categories.
 
         Example:
             >>> crud = CategoryCRUD()
             >>> categories = await crud.get_categories(session)
             >>> print(categories)
-            [Category(id=1, name="Drinks), Category(id=2, name="Pizzas")]
+            [(1, "Drinks"), (2, "Pizzas")]
 
         Args:
             session (AsyncSession): sqlalchemy session
 
         Returns:
-            list[Category]: list of categories.
+            list[Row]: list of category rows.
+        """
+
+    @classmethod
+    async def get_categories_with_products(
+        cls, session: AsyncSession
+    ) -> list[Category]:
+        """Fetches categories with loaded products in single query.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+
+        Returns:
+            list[Category]: list of categories ordered by id.
         """
 
     @classmethod
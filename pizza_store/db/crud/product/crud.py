@@ -1,9 +1,29 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence
 
+from pizza_store.constants.pagination import PRODUCT_SORT_KEYS
+from pizza_store.db.models.category import Category
 from pizza_store.db.models.product import Product
-from sqlalchemy import delete, select
+from pizza_store.enums.sort import ProductSort
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    cast,
+    delete,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Reads select table columns with Core, so rows are returned
+# without building ORM instances
+product_table = Product.__table__
+
 
 class ProductCRUD:
     """Has methods for getting, adding, deleting products from db.
@@ -56,6 +76,66 @@ class ProductCRUD:
 
         return product
 
+    @classmethod
+    async def add_products(
+        cls, session: AsyncSession, products: Sequence[Mapping[str, Any]]
+    ) -> list[Row]:
+        """Inserts products with single statement.
+
+        Products which name already exists or which category does not exist
+        are skipped. Rows are sent as one array per column, so statement has
+        the same five parameters whatever amount of products.
+
+        NOTE: Does not commit.
+
+        Example:
+            >>> crud = ProductCRUD()
+            >>> rows = await crud.add_products(
+            ...     session,
+            ...     [{"category_id": 1, "name": "Tea", "weight": 100, "price": 5_000, "image": "tea.jpg"}],
+            ... )
+            >>> await session.commit()
+            >>> print(rows)
+            [(1, "Tea")]
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            products (Sequence[Mapping[str, Any]]): products with category_id, name, weight, price, image
+
+        Returns:
+            list[Row]: id and name of inserted products
+        """
+
+        column_types = {
+            "category_id": Integer,
+            "name": String,
+            "weight": Integer,
+            "price": Integer,
+            "image": String,
+        }
+        new_products = select(
+            *(
+                func.unnest(cast([p[column] for p in products], ARRAY(type_))).label(
+                    column
+                )
+                for column, type_ in column_types.items()
+            )
+        ).subquery("new_products")
+        stmt = (
+            insert(Product)
+            .from_select(
+                list(column_types),
+                select(new_products).where(
+                    new_products.c.category_id.in_(select(Category.id))
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=[Product.name])
+            .returning(Product.id, Product.name)
+        )
+        res = await session.execute(stmt)
+
+        return res.all()
+
     @classmethod
     async def get_product(cls, session: AsyncSession, id: int) -> Optional[Product]:
         """Fetchs product by id.
@@ -76,24 +156,57 @@ class ProductCRUD:
             Optional[Product]: if None product does not exist
         """
 
-        res = await session.execute(select(Product).where(Product.id == id))
+        res = await session.execute(
+            lambda_stmt(lambda: select(Product).where(Product.id == id))
+        )
         return res.scalars().first()
 
+    @classmethod
+    async def get_products_by_ids(
+        cls, session: AsyncSession, ids: Sequence[int]
+    ) -> list[Row]:
+        """Fetches products by ids.
+
+        Ids are passed as one array parameter, so statement is the same
+        whatever amount of ids.
+
+        Example:
+            >>> crud = ProductCRUD()
+            >>> products = await crud.get_products_by_ids(session, ids=[2, 1, 99])
+            >>> print(products)
+            [(1, 1, "Tea", 100, 5_000, "tea.jpg"),
+             (2, 1, "Coffee", 100, 5_000, "coffee.jpg")]
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            ids (Sequence[int]): product ids
+
+        Returns:
+            list[Row]: existing product rows in any order
+        """
+
+        res = await session.execute(
+            select(product_table).where(
+                product_table.c.id == any_(cast(list(ids), ARRAY(Integer)))
+            )
+        )
+        return res.all()
+
     @classmethod
     async def get_products(
         cls,
         session: AsyncSession,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-    ) -> list[Product]:
-        """Fetches products.
+    ) -> list[Row]:
+        """Fetches products ordered by id.
 
         Example:
         >>> crud = ProductCRUD()
         >>> products = await crud.get_products(session, limit=2)
         >>> print(products)
-        [Product(id=1, category_id=1, name="Tea", weight: 100, price=5_000, image="test.jpg"),
-         Product(id=2, category_id=1, name="Coffee", weight: 100, price=5_000, image="test.jpg")]
+        [(1, 1, "Tea", 100, 5_000, "test.jpg"),
+         (2, 1, "Coffee", 100, 5_000, "test.jpg")]
 
         Args:
             session (AsyncSession): sqlalchemy session
@@ -101,17 +214,155 @@ class ProductCRUD:
             offset (Optional[int]): products offset. If None offset is 0.
 
         Returns:
-            list[Product]: list of products.
+            list[Row]: list of product rows.
         """
 
-        stmt = select(Product)
+        # Ordered, so pages are stable and read from primary key index
+        stmt = lambda_stmt(lambda: select(product_table).order_by(product_table.c.id))
         if limit is not None:
-            stmt = stmt.limit(limit)
+            stmt += lambda s: s.limit(limit)
         if offset is not None:
-            stmt = stmt.offset(offset)
+            stmt += lambda s: s.offset(offset)
+        res = await session.execute(stmt)
+
+        return res.all()
+
+    @classmethod
+    async def get_products_page(
+        cls,
+        session: AsyncSession,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        sort: ProductSort = ProductSort.ID,
+        category_id: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> list[Row]:
+        """Fetches filtered page of products ordered by `sort` key.
+
+        Uses keyset pagination: seeks index to `after` sort key,
+        so every page costs the same as the first one.
+        Sort keys are defined in `PRODUCT_SORT_KEYS`.
+
+        Example:
+            >>> crud = ProductCRUD()
+            >>> products = await crud.get_products_page(
+            ...     session, limit=2, after=[5_000, 1], sort=ProductSort.PRICE, category_id=1
+            ... )
+            >>> print(products)
+            [(2, 1, "Coffee", 100, 5_000, "coffee.jpg"),
+             (3, 1, "Juice", 200, 6_000, "juice.jpg")]
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            limit (int): max amount of products
+            after (Optional[Sequence[Any]]): sort key of last product of previous page.
+                If None returns first page.
+            sort (ProductSort): sort key
+            category_id (Optional[int]): if not None returns only products of category
+            min_price (Optional[int]): min price in cents inclusive
+            max_price (Optional[int]): max price in cents inclusive
+
+        Returns:
+            list[Row]: list of product rows.
+        """
+
+        columns = product_table.c
+        key = [columns[field] for field in PRODUCT_SORT_KEYS[sort]]
+
+        stmt = select(product_table)
+        if category_id is not None:
+            stmt = stmt.where(columns.category_id == category_id)
+        if min_price is not None:
+            stmt = stmt.where(columns.price >= min_price)
+        if max_price is not None:
+            stmt = stmt.where(columns.price <= max_price)
+        if after is not None:
+            if len(key) == 1:
+                stmt = stmt.where(key[0] > after[0])
+            else:
+                stmt = stmt.where(tuple_(*key) > tuple_(*after))
+        stmt = stmt.order_by(*key).limit(limit)
+        res = await session.execute(stmt)
+
+        return res.all()
+
+    @classmethod
+    async def stream_products(
+        cls, session: AsyncSession, fetch_size: int
+    ) -> AsyncIterator[list[Row]]:
+        """Streams all products ordered by id through server side cursor.
+
+        Only `fetch_size` rows are held in memory at once.
+
+        Example:
+            >>> crud = ProductCRUD()
+            >>> async for rows in crud.stream_products(session, fetch_size=2):
+            ...     print(rows)
+            [(1, 1, "Tea", 100, 5_000, "tea.jpg"), (2, 1, "Coffee", 100, 5_000, "coffee.jpg")]
+            [(3, 1, "Juice", 200, 4_000, "juice.jpg")]
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            fetch_size (int): rows fetched per round trip
+
+        Yields:
+            list[Row]: batch of product rows with id, category_id, name, weight, price, image
+        """
+
+        stmt = (
+            select(
+                Product.id,
+                Product.category_id,
+                Product.name,
+                Product.weight,
+                Product.price,
+                Product.image,
+            )
+            .order_by(Product.id)
+            .execution_options(yield_per=fetch_size)
+        )
+        result = await session.stream(stmt)
+        async for rows in result.partitions(fetch_size):
+            yield rows
+
+    @classmethod
+    async def search_products(
+        cls, session: AsyncSession, query: str, limit: int
+    ) -> list[Row]:
+        """Fetches products which names fuzzy match `query`.
+
+        Name matches if it contains `query` or is similar to it by trigrams.
+        Both conditions use trigram GIN index on name.
+
+        Example:
+            >>> crud = ProductCRUD()
+            >>> products = await crud.search_products(session, query="peperoni", limit=10)
+            >>> print(products)
+            [(1, 1, "Pepperoni", 500, 10_000, "pepperoni.jpg")]
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            query (str): search query
+            limit (int): max amount of products
+
+        Returns:
+            list[Row]: list of product rows, most similar first.
+        """
+
+        pattern = "%{}%".format(
+            query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        columns = product_table.c
+        stmt = (
+            select(product_table)
+            .where(or_(columns.name.ilike(pattern), columns.name.op("%")(query)))
+            .order_by(func.similarity(columns.name, query).desc(), columns.id)
+            .limit(limit)
+        )
         res = await session.execute(stmt)
 
-        return res.scalars().all()
+        return res.all()
 
     @classmethod
     async def delete_product(cls, session: AsyncSession, id: int) -> None:
@@ -1,12 +1,33 @@
-from typing import Optional, Protocol
+from typing import Any, AsyncIterator, Mapping, Optional, Protocol, Sequence
 
 from pizza_store.db.models.product import Product
+from pizza_store.enums.sort import ProductSort
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class IProductCRUD(Protocol):
     """Has methods for getting, adding, deleting products from db."""
 
+    @classmethod
+    async def add_products(
+        cls, session: AsyncSession, products: Sequence[Mapping[str, Any]]
+    ) -> list[Row]:
+        """Inserts products with single statement.
+
+        Products which name already exists or which category does not exist
+        are skipped.
+
+        NOTE: Does not commit.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            products (Sequence[Mapping[str, Any]]): products with category_id, name, weight, price, image
+
+        Returns:
+            list[Row]: id and name of inserted products
+        """
+
     @classmethod
     async def get_product(cls, session: AsyncSession, id: int) -> Optional[Product]:
         """Fetchs product by id.
@@ -19,13 +40,27 @@ class IProductCRUD(Protocol):
             Optional[Product]: if None product does not exist
         """
 
+    @classmethod
+    async def get_products_by_ids(
+        cls, session: AsyncSession, ids: Sequence[int]
+    ) -> list[Row]:
+        """Fetches products by ids.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            ids (Sequence[int]): product ids
+
+        Returns:
+            list[Row]: existing product rows in any order
+        """
+
     @classmethod
     async def get_products(
         cls,
         session: AsyncSession,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-    ) -> list[Product]:
+    ) -> list[Row]:
         """Fetchs products.
 
         Args:
@@ -34,7 +69,63 @@ class IProductCRUD(Protocol):
             offset (Optional[int]): products offset. If None offset is 0.
 
         Returns:
-            list[Product]: list of products.
+            list[Row]: list of product rows.
+        """
+
+    @classmethod
+    async def get_products_page(
+        cls,
+        session: AsyncSession,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        sort: ProductSort = ProductSort.ID,
+        category_id: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> list[Row]:
+        """Fetches filtered page of products ordered by `sort` key.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            limit (int): max amount of products
+            after (Optional[Sequence[Any]]): sort key of last product of previous page.
+                If None returns first page.
+            sort (ProductSort): sort key
+            category_id (Optional[int]): if not None returns only products of category
+            min_price (Optional[int]): min price in cents inclusive
+            max_price (Optional[int]): max price in cents inclusive
+
+        Returns:
+            list[Row]: list of product rows.
+        """
+
+    @classmethod
+    def stream_products(
+        cls, session: AsyncSession, fetch_size: int
+    ) -> AsyncIterator[list[Row]]:
+        """Streams all products ordered by id through server side cursor.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            fetch_size (int): rows fetched per round trip
+
+        Yields:
+            list[Row]: batch of product rows with id, category_id, name, weight, price, image
+        """
+
+    @classmethod
+    async def search_products(
+        cls, session: AsyncSession, query: str, limit: int
+    ) -> list[Row]:
+        """Fetches products which names fuzzy match `query`.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            query (str): search query
+            limit (int): max amount of products
+
+        Returns:
+            list[Row]: list of product rows, most similar first.
         """
 
     @classmethod
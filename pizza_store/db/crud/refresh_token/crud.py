@@ -1,14 +1,25 @@
 import datetime
 import uuid
-from typing import Optional
+from typing import Final, Optional
 
-from pizza_store.db.models import RefreshToken
-from sqlalchemy import delete, select
+from pizza_store.constants.db import REFRESH_TOKEN_DEFAULT_PARTITION
+from pizza_store.db.models import RefreshToken, User
+from sqlalchemy import DateTime, column, delete, lambda_stmt, literal, select, table
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+refresh_token_table = RefreshToken.__table__
+user_table = User.__table__
+default_partition_table = table(
+    REFRESH_TOKEN_DEFAULT_PARTITION, column("expires_at", DateTime)
+)
+
+USER_AGENT_LENGTH: Final[int] = refresh_token_table.c.user_agent.type.length
+
 
 class RefreshTokenCRUD:
-    """Has methods for getting, adding, deleting refresh tokens from db."""
+    """Has methods for getting, adding, rotating, deleting refresh tokens from db."""
 
     @classmethod
     async def get_refresh_token(
@@ -29,7 +40,9 @@ class RefreshTokenCRUD:
             Optional[RefreshToken]: if None refresh token does not exist
         """
 
-        stmt = select(RefreshToken).where(RefreshToken.token == token)
+        stmt = lambda_stmt(
+            lambda: select(RefreshToken).where(RefreshToken.token == token)
+        )
         res = await session.execute(stmt)
 
         return res.scalars().first()
@@ -74,11 +87,156 @@ class RefreshTokenCRUD:
 
         return refresh_token
 
+    @classmethod
+    async def issue_refresh_token(
+        cls,
+        session: AsyncSession,
+        user_id: uuid.UUID,
+        token: uuid.UUID,
+        expires_at: datetime.datetime,
+        user_agent: Optional[str],
+        ip_address: Optional[str],
+        limit: int,
+    ) -> None:
+        """Adds refresh token of user device and revokes tokens over `limit`.
+
+        Single statement: insert in CTE and delete of user tokens except
+        `limit - 1` latest expiring ones. Expiration is renewed on every
+        rotation, so the least recently refreshed devices are signed out.
+
+        NOTE: Does not commit.
+
+        Example:
+            >>> await RefreshTokenCRUD.issue_refresh_token(
+                session,
+                user_id=uuid.UUID("x-x-x-x-x"),
+                token=uuid.UUID("x-x-x-x-x"),
+                expires_at=datetime.datetime(2021, 12, 12, 15),
+                user_agent="Mozilla/5.0",
+                ip_address="127.0.0.1",
+                limit=5,
+                )
+            >>> await session.commit()
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            user_id (uuid.UUID)
+            token (uuid.UUID)
+            expires_at (datetime.datetime): expiration datetime
+            user_agent (Optional[str]): user agent of device, truncated to column length
+            ip_address (Optional[str]): ip address of device
+            limit (int): max tokens of user
+        """
+
+        inserted = (
+            insert(refresh_token_table)
+            .values(
+                user_id=user_id,
+                token=token,
+                expires_at=expires_at,
+                user_agent=user_agent[:USER_AGENT_LENGTH] if user_agent else None,
+                ip_address=ip_address,
+            )
+            .cte("inserted")
+        )
+        # Inserted token is not visible to the other statement of the same query
+        kept = (
+            select(refresh_token_table.c.token)
+            .where(refresh_token_table.c.user_id == user_id)
+            .order_by(refresh_token_table.c.expires_at.desc())
+            .limit(limit - 1)
+        )
+        stmt = (
+            delete(refresh_token_table)
+            .where(
+                refresh_token_table.c.user_id == user_id,
+                refresh_token_table.c.token.not_in(kept),
+            )
+            .add_cte(inserted)
+        )
+        await session.execute(stmt)
+
+    @classmethod
+    async def rotate_refresh_token(
+        cls,
+        session: AsyncSession,
+        token: uuid.UUID,
+        new_token: uuid.UUID,
+        expires_at: datetime.datetime,
+        now: datetime.datetime,
+    ) -> Optional[Row]:
+        """Replaces refresh `token` unexpired at `now` with `new_token` and returns its user.
+
+        Single statement: delete of token, insert of new one with the same
+        device metadata and select of user are chained by CTEs. Token is
+        deleted, not updated, since new token belongs to other partition.
+        Concurrent rotations of the same token wait for row lock, then
+        row is gone, so only the first one succeeds.
+
+        NOTE: Does not commit.
+
+        Example:
+            >>> user = await RefreshTokenCRUD.rotate_refresh_token(
+                session,
+                token=uuid.UUID("x-x-x-x-x"),
+                new_token=uuid.UUID("x-x-x-x-x"),
+                expires_at=datetime.datetime(2021, 12, 12, 15),
+                now=datetime.datetime.utcnow(),
+                )
+            >>> await session.commit()
+            >>> user
+            User(id=uuid.UUID("x-x-x-x-x"), username="john", email="test@example.com", password_hash="hash", role="user")
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            token (uuid.UUID): current refresh token
+            new_token (uuid.UUID)
+            expires_at (datetime.datetime): expiration datetime of new token
+            now (datetime.datetime): naive utc datetime
+
+        Returns:
+            Optional[Row]: user row. If None token does not exist or is expired.
+        """
+
+        metadata_columns = [
+            refresh_token_table.c.user_id,
+            refresh_token_table.c.signed_in_at,
+            refresh_token_table.c.user_agent,
+            refresh_token_table.c.ip_address,
+        ]
+        deleted = (
+            delete(refresh_token_table)
+            .where(
+                refresh_token_table.c.token == token,
+                refresh_token_table.c.expires_at > now,
+            )
+            .returning(*metadata_columns)
+            .cte("deleted")
+        )
+        inserted = (
+            insert(refresh_token_table)
+            .from_select(
+                ["token", "expires_at", *(column.name for column in metadata_columns)],
+                select(
+                    literal(new_token, refresh_token_table.c.token.type),
+                    literal(expires_at, refresh_token_table.c.expires_at.type),
+                    *(deleted.c[column.name] for column in metadata_columns),
+                ),
+            )
+            .returning(refresh_token_table.c.user_id)
+            .cte("inserted")
+        )
+        res = await session.execute(
+            select(user_table).join(inserted, user_table.c.id == inserted.c.user_id)
+        )
+
+        return res.first()
+
     @classmethod
     async def delete_refresh_token(
         cls, session: AsyncSession, user_id: uuid.UUID
     ) -> None:
-        """Deletes refresh token by user id.
+        """Deletes refresh tokens of every device of user.
 
         NOTE: Does not commit.
 
@@ -87,5 +245,40 @@ class RefreshTokenCRUD:
             user_id (uuid.UUID)
         """
 
-        stmt = delete(RefreshToken).where(RefreshToken.user_id == user_id)
+        stmt = lambda_stmt(
+            lambda: delete(RefreshToken).where(RefreshToken.user_id == user_id)
+        )
         await session.execute(stmt)
+
+    @classmethod
+    async def delete_expired_refresh_tokens(
+        cls, session: AsyncSession, now: datetime.datetime
+    ) -> int:
+        """Deletes refresh tokens of default partition which expired before `now`.
+
+        Expired tokens of range partitions are dropped with whole partition
+        by maintenance, only tokens outside of every range are deleted by rows.
+
+        NOTE: Does not commit.
+
+        Example:
+            >>> deleted = await RefreshTokenCRUD.delete_expired_refresh_tokens(session, now=datetime.datetime.utcnow())
+            >>> await session.commit()
+            >>> deleted
+            42
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            now (datetime.datetime): naive utc datetime
+
+        Returns:
+            int: number of deleted tokens
+        """
+
+        res = await session.execute(
+            delete(default_partition_table).where(
+                default_partition_table.c.expires_at < now
+            )
+        )
+
+        return res.rowcount
@@ -3,11 +3,12 @@ import uuid
 from typing import Optional, Protocol
 
 from pizza_store.db.models import RefreshToken
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class IRefreshTokenCRUD(Protocol):
-    """Has methods for getting, adding, deleting refresh tokens from db."""
+    """Has methods for getting, adding, rotating, deleting refresh tokens from db."""
 
     @classmethod
     async def get_refresh_token(
@@ -45,11 +46,70 @@ class IRefreshTokenCRUD(Protocol):
             RefreshToken: token model
         """
 
+    @classmethod
+    async def issue_refresh_token(
+        cls,
+        session: AsyncSession,
+        user_id: uuid.UUID,
+        token: uuid.UUID,
+        expires_at: datetime.datetime,
+        user_agent: Optional[str],
+        ip_address: Optional[str],
+        limit: int,
+    ) -> None:
+        """Adds refresh token of user device and revokes tokens over `limit`.
+
+        Single statement: insert in CTE and delete of user tokens except
+        `limit - 1` latest expiring ones. Expiration is renewed on every
+        rotation, so the least recently refreshed devices are signed out.
+
+        NOTE: Does not commit.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            user_id (uuid.UUID)
+            token (uuid.UUID)
+            expires_at (datetime.datetime): expiration datetime
+            user_agent (Optional[str]): user agent of device, truncated to column length
+            ip_address (Optional[str]): ip address of device
+            limit (int): max tokens of user
+        """
+
+    @classmethod
+    async def rotate_refresh_token(
+        cls,
+        session: AsyncSession,
+        token: uuid.UUID,
+        new_token: uuid.UUID,
+        expires_at: datetime.datetime,
+        now: datetime.datetime,
+    ) -> Optional[Row]:
+        """Replaces refresh `token` unexpired at `now` with `new_token` and returns its user.
+
+        Single statement: delete of token, insert of new one with the same
+        device metadata and select of user are chained by CTEs. Token is
+        deleted, not updated, since new token belongs to other partition.
+        Concurrent rotations of the same token wait for row lock, then
+        row is gone, so only the first one succeeds.
+
+        NOTE: Does not commit.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            token (uuid.UUID): current refresh token
+            new_token (uuid.UUID)
+            expires_at (datetime.datetime): expiration datetime of new token
+            now (datetime.datetime): naive utc datetime
+
+        Returns:
+            Optional[Row]: user row. If None token does not exist or is expired.
+        """
+
     @classmethod
     async def delete_refresh_token(
         cls, session: AsyncSession, user_id: uuid.UUID
     ) -> None:
-        """Deletes refresh token by user id.
+        """Deletes refresh tokens of every device of user.
 
         NOTE: Does not commit.
 
@@ -57,3 +117,22 @@ class IRefreshTokenCRUD(Protocol):
             session (AsyncSession): sqlalchemy session
             user_id (uuid.UUID)
         """
+
+    @classmethod
+    async def delete_expired_refresh_tokens(
+        cls, session: AsyncSession, now: datetime.datetime
+    ) -> int:
+        """Deletes refresh tokens of default partition which expired before `now`.
+
+        Expired tokens of range partitions are dropped with whole partition
+        by maintenance, only tokens outside of every range are deleted by rows.
+
+        NOTE: Does not commit.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+            now (datetime.datetime): naive utc datetime
+
+        Returns:
+            int: number of deleted tokens
+        """
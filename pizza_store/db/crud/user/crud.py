@@ -2,13 +2,16 @@ import uuid
 from typing import Optional
 
 from pizza_store.db.models.user import User
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import delete
 
+user_table = User.__table__
+
 
 class UserCRUD:
-    """Has methods for getting, adding, deleting users from db.
+    """Has methods for getting, adding, updating, deleting users from db.
 
     Example:
         >>> crud = UserCRUD()
@@ -57,7 +60,7 @@ class UserCRUD:
         return user
 
     @classmethod
-    async def get_user(cls, session: AsyncSession, id: uuid.UUID) -> Optional[User]:
+    async def get_user(cls, session: AsyncSession, id: uuid.UUID) -> Optional[Row]:
         """Fetch user by `id`.
 
         Example:
@@ -71,16 +74,18 @@ class UserCRUD:
             id (uuid.UUID): user id
 
         Returns:
-            User
+            Optional[Row]: user row. If None user does not exist.
         """
 
-        res = await session.execute(select(User).where(User.id == id))
-        return res.scalars().first()
+        res = await session.execute(
+            lambda_stmt(lambda: select(user_table).where(user_table.c.id == id))
+        )
+        return res.first()
 
     @classmethod
     async def get_user_by_name(
         cls, session: AsyncSession, username: str
-    ) -> Optional[User]:
+    ) -> Optional[Row]:
         """Fetches user by `username`.
 
         Example:
@@ -94,17 +99,21 @@ class UserCRUD:
             username (str)
 
         Returns:
-            User
+            Optional[Row]: user row. If None user does not exist.
         """
 
-        res = await session.execute(select(User).where(User.username == username))
-        return res.scalars().first()
+        res = await session.execute(
+            lambda_stmt(
+                lambda: select(user_table).where(user_table.c.username == username)
+            )
+        )
+        return res.first()
 
     @classmethod
     async def get_user_by_email(
         cls, session: AsyncSession, email: str
-    ) -> Optional[User]:
-        """Fetches user by `email`.
+    ) -> Optional[Row]:
+        """Fetches user by `email` case-insensitively.
 
         Example:
             >>> crud = UserCRUD()
@@ -117,11 +126,43 @@ class UserCRUD:
             email (str)
 
         Returns:
-            User
+            Optional[Row]: user row. If None user does not exist.
         """
 
-        res = await session.execute(select(User).where(User.email == email))
-        return res.scalars().first()
+        res = await session.execute(
+            lambda_stmt(
+                lambda: select(user_table).where(
+                    func.lower(user_table.c.email) == func.lower(email)
+                )
+            )
+        )
+        return res.first()
+
+    @classmethod
+    async def update_password_hash(
+        cls, session: AsyncSession, id: uuid.UUID, password_hash: str
+    ) -> None:
+        """Replaces password hash of user with `id`.
+
+        NOTE: Does not commit.
+
+        Example:
+            >>> crud = UserCRUD()
+            >>> await crud.update_password_hash(session, id=uuid.UUID("x-x-x-x-x"), password_hash="hash")
+
+        Args:
+            session (AsyncSession)
+            id (uuid.UUID): user id
+            password_hash (str)
+        """
+
+        await session.execute(
+            lambda_stmt(
+                lambda: update(user_table)
+                .where(user_table.c.id == id)
+                .values(password_hash=password_hash)
+            )
+        )
 
     @classmethod
     async def delete_user(cls, session: AsyncSession, id: uuid.UUID) -> None:
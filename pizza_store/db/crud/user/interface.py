@@ -2,11 +2,12 @@ import uuid
 from typing import Optional, Protocol
 
 from pizza_store.db.models.user import User
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class IUserCRUD(Protocol):
-    """Has methods for getting, adding, deleting users from db."""
+    """Has methods for getting, adding, updating, deleting users from db."""
 
     @classmethod
     def add_user(
@@ -33,7 +34,7 @@ class IUserCRUD(Protocol):
         """
 
     @classmethod
-    async def get_user(cls, session: AsyncSession, id: uuid.UUID) -> Optional[User]:
+    async def get_user(cls, session: AsyncSession, id: uuid.UUID) -> Optional[Row]:
         """Fetch user by `id`.
 
         Args:
@@ -41,13 +42,13 @@ class IUserCRUD(Protocol):
             id (uuid.UUID): user id
 
         Returns:
-            User
+            Optional[Row]: user row. If None user does not exist.
         """
 
     @classmethod
     async def get_user_by_name(
         cls, session: AsyncSession, username: str
-    ) -> Optional[User]:
+    ) -> Optional[Row]:
         """Fetches user by `username`.
 
         Args:
@@ -55,21 +56,35 @@ class IUserCRUD(Protocol):
             username (str)
 
         Returns:
-            User
+            Optional[Row]: user row. If None user does not exist.
         """
 
     @classmethod
     async def get_user_by_email(
         cls, session: AsyncSession, email: str
-    ) -> Optional[User]:
-        """Fetches user by `email`.
+    ) -> Optional[Row]:
+        """Fetches user by `email` case-insensitively.
 
         Args:
             session (AsyncSession)
             email (str)
 
         Returns:
-            User
+            Optional[Row]: user row. If None user does not exist.
+        """
+
+    @classmethod
+    async def update_password_hash(
+        cls, session: AsyncSession, id: uuid.UUID, password_hash: str
+    ) -> None:
+        """Replaces password hash of user with `id`.
+
+        NOTE: Does not commit.
+
+        Args:
+            session (AsyncSession)
+            id (uuid.UUID): user id
+            password_hash (str)
         """
 
     @classmethod
@@ -1,13 +1,53 @@
+from pizza_store.db.instrumentation import SQLInstrumentation
 from pizza_store.db.models import *
+from pizza_store.db.pool import get_worker_pool_size, get_workers_count
 from pizza_store.settings import settings
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-db_url = (
-    f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
+dsn = (
+    f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
     f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
 )
-engine = create_async_engine(db_url, echo=True)
+db_url = dsn.replace("postgresql://", "postgresql+asyncpg://", 1)
+# LISTEN does not work through PgBouncer transaction pooling,
+# so listener may need a direct connection to Postgres
+listen_dsn = settings.POSTGRES_LISTEN_DSN or dsn
+
+if settings.POSTGRES_PGBOUNCER:
+    # Server side prepared statements do not survive switching of
+    # server connections between transactions
+    connect_args = {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+else:
+    # Prepared statements are cached per connection by SQL text,
+    # so statements must render the same SQL for any parameter values
+    connect_args = {
+        "prepared_statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE
+    }
+
+# Every worker gets equal share of connection budget of each server
+workers_count = get_workers_count(settings.SERVER_WORKERS)
+pool_size = get_worker_pool_size(
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    budget=settings.POSTGRES_CONNECTION_BUDGET,
+    workers=workers_count,
+    # Catalog invalidation listener holds one more connection of every worker
+    reserved=0 if settings.POSTGRES_LISTEN_DSN else 1,
+)
+pool_options = {
+    "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+    "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+}
+
+engine = create_async_engine(
+    db_url,
+    echo=settings.SQL_ECHO,
+    connect_args=connect_args,
+    pool_size=pool_size.pool_size,
+    max_overflow=pool_size.max_overflow,
+    **pool_options,
+)
 async_session = sessionmaker(
     engine,
     autoflush=False,
@@ -16,7 +56,40 @@ async_session = sessionmaker(
     expire_on_commit=False,
 )
 
+# Reads go to replica if it is configured, otherwise to primary
+if settings.POSTGRES_REPLICA_DSN is not None:
+    replica_pool_size = get_worker_pool_size(
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        budget=settings.POSTGRES_CONNECTION_BUDGET,
+        workers=workers_count,
+    )
+    replica_engine = create_async_engine(
+        settings.POSTGRES_REPLICA_DSN.replace(
+            "postgresql://", "postgresql+asyncpg://", 1
+        ),
+        echo=settings.SQL_ECHO,
+        connect_args=connect_args,
+        pool_size=replica_pool_size.pool_size,
+        max_overflow=replica_pool_size.max_overflow,
+        **pool_options,
+    )
+    replica_async_session = sessionmaker(
+        replica_engine,
+        autoflush=False,
+        autocommit=False,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+else:
+    replica_engine = engine
+    replica_async_session = async_session
 
-async def init_models() -> None:
-    async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all)
+sql_instrumentation = SQLInstrumentation(
+    sample_rate=settings.SQL_SAMPLE_RATE,
+    slow_threshold=settings.SQL_SLOW_THRESHOLD,
+    explain_slow=settings.SQL_EXPLAIN_SLOW,
+)
+sql_instrumentation.instrument(engine)
+if replica_engine is not engine:
+    sql_instrumentation.instrument(replica_engine)
@@ -0,0 +1,167 @@
+import logging
+import random
+import re
+import time
+from typing import Any, Optional
+
+from pizza_store.constants.db import SQL_READ_ONLY_FUNCTIONS
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Keywords which are followed by parenthesis like function calls
+SQL_KEYWORDS = frozenset(
+    """all and any array as cast exists filter from in join lateral not on or
+    over row select using values where""".split()
+)
+
+FUNCTION_CALL_PATTERN = re.compile(r"\b([a-z_][a-z0-9_.]*)\s*\(", re.IGNORECASE)
+# Row locking clauses and SELECT INTO, which creates table
+WRITING_SELECT_PATTERN = re.compile(
+    r"\bFOR\s+(UPDATE|NO\s+KEY\s+UPDATE|SHARE|KEY\s+SHARE)\b|\bINTO\b", re.IGNORECASE
+)
+
+
+class SQLInstrumentation:
+    """Measures latency of every statement executed by engine.
+
+    Statements slower than `slow_threshold` seconds are always logged
+    with warning level, optionally with their plan. Only plain reads are
+    explained with `ANALYZE, BUFFERS`, which executes statement again.
+    Other statements are logged with info level with `sample_rate` probability.
+    Parameters are never logged, they can contain personal data.
+
+    Example:
+        >>> instrumentation = SQLInstrumentation(sample_rate=0.01, slow_threshold=0.5)
+        >>> instrumentation.instrument(engine)
+    """
+
+    def __init__(
+        self, sample_rate: float, slow_threshold: float, explain_slow: bool = False
+    ) -> None:
+        self._sample_rate = sample_rate
+        self._slow_threshold = slow_threshold
+        self._explain_slow = explain_slow
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Starts measuring statements of `engine`.
+
+        Args:
+            engine (AsyncEngine)
+        """
+
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        if context is not None:
+            context._sql_started_at = time.perf_counter()  # type: ignore
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        started_at = getattr(context, "_sql_started_at", None)
+        if started_at is None:
+            return
+        duration_ms = (time.perf_counter() - started_at) * 1000
+
+        if duration_ms >= self._slow_threshold * 1000:
+            plan = ""
+            if self._explain_slow and not executemany and self._is_select(statement):
+                analyze = self._is_plain_read(statement)
+                plan = "\n" + self._explain(conn, statement, parameters, analyze)
+            logger.warning("Slow statement %.1f ms: %s%s", duration_ms, statement, plan)
+        elif self._sample_rate > 0 and random.random() < self._sample_rate:
+            logger.info("Statement %.1f ms: %s", duration_ms, statement)
+
+    @staticmethod
+    def _is_select(statement: str) -> bool:
+        """Returns True if statement is SELECT, so it can be explained.
+
+        Args:
+            statement (str)
+
+        Returns:
+            bool
+        """
+
+        return statement.lstrip().upper().startswith("SELECT")
+
+    @staticmethod
+    def _is_plain_read(statement: str) -> bool:
+        """Returns True if SELECT has no side effects, so it can be analyzed.
+
+        EXPLAIN ANALYZE executes statement again, so it must not lock rows
+        or call functions which are not known to be read-only.
+
+        Args:
+            statement (str)
+
+        Returns:
+            bool
+        """
+
+        if WRITING_SELECT_PATTERN.search(statement):
+            return False
+
+        for name in FUNCTION_CALL_PATTERN.findall(statement):
+            name = name.lower()
+            if name not in SQL_KEYWORDS and name not in SQL_READ_ONLY_FUNCTIONS:
+                return False
+
+        return True
+
+    @staticmethod
+    def _explain(
+        conn: Connection, statement: str, parameters: Any, analyze: bool
+    ) -> str:
+        """Returns `EXPLAIN` plan of statement.
+
+        Uses new cursor inside savepoint, so failed EXPLAIN does not
+        abort transaction of request.
+
+        Args:
+            conn (Connection)
+            statement (str)
+            parameters (Any)
+            analyze (bool): if True statement is executed with `ANALYZE, BUFFERS`
+
+        Returns:
+            str: plan or error description
+        """
+
+        explain = "EXPLAIN (ANALYZE, BUFFERS)" if analyze else "EXPLAIN"
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT sql_explain")
+            try:
+                cursor.execute(f"{explain} {statement}", parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT sql_explain")
+                plan = f"EXPLAIN failed: {e!r}"
+            cursor.execute("RELEASE SAVEPOINT sql_explain")
+        except Exception as e:
+            plan = f"EXPLAIN failed: {e!r}"
+        finally:
+            cursor.close()
+
+        return plan
@@ -0,0 +1,279 @@
+import asyncio
+import datetime
+import logging
+import re
+from typing import List, Optional
+
+from pizza_store.constants.db import (
+    REFRESH_TOKEN_DEFAULT_PARTITION,
+    REFRESH_TOKEN_PARTITION_LOCK_TIMEOUT,
+    REFRESH_TOKEN_PARTITION_PREFIX,
+    REFRESH_TOKEN_PARTITIONS_AHEAD,
+)
+from pizza_store.db.crud import RefreshTokenCRUD
+from pizza_store.db.db import db_url
+from pizza_store.utils.ids import min_uuid7
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+# Postgres error code of lock timeout
+LOCK_NOT_AVAILABLE = "55P03"
+
+PARTITION_NAME_PATTERN = re.compile(
+    rf"^{REFRESH_TOKEN_PARTITION_PREFIX}(?P<day>\d{{8}})$"
+)
+
+
+def refresh_token_partition_name(day: datetime.date) -> str:
+    """Returns name of partition with refresh tokens created on `day`.
+
+    Example:
+        >>> refresh_token_partition_name(datetime.date(2026, 10, 18))
+        'refresh_tokens_20261018'
+
+    Args:
+        day (datetime.date): utc day
+
+    Returns:
+        str
+    """
+
+    return f"{REFRESH_TOKEN_PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def refresh_token_partition_day(name: str) -> Optional[datetime.date]:
+    """Returns day of refresh token partition `name`.
+
+    Args:
+        name (str)
+
+    Returns:
+        Optional[datetime.date]: None if it is not range partition, e.g. default one
+    """
+
+    match = PARTITION_NAME_PATTERN.match(name)
+    if match is None:
+        return None
+
+    return datetime.datetime.strptime(match["day"], "%Y%m%d").date()
+
+
+def _is_lock_timeout(error: exc.DBAPIError) -> bool:
+    """Returns whether statement failed because lock was not acquired in time."""
+
+    return getattr(error.orig, "sqlstate", None) == LOCK_NOT_AVAILABLE
+
+
+async def get_refresh_token_partition_days(engine: AsyncEngine) -> List[datetime.date]:
+    """Returns days of existing refresh token range partitions.
+
+    Args:
+        engine (AsyncEngine)
+
+    Returns:
+        List[datetime.date]: sorted days
+    """
+
+    async with engine.connect() as connection:
+        res = await connection.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'refresh_tokens'::regclass"
+            )
+        )
+        names = res.scalars().all()
+
+    return sorted(
+        day for day in map(refresh_token_partition_day, names) if day is not None
+    )
+
+
+async def create_refresh_token_partitions(
+    engine: AsyncEngine,
+    today: datetime.date,
+    ahead: int = REFRESH_TOKEN_PARTITIONS_AHEAD,
+) -> List[str]:
+    """Creates missing refresh token partitions from `today` for `ahead` days.
+
+    Tokens of partition day which are already in default partition are moved
+    to new partition before it is attached, otherwise attach fails. Default
+    partition is locked against writes before the move, so sign in can not
+    add token of that day between the move and attach. Every partition is
+    created in its own transaction, so locks are held briefly. Locks are
+    waited for `REFRESH_TOKEN_PARTITION_LOCK_TIMEOUT` only, so sign in does
+    not queue behind waiting maintenance, and partition which was not
+    created is created on next run.
+
+    Args:
+        engine (AsyncEngine)
+        today (datetime.date): utc day
+        ahead (int, optional): days after `today`
+
+    Returns:
+        List[str]: names of created partitions
+    """
+
+    existing = set(await get_refresh_token_partition_days(engine))
+    created = []
+    for offset in range(ahead + 1):
+        day = today + datetime.timedelta(days=offset)
+        if day in existing:
+            continue
+
+        name = refresh_token_partition_name(day)
+        start = datetime.datetime.combine(day, datetime.time())
+        lower = min_uuid7(start)
+        upper = min_uuid7(start + datetime.timedelta(days=1))
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(
+                    text(
+                        "SET LOCAL lock_timeout = "
+                        f"{REFRESH_TOKEN_PARTITION_LOCK_TIMEOUT}"
+                    )
+                )
+                await connection.execute(
+                    text(
+                        f"LOCK TABLE {REFRESH_TOKEN_DEFAULT_PARTITION} "
+                        "IN SHARE ROW EXCLUSIVE MODE"
+                    )
+                )
+                await connection.execute(
+                    text(
+                        f"CREATE TABLE {name} (LIKE refresh_tokens INCLUDING DEFAULTS)"
+                    )
+                )
+                await connection.execute(
+                    text(
+                        f"WITH moved AS (DELETE FROM {REFRESH_TOKEN_DEFAULT_PARTITION} "
+                        "WHERE token >= :lower AND token < :upper RETURNING *) "
+                        f"INSERT INTO {name} SELECT * FROM moved"
+                    ),
+                    {"lower": lower, "upper": upper},
+                )
+                # Indexes and foreign key of partitioned table are added on attach
+                await connection.execute(
+                    text(
+                        f"ALTER TABLE refresh_tokens ATTACH PARTITION {name} "
+                        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+                    )
+                )
+        except exc.DBAPIError as error:
+            if not _is_lock_timeout(error):
+                raise
+            logger.warning("Refresh tokens are in use, partition %s skipped", name)
+            continue
+        created.append(name)
+        logger.info("Created refresh token partition %s", name)
+
+    return created
+
+
+async def drop_expired_refresh_token_partitions(
+    engine: AsyncEngine, now: datetime.datetime
+) -> List[str]:
+    """Drops refresh token partitions of past days which have no unexpired tokens.
+
+    Tokens are never added to partitions of past days, so once the last
+    of them expires whole partition is dropped instead of deleting rows.
+
+    Detach takes exclusive lock on refresh_tokens, `DETACH CONCURRENTLY`
+    is not allowed while default partition exists. So lock is waited for
+    `REFRESH_TOKEN_PARTITION_LOCK_TIMEOUT` only, not behind long transactions,
+    and partition which was not detached is dropped on next run.
+
+    Args:
+        engine (AsyncEngine)
+        now (datetime.datetime): naive utc datetime
+
+    Returns:
+        List[str]: names of dropped partitions
+    """
+
+    dropped = []
+    for day in await get_refresh_token_partition_days(engine):
+        period_end = datetime.datetime.combine(day, datetime.time())
+        period_end += datetime.timedelta(days=1)
+        if period_end > now:
+            break
+
+        name = refresh_token_partition_name(day)
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(
+                    text(
+                        "SET LOCAL lock_timeout = "
+                        f"{REFRESH_TOKEN_PARTITION_LOCK_TIMEOUT}"
+                    )
+                )
+                res = await connection.execute(
+                    text(
+                        f"SELECT EXISTS (SELECT 1 FROM {name} WHERE expires_at > :now)"
+                    ),
+                    {"now": now},
+                )
+                if res.scalar():
+                    continue
+                await connection.execute(
+                    text(f"ALTER TABLE refresh_tokens DETACH PARTITION {name}")
+                )
+                await connection.execute(text(f"DROP TABLE {name}"))
+        except exc.DBAPIError as error:
+            if not _is_lock_timeout(error):
+                raise
+            logger.warning("Refresh token partition %s is in use, skipped", name)
+            continue
+        dropped.append(name)
+        logger.info("Dropped expired refresh token partition %s", name)
+
+    return dropped
+
+
+async def purge_expired_refresh_tokens(
+    engine: AsyncEngine, now: datetime.datetime
+) -> int:
+    """Deletes expired refresh tokens of default partition.
+
+    Args:
+        engine (AsyncEngine)
+        now (datetime.datetime): naive utc datetime
+
+    Returns:
+        int: number of deleted tokens
+    """
+
+    async with AsyncSession(bind=engine) as session:
+        deleted = await RefreshTokenCRUD.delete_expired_refresh_tokens(session, now=now)
+        await session.commit()
+
+    logger.info("Deleted %d expired refresh tokens", deleted)
+    return deleted
+
+
+async def maintain_refresh_tokens() -> None:
+    """Creates upcoming refresh token partitions and removes expired tokens.
+
+    Run periodically, at least once in `REFRESH_TOKEN_PARTITIONS_AHEAD` days,
+    e.g. daily from cron:
+        $ python -m pizza_store.db.maintenance
+
+    Uses dedicated connection, not pooled engines of application.
+    """
+
+    engine = create_async_engine(db_url, poolclass=NullPool)
+    now = datetime.datetime.utcnow()
+    try:
+        await create_refresh_token_partitions(engine, today=now.date())
+        await drop_expired_refresh_token_partitions(engine, now=now)
+        await purge_expired_refresh_tokens(engine, now=now)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(maintain_refresh_tokens())
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import Final
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from pizza_store.constants.db import BASELINE_REVISION, MIGRATION_LOCK_ID
+from pizza_store.db.db import db_url
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_PATH: Final[Path] = Path(__file__).parent / "migrations"
+
+
+def get_alembic_config() -> Config:
+    """Returns alembic config of application migrations.
+
+    Does not need alembic.ini, so it works from any working directory.
+
+    Returns:
+        Config
+    """
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_PATH))
+
+    return config
+
+
+async def upgrade_schema(engine: AsyncEngine) -> None:
+    """Migrates database schema to the latest revision.
+
+    Runs in one transaction under advisory lock. Database created by
+    `create_all` before migrations is stamped with baseline revision first.
+
+    NOTE: Run once before workers start, e.g. in gunicorn `on_starting` hook.
+
+    Example:
+        >>> await upgrade_schema(engine)
+
+    Args:
+        engine (AsyncEngine)
+    """
+
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID}
+        )
+        await connection.run_sync(_upgrade_schema)
+
+
+def _upgrade_schema(connection: Connection) -> None:
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+
+    inspector = inspect(connection)
+    if not inspector.has_table("alembic_version") and inspector.has_table("users"):
+        logger.info("Stamping existing schema with revision %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+
+    command.upgrade(config, "head")
+
+
+async def check_schema_version(engine: AsyncEngine) -> None:
+    """Checks that database schema is migrated to the latest revision.
+
+    Cheap enough for every worker startup: reads only version table.
+
+    Args:
+        engine (AsyncEngine)
+
+    Raises:
+        RuntimeError: schema is not migrated or is newer than application
+    """
+
+    async with engine.connect() as connection:
+        current = await connection.run_sync(
+            lambda sync_connection: MigrationContext.configure(
+                sync_connection
+            ).get_current_heads()
+        )
+
+    heads = ScriptDirectory.from_config(get_alembic_config()).get_heads()
+    if set(current) != set(heads):
+        raise RuntimeError(
+            f"Database schema revision {current} does not match application "
+            f"revision {heads}, run `python -m pizza_store.db.migrate`"
+        )
+
+
+async def run_migrations() -> None:
+    """Migrates application database on dedicated connection.
+
+    Pooled engines of application are not touched, so it is safe
+    to call in gunicorn master before workers fork.
+    """
+
+    engine = create_async_engine(db_url, poolclass=NullPool)
+    try:
+        await upgrade_schema(engine)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_migrations())
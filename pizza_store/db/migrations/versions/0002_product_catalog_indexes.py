@@ -0,0 +1,49 @@
+"""product catalog indexes
+
+Keyset pagination and fuzzy search indexes. Databases created by
+`Base.metadata.create_all` after these indexes were added to the model
+already have them, so they are created only if they do not exist.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:01:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_products_category_id_id "
+        "ON products (category_id, id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_products_category_id_price_id "
+        "ON products (category_id, price, id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_products_category_id_name "
+        "ON products (category_id, name)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_products_price_id ON products (price, id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_products_name_trgm "
+        "ON products USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_products_name_trgm", table_name="products")
+    op.drop_index("ix_products_price_id", table_name="products")
+    op.drop_index("ix_products_category_id_name", table_name="products")
+    op.drop_index("ix_products_category_id_price_id", table_name="products")
+    op.drop_index("ix_products_category_id_id", table_name="products")
@@ -0,0 +1,91 @@
+"""partitioned refresh tokens
+
+Several refresh tokens per user with device metadata. Table is range
+partitioned by token, range partitions are created by maintenance.
+Existing tokens are copied to default partition, so nobody is signed out.
+Downgrade keeps the latest expiring token of every user.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.rename_table("refresh_tokens", "refresh_tokens_old")
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens_old")
+    op.execute("ALTER INDEX refresh_tokens_pkey RENAME TO refresh_tokens_old_pkey")
+    op.execute(
+        "ALTER INDEX refresh_tokens_token_key RENAME TO refresh_tokens_old_token_key"
+    )
+
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("token", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "signed_in_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.Column("user_agent", sa.String(length=255), nullable=True),
+        sa.Column("ip_address", postgresql.INET(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("token"),
+        postgresql_partition_by="RANGE (token)",
+    )
+    op.create_index(
+        "ix_refresh_tokens_user_id_expires_at",
+        "refresh_tokens",
+        ["user_id", "expires_at"],
+    )
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"])
+    op.execute(
+        "CREATE TABLE refresh_tokens_default PARTITION OF refresh_tokens DEFAULT"
+    )
+
+    op.execute(
+        "INSERT INTO refresh_tokens (token, user_id, expires_at) "
+        "SELECT token, user_id, expires_at FROM refresh_tokens_old"
+    )
+    op.drop_table("refresh_tokens_old")
+
+
+def downgrade():
+    op.rename_table("refresh_tokens", "refresh_tokens_new")
+    op.execute(
+        "ALTER INDEX ix_refresh_tokens_expires_at "
+        "RENAME TO ix_refresh_tokens_new_expires_at"
+    )
+    op.execute("ALTER INDEX refresh_tokens_pkey RENAME TO refresh_tokens_new_pkey")
+
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("token", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+        sa.UniqueConstraint("token"),
+    )
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"])
+
+    op.execute(
+        "INSERT INTO refresh_tokens (user_id, token, expires_at) "
+        "SELECT DISTINCT ON (user_id) user_id, token, expires_at "
+        "FROM refresh_tokens_new ORDER BY user_id, expires_at DESC"
+    )
+    # Partitions are dropped with partitioned table
+    op.drop_table("refresh_tokens_new")
@@ -1,5 +1,6 @@
 from pizza_store.db.models.base import Base
 from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import relationship
 
 
 class Category(Base):
@@ -7,3 +8,6 @@ class Category(Base):
 
     id = Column(Integer, primary_key=True)
     name = Column(String(30), unique=True, nullable=False)
+
+    # Loaded only explicitly, e.g. with joinedload
+    products = relationship("Product", order_by="Product.id", lazy="raise")
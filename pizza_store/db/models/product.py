@@ -1,5 +1,5 @@
 from pizza_store.db.models.base import Base
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from sqlalchemy.sql.schema import CheckConstraint, ForeignKey
 
 
@@ -16,4 +16,16 @@ class Product(Base):
     __table_args__ = (
         CheckConstraint(weight > 0, name="check_weight_positive"),
         CheckConstraint(price >= 0, name="check_price_non_negative"),
+        # Keyset pagination indexes: (filter columns, sort column, id)
+        Index("ix_products_category_id_id", category_id, id),
+        Index("ix_products_category_id_price_id", category_id, price, id),
+        Index("ix_products_category_id_name", category_id, name),
+        Index("ix_products_price_id", price, id),
+        # Fuzzy search, requires pg_trgm extension
+        Index(
+            "ix_products_name_trgm",
+            name,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
@@ -1,13 +1,39 @@
-import uuid
-
+from pizza_store.constants.db import REFRESH_TOKEN_DEFAULT_PARTITION
 from pizza_store.db.models.base import Base
-from sqlalchemy import Column, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from pizza_store.utils.ids import uuid7
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Index, String, event, text
+from sqlalchemy.dialects.postgresql import INET, UUID
 
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
-    token = Column(UUID(as_uuid=True), default=uuid.uuid4, unique=True, nullable=False)
+    token = Column(UUID(as_uuid=True), default=uuid7, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     expires_at = Column(DateTime, nullable=False)
+    # Device metadata, kept when token is rotated
+    signed_in_at = Column(
+        DateTime, server_default=text("timezone('utc', now())"), nullable=False
+    )
+    user_agent = Column(String(255))
+    ip_address = Column(INET)
+
+    __table_args__ = (
+        # Tokens of user, the least recently refreshed are revoked over the limit
+        Index("ix_refresh_tokens_user_id_expires_at", user_id, expires_at),
+        # Check that partition has expired
+        Index("ix_refresh_tokens_expires_at", expires_at),
+        # Token lookup is pruned to a single partition
+        {"postgresql_partition_by": "RANGE (token)"},
+    )
+
+
+# Range partitions are created by maintenance, until then tokens are in default one
+event.listen(
+    RefreshToken.__table__,
+    "after_create",
+    DDL(
+        f"CREATE TABLE {REFRESH_TOKEN_DEFAULT_PARTITION} "
+        "PARTITION OF refresh_tokens DEFAULT"
+    ),
+)
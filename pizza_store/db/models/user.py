@@ -1,15 +1,19 @@
-import uuid
-
 from pizza_store.db.models.base import Base
-from sqlalchemy import Column, String
+from pizza_store.utils.ids import uuid7
+from sqlalchemy import Column, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     username = Column(String(30), unique=True, nullable=False)
     email = Column(String(50), unique=True, nullable=False)
     password_hash = Column(String, nullable=False)
     role = Column(String(30), nullable=False)
+
+    __table_args__ = (
+        # Case-insensitive email lookup and uniqueness
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+    )
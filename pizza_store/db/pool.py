@@ -0,0 +1,72 @@
+import multiprocessing
+from typing import NamedTuple, Optional
+
+
+class PoolSize(NamedTuple):
+    pool_size: int
+    max_overflow: int
+
+
+def get_workers_count(workers: Optional[int] = None) -> int:
+    """Returns number of gunicorn workers.
+
+    Args:
+        workers (Optional[int]): configured number. If None `2 * cpu + 1` is used.
+
+    Returns:
+        int
+    """
+
+    if workers is not None:
+        return workers
+
+    return multiprocessing.cpu_count() * 2 + 1
+
+
+def get_worker_pool_size(
+    pool_size: int,
+    max_overflow: int,
+    budget: Optional[int],
+    workers: int,
+    reserved: int = 0,
+) -> PoolSize:
+    """Returns pool size of one worker which fits into connection budget.
+
+    Every worker gets equal share of `budget`. `reserved` connections of
+    the share are held outside of the pool (e.g. LISTEN connection),
+    the rest is split into persistent and overflow connections, persistent first.
+
+    Example:
+        >>> get_worker_pool_size(pool_size=5, max_overflow=10, budget=100, workers=65, reserved=0)
+        PoolSize(pool_size=1, max_overflow=0)
+        >>> get_worker_pool_size(pool_size=5, max_overflow=10, budget=200, workers=25, reserved=1)
+        PoolSize(pool_size=5, max_overflow=2)
+
+    Args:
+        pool_size (int): configured persistent connections
+        max_overflow (int): configured overflow connections
+        budget (Optional[int]): connections all workers may open. If None
+            configured sizes are used.
+        workers (int)
+        reserved (int): connections of every worker outside of the pool
+
+    Raises:
+        ValueError: share of worker does not leave a single pooled connection
+
+    Returns:
+        PoolSize
+    """
+
+    if budget is None:
+        return PoolSize(pool_size=pool_size, max_overflow=max_overflow)
+
+    available = budget // workers - reserved
+    if available < 1:
+        raise ValueError(
+            f"Connection budget {budget} is too small for {workers} workers "
+            f"with {reserved} reserved connections each"
+        )
+
+    total = min(pool_size + max_overflow, available)
+    pool_size = min(pool_size, total)
+    return PoolSize(pool_size=pool_size, max_overflow=total - pool_size)
@@ -0,0 +1,61 @@
+from typing import Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """Single transaction of request.
+
+    Services write through `session`, `flush` to get generated values and
+    constraint errors early, and `commit` once at the end. Actions which
+    must happen only if data is persisted, e.g. cache invalidation, are
+    registered with `after_commit`. Transaction which is not committed
+    is rolled back when request session is closed.
+
+    Example:
+        >>> uow = UnitOfWork(session)
+        >>> category = CategoryCRUD.add_category(uow.session, name="Pizza")
+        >>> await uow.flush()  # raises IntegrityError if category exists
+        >>> uow.after_commit(catalog_cache.invalidate)
+        >>> await uow.commit()
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._after_commit: List[Callable[[], None]] = []
+        self._committed = False
+
+    async def flush(self) -> None:
+        """Sends pending changes to db without committing.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: if changes violate constraint
+        """
+
+        await self.session.flush()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Registers `callback` to call after successful commit.
+
+        Args:
+            callback (Callable[[], None])
+        """
+
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Commits transaction and calls after commit callbacks.
+
+        Raises:
+            RuntimeError: if unit of work is already committed
+        """
+
+        if self._committed:
+            raise RuntimeError("Unit of work is already committed")
+
+        await self.session.commit()
+        self._committed = True
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
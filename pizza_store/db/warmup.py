@@ -0,0 +1,82 @@
+import asyncio
+import datetime
+import logging
+import time
+import uuid
+from typing import Optional
+
+from pizza_store.constants.pagination import DEFAULT_PAGE_LIMIT
+from pizza_store.db.crud import ProductCRUD, RefreshTokenCRUD, UserCRUD
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_pool(
+    engine: AsyncEngine, connections: Optional[int] = None, replica: bool = False
+) -> None:
+    """Opens pooled connections and prepares hot statements on each of them.
+
+    Connections are held concurrently, so pool opens `connections` distinct
+    connections, and returned to pool afterwards. Prepared statements and
+    asyncpg type introspection are per connection, so every connection
+    executes statements of sign-in, token refresh and product list.
+    Replica connections execute product list only: auth always uses primary
+    and token refresh writes, which read-only standby rejects.
+
+    Example:
+        >>> await warm_up_pool(engine, connections=5)
+        >>> await warm_up_pool(replica_engine, connections=5, replica=True)
+
+    Args:
+        engine (AsyncEngine)
+        connections (Optional[int]): connections to open, at most persistent
+            pool size. If None whole persistent pool is opened.
+        replica (bool): if True `engine` is read-only replica
+    """
+
+    pool_size = engine.sync_engine.pool.size()
+    connections = pool_size if connections is None else min(connections, pool_size)
+    if connections <= 0:
+        return
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(_prime_connection(engine, replica) for _ in range(connections))
+    )
+    logger.info(
+        "Warmed up %d connections of %s in %.1f ms",
+        connections,
+        engine.url.render_as_string(hide_password=True),
+        (time.perf_counter() - started_at) * 1000,
+    )
+
+
+async def _prime_connection(engine: AsyncEngine, replica: bool) -> None:
+    """Executes hot statements on one pooled connection.
+
+    Token refresh is primed with the same rotation statement it executes.
+    Token does not match any row, so nothing is deleted or inserted, and
+    session is closed without commit anyway.
+
+    Args:
+        engine (AsyncEngine)
+        replica (bool): if True only reads of catalog are executed
+    """
+
+    # Values do not match any row, only statements matter
+    now = datetime.datetime.utcnow()
+    async with AsyncSession(engine) as session:
+        await ProductCRUD.get_products_page(session, limit=DEFAULT_PAGE_LIMIT)
+        if replica:
+            return
+
+        await UserCRUD.get_user_by_email(session, email="")
+        await UserCRUD.get_user(session, id=uuid.UUID(int=0))
+        await RefreshTokenCRUD.rotate_refresh_token(
+            session,
+            token=uuid.UUID(int=0),
+            new_token=uuid.UUID(int=0),
+            expires_at=now,
+            now=now,
+        )
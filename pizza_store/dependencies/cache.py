@@ -0,0 +1,26 @@
+from pizza_store.cache import CatalogCache, TokenCache
+from pizza_store.db.db import async_session
+from pizza_store.settings import settings
+
+catalog_cache = CatalogCache(async_session)
+token_cache = TokenCache(maxsize=settings.JWT_CACHE_SIZE)
+
+
+def get_catalog_cache() -> CatalogCache:
+    """Returns worker catalog cache.
+
+    Returns:
+        CatalogCache
+    """
+
+    return catalog_cache
+
+
+def get_token_cache() -> TokenCache:
+    """Returns worker cache of decoded access tokens.
+
+    Returns:
+        TokenCache
+    """
+
+    return token_cache
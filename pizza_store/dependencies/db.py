@@ -1,9 +1,103 @@
+import time
 from typing import AsyncGenerator
 
-from pizza_store.db.db import async_session
+from fastapi import Depends, Request, Response
+from pizza_store.constants.db import PRIMARY_UNTIL_COOKIE, SAFE_METHODS
+from pizza_store.db.db import async_session, replica_async_session
+from pizza_store.db.unit_of_work import UnitOfWork
+from pizza_store.settings import settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_session(
+    request: Request, response: Response
+) -> AsyncGenerator[AsyncSession, None]:
+    """Returns session of replica for reads and of primary for writes.
+
+    After a write client reads from primary for `POSTGRES_REPLICA_STICKINESS`
+    seconds, so it sees its own writes while replica catches up.
+
+    Args:
+        request (Request)
+        response (Response): needs for set stickiness cookie
+
+    Yields:
+        AsyncSession
+    """
+
+    session_factory = async_session
+    if replica_async_session is not async_session:
+        if request.method not in SAFE_METHODS:
+            stickiness = settings.POSTGRES_REPLICA_STICKINESS
+            response.set_cookie(
+                PRIMARY_UNTIL_COOKIE,
+                str(time.time() + stickiness),
+                max_age=int(stickiness) + 1,
+                httponly=True,
+            )
+        elif not _is_sticky(request):
+            session_factory = replica_async_session
+
+    async with session_factory() as session:
+        yield session
+
+
+async def get_primary_session() -> AsyncGenerator[AsyncSession, None]:
+    """Returns session of primary whatever request method.
+
+    For services which write on safe requests or must not read stale data.
+
+    Yields:
+        AsyncSession
+    """
+
     async with async_session() as session:
         yield session
+
+
+def get_unit_of_work(session: AsyncSession = Depends(get_session)) -> UnitOfWork:
+    """Returns unit of work of request session.
+
+    Args:
+        session (AsyncSession, optional): sqlalchemy session
+
+    Returns:
+        UnitOfWork
+    """
+
+    return UnitOfWork(session)
+
+
+def get_primary_unit_of_work(
+    session: AsyncSession = Depends(get_primary_session),
+) -> UnitOfWork:
+    """Returns unit of work of request session of primary.
+
+    Args:
+        session (AsyncSession, optional): sqlalchemy session
+
+    Returns:
+        UnitOfWork
+    """
+
+    return UnitOfWork(session)
+
+
+def _is_sticky(request: Request) -> bool:
+    """Returns True if client wrote recently and must read from primary.
+
+    Args:
+        request (Request)
+
+    Returns:
+        bool
+    """
+
+    try:
+        primary_until = float(request.cookies[PRIMARY_UNTIL_COOKIE])
+    except (KeyError, ValueError):
+        return False
+
+    now = time.time()
+    # Forged far future value can not pin client to primary
+    return now < primary_until <= now + settings.POSTGRES_REPLICA_STICKINESS
@@ -0,0 +1,27 @@
+from pizza_store.hashing import HashingPolicy, PasswordHasher
+from pizza_store.settings import settings
+
+hashing_policy = HashingPolicy(
+    scheme=settings.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    argon2_time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+    argon2_memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+    argon2_parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+)
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    policy=hashing_policy,
+    metrics_interval=settings.PASSWORD_HASH_METRICS_INTERVAL,
+)
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Returns worker password hasher.
+
+    Returns:
+        PasswordHasher
+    """
+
+    return password_hasher
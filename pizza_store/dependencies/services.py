@@ -1,22 +1,35 @@
 from fastapi import Depends
+from pizza_store.cache import CatalogCache
 from pizza_store.db.crud import CategoryCRUD, ProductCRUD, RefreshTokenCRUD, UserCRUD
-from pizza_store.dependencies.db import get_session
+from pizza_store.db.unit_of_work import UnitOfWork
+from pizza_store.dependencies.cache import get_catalog_cache
+from pizza_store.dependencies.db import get_primary_unit_of_work, get_unit_of_work
+from pizza_store.dependencies.hashing import get_password_hasher
+from pizza_store.hashing import PasswordHasher
 from pizza_store.services import (
     AuthService,
     CategoryService,
     IAuthService,
     ICategoryService,
+    IMenuService,
     IProductService,
+    MenuService,
     ProductService,
 )
-from sqlalchemy.ext.asyncio import AsyncSession
 
 
-def get_auth_service(session: AsyncSession = Depends(get_session)) -> IAuthService:
+def get_auth_service(
+    uow: UnitOfWork = Depends(get_primary_unit_of_work),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+) -> IAuthService:
     """Returns instance of auth service.
 
+    Uses primary, because refresh writes on GET request and
+    just signed up user must be able to sign in.
+
     Args:
-        session (AsyncSession, optional): sqlalchemy session
+        uow (UnitOfWork, optional): request unit of work
+        password_hasher (PasswordHasher, optional): worker password hasher
 
     Returns:
         IAuthService
@@ -24,36 +37,59 @@ def get_auth_service(session: AsyncSession = Depends(get_session)) -> IAuthServi
 
     user_crud = UserCRUD()
     refresh_token_crud = RefreshTokenCRUD()
-    return AuthService(session, user_crud, refresh_token_crud)
+    return AuthService(uow, user_crud, refresh_token_crud, password_hasher)
 
 
 def get_category_service(
-    session: AsyncSession = Depends(get_session),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
 ) -> ICategoryService:
     """Returns instance of category service.
 
     Args:
-        session (AsyncSession, optional): sqlalchemy session
+        uow (UnitOfWork, optional): request unit of work
+        catalog_cache (CatalogCache, optional): worker catalog cache
 
     Returns:
         ICategoryService
     """
 
     category_crud = CategoryCRUD()
-    return CategoryService(session, category_crud)
+    return CategoryService(uow, category_crud, catalog_cache)
 
 
 def get_product_service(
-    session: AsyncSession = Depends(get_session),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
 ) -> IProductService:
     """Returns instance of product service.
 
     Args:
-        session (AsyncSession, optional): sqlalchemy session
+        uow (UnitOfWork, optional): request unit of work
+        catalog_cache (CatalogCache, optional): worker catalog cache
 
     Returns:
         IProductService
     """
 
     product_crud = ProductCRUD()
-    return ProductService(session, product_crud)
+    return ProductService(uow, product_crud, catalog_cache)
+
+
+def get_menu_service(
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+) -> IMenuService:
+    """Returns instance of menu service.
+
+    Menu is loaded with own session of catalog cache,
+    so request session is not needed.
+
+    Args:
+        catalog_cache (CatalogCache, optional): worker catalog cache
+
+    Returns:
+        IMenuService
+    """
+
+    category_crud = CategoryCRUD()
+    return MenuService(category_crud, catalog_cache)
@@ -1,4 +1,21 @@
-from pizza_store.enums.permissions import CategoryPermission, ProductPermission
+from pizza_store.enums.catalog_format import CatalogFormat
+from pizza_store.enums.import_status import ImportStatus
+from pizza_store.enums.password_hash_scheme import PasswordHashScheme
+from pizza_store.enums.permissions import (
+    CategoryPermission,
+    MetricsPermission,
+    ProductPermission,
+)
 from pizza_store.enums.role import Role
+from pizza_store.enums.sort import ProductSort
 
-__all__ = ["CategoryPermission", "ProductPermission", "Role"]
+__all__ = [
+    "CatalogFormat",
+    "CategoryPermission",
+    "ImportStatus",
+    "MetricsPermission",
+    "PasswordHashScheme",
+    "ProductPermission",
+    "ProductSort",
+    "Role",
+]
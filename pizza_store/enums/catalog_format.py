@@ -0,0 +1,8 @@
+import enum
+
+
+class CatalogFormat(str, enum.Enum):
+    """Formats of catalog export and import manifest."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -0,0 +1,9 @@
+import enum
+
+
+class ImportStatus(str, enum.Enum):
+    """Result of importing single manifest row."""
+
+    CREATED = "created"
+    SKIPPED = "skipped"
+    INVALID = "invalid"
@@ -0,0 +1,8 @@
+import enum
+
+
+class PasswordHashScheme(str, enum.Enum):
+    """Password hashing algorithms, values are passlib scheme names."""
+
+    BCRYPT = "bcrypt"
+    ARGON2 = "argon2"
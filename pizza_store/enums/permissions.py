@@ -17,3 +17,10 @@ class CategoryPermission(str, enum.Enum):
     READ = "read"
     UPDATE = "update"
     DELETE = "delete"
+
+
+class MetricsPermission(str, enum.Enum):
+    """Permissions for metrics endpoint."""
+
+    # Prefixed, permissions are compared by value and users have "read"
+    READ = "metrics:read"
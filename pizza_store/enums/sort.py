@@ -0,0 +1,9 @@
+import enum
+
+
+class ProductSort(str, enum.Enum):
+    """Sort keys for products list."""
+
+    ID = "id"
+    PRICE = "price"
+    NAME = "name"
@@ -0,0 +1,15 @@
+from pizza_store.hashing.hasher import (
+    HashingPoolBroken,
+    HashingQueueFull,
+    HashingUnavailable,
+    PasswordHasher,
+)
+from pizza_store.hashing.policy import HashingPolicy
+
+__all__ = [
+    "HashingPolicy",
+    "HashingPoolBroken",
+    "HashingQueueFull",
+    "HashingUnavailable",
+    "PasswordHasher",
+]
@@ -0,0 +1,133 @@
+"""Picks password hashing cost for target per hash latency on this host.
+
+Run on production hardware and put printed variables to .env:
+    $ python -m pizza_store.hashing.calibrate --scheme argon2 --target-ms 250
+
+Argon2 memory cost and parallelism are kept from settings, only time cost
+is calibrated. Hashes with previous cost are replaced on next sign in.
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, List
+
+from pizza_store.constants.hashing import (
+    CALIBRATION_MAX_ARGON2_TIME_COST,
+    CALIBRATION_MAX_BCRYPT_ROUNDS,
+    CALIBRATION_MIN_BCRYPT_ROUNDS,
+    CALIBRATION_REPEAT,
+    PASSWORD_HASH_TARGET_MS,
+)
+from pizza_store.dependencies.hashing import hashing_policy
+from pizza_store.enums.password_hash_scheme import PasswordHashScheme
+from pizza_store.hashing.policy import HashingPolicy
+
+PASSWORD = "calibration password"
+
+
+def measure(policy: HashingPolicy, repeat: int = CALIBRATION_REPEAT) -> float:
+    """Returns time of hashing password with `policy` in milliseconds.
+
+    Args:
+        policy (HashingPolicy)
+        repeat (int, optional): hashes to measure, fastest one is taken
+
+    Returns:
+        float
+    """
+
+    context = policy.crypt_context()
+    durations = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        context.hash(PASSWORD)
+        durations.append(time.perf_counter() - started_at)
+
+    return min(durations) * 1000
+
+
+def calibrate(
+    policy: HashingPolicy,
+    target_ms: float,
+    measure: Callable[[HashingPolicy], float] = measure,
+) -> HashingPolicy:
+    """Returns `policy` with the highest cost of its scheme within `target_ms`.
+
+    Cost is raised until hash takes longer than `target_ms`. If even
+    the lowest cost is slower, the lowest cost is returned.
+
+    Args:
+        policy (HashingPolicy): scheme and parameters which are not calibrated
+        target_ms (float): per hash latency
+        measure (Callable[[HashingPolicy], float], optional): returns hash time in ms
+
+    Returns:
+        HashingPolicy
+    """
+
+    if policy.scheme is PasswordHashScheme.BCRYPT:
+        candidates = [
+            policy._replace(bcrypt_rounds=rounds)
+            for rounds in range(
+                CALIBRATION_MIN_BCRYPT_ROUNDS, CALIBRATION_MAX_BCRYPT_ROUNDS + 1
+            )
+        ]
+    else:
+        candidates = [
+            policy._replace(argon2_time_cost=time_cost)
+            for time_cost in range(1, CALIBRATION_MAX_ARGON2_TIME_COST + 1)
+        ]
+
+    calibrated = candidates[0]
+    for candidate in candidates:
+        duration_ms = measure(candidate)
+        print(
+            f"{policy_variables(candidate)[-1]}: {duration_ms:.1f} ms", file=sys.stderr
+        )
+        if duration_ms > target_ms:
+            break
+        calibrated = candidate
+
+    return calibrated
+
+
+def policy_variables(policy: HashingPolicy) -> List[str]:
+    """Returns environment variables which configure `policy` scheme.
+
+    Args:
+        policy (HashingPolicy)
+
+    Returns:
+        List[str]
+    """
+
+    variables = [f"PASSWORD_HASH_SCHEME={policy.scheme.value}"]
+    if policy.scheme is PasswordHashScheme.BCRYPT:
+        variables.append(f"PASSWORD_BCRYPT_ROUNDS={policy.bcrypt_rounds}")
+    else:
+        variables.append(f"PASSWORD_ARGON2_MEMORY_COST={policy.argon2_memory_cost}")
+        variables.append(f"PASSWORD_ARGON2_PARALLELISM={policy.argon2_parallelism}")
+        variables.append(f"PASSWORD_ARGON2_TIME_COST={policy.argon2_time_cost}")
+
+    return variables
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scheme",
+        type=PasswordHashScheme,
+        choices=[scheme.value for scheme in PasswordHashScheme],
+        default=hashing_policy.scheme,
+    )
+    parser.add_argument("--target-ms", type=float, default=PASSWORD_HASH_TARGET_MS)
+    args = parser.parse_args()
+
+    policy = calibrate(hashing_policy._replace(scheme=args.scheme), args.target_ms)
+
+    print("\n".join(policy_variables(policy)))
+
+
+if __name__ == "__main__":
+    main()
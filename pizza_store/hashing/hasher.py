@@ -0,0 +1,278 @@
+import asyncio
+import collections
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Optional, Tuple, TypeVar
+
+from passlib.context import CryptContext
+from pizza_store.constants.hashing import PASSWORD_HASH_WAIT_SAMPLES
+from pizza_store.hashing.policy import HashingPolicy
+from pizza_store.models.metrics import PasswordHashingMetrics
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class HashingUnavailable(Exception):
+    """Raised when password can not be hashed now, caller may retry later."""
+
+
+class HashingQueueFull(HashingUnavailable):
+    """Raised when password hashing queue of worker is full."""
+
+
+class HashingPoolBroken(HashingUnavailable):
+    """Raised when pool process died, e.g. was killed by OOM killer.
+
+    Pool is replaced with new one on next call.
+    """
+
+
+# Context of pool process, set by initializer
+_context: Optional[CryptContext] = None
+
+
+def _init_process(policy: HashingPolicy) -> None:
+    global _context
+    _context = policy.crypt_context()
+
+
+def _hash_password(password: str) -> str:
+    assert _context is not None
+    return _context.hash(password)
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    assert _context is not None
+    return _context.verify(password, password_hash)
+
+
+def _verify_and_update_password(
+    password: str, password_hash: str
+) -> Tuple[bool, Optional[str]]:
+    assert _context is not None
+    return _context.verify_and_update(password, password_hash)
+
+
+def _noop() -> None:
+    pass
+
+
+def _timed(fn: Callable[..., T], *args: Any) -> Tuple[float, T]:
+    """Calls `fn` in pool process and returns when the call was started.
+
+    `time.monotonic` is system wide clock, so it is comparable
+    with time of submission in app process.
+    """
+
+    started_at = time.monotonic()
+    return started_at, fn(*args)
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords in dedicated process pool.
+
+    bcrypt takes hundreds of milliseconds of CPU on purpose, called inline
+    it blocks event loop and every in-flight request of worker. Calls which
+    can not start immediately wait in queue of `queue_size`, when it is full
+    `HashingQueueFull` is raised at once, so caller can fail fast instead
+    of piling up requests. If pool process dies, calls in flight fail with
+    `HashingPoolBroken` and the next call starts new pool.
+
+    Processes are spawned, not forked, since worker has running threads.
+    Hashes are created and checked by `policy`. Every gunicorn worker has
+    its own pool, so metrics are logged by each of them every
+    `metrics_interval` seconds, if it is set.
+
+    Example:
+        >>> hasher = PasswordHasher(workers=1, queue_size=8, policy=policy)
+        >>> await hasher.start()
+        >>> password_hash = await hasher.hash("secret")
+        >>> await hasher.verify("secret", password_hash)
+        True
+        >>> hasher.shutdown()
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        policy: HashingPolicy,
+        wait_samples: int = PASSWORD_HASH_WAIT_SAMPLES,
+        metrics_interval: Optional[float] = None,
+    ) -> None:
+        self._workers = workers
+        self._queue_size = queue_size
+        self._policy = policy
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._rejected = 0
+        self._wait_times: Deque[float] = collections.deque(maxlen=wait_samples)
+        self._metrics_interval = metrics_interval
+        self._metrics_reporter: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Starts pool processes, so first sign in does not wait for spawn.
+
+        Starts periodic metrics logging too, if interval is set.
+        """
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _noop) for _ in range(self._workers))
+        )
+        if self._metrics_interval and self._metrics_reporter is None:
+            self._metrics_reporter = asyncio.ensure_future(self._report_metrics())
+
+    def shutdown(self) -> None:
+        """Stops pool processes. Pool is started again on next call."""
+
+        if self._metrics_reporter is not None:
+            self._metrics_reporter.cancel()
+            self._metrics_reporter = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def hash(self, password: str) -> str:
+        """Returns `password` hash.
+
+        Args:
+            password (str)
+
+        Raises:
+            HashingQueueFull: if queue is full
+            HashingPoolBroken: if pool process died
+
+        Returns:
+            str
+        """
+
+        return await self._run(_hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Returns True if `password` hash match `password_hash`.
+
+        Args:
+            password (str)
+            password_hash (str)
+
+        Raises:
+            HashingQueueFull: if queue is full
+            HashingPoolBroken: if pool process died
+
+        Returns:
+            bool
+        """
+
+        return await self._run(_verify_password, password, password_hash)
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verifies `password` and rehashes it if `password_hash` is outdated.
+
+        Hash is outdated if it was created with other scheme
+        or parameters than policy has.
+
+        Args:
+            password (str)
+            password_hash (str)
+
+        Raises:
+            HashingQueueFull: if queue is full
+            HashingPoolBroken: if pool process died
+
+        Returns:
+            Tuple[bool, Optional[str]]: True if password matches and its new hash,
+                new hash is None if password does not match or hash is up to date.
+        """
+
+        return await self._run(_verify_and_update_password, password, password_hash)
+
+    def metrics(self) -> PasswordHashingMetrics:
+        """Returns current queue state and wait times of latest calls.
+
+        Returns:
+            PasswordHashingMetrics
+        """
+
+        wait_times = sorted(self._wait_times)
+
+        def percentile(q: float) -> float:
+            if not wait_times:
+                return 0.0
+            return wait_times[min(int(len(wait_times) * q), len(wait_times) - 1)] * 1000
+
+        return PasswordHashingMetrics(
+            pid=os.getpid(),
+            workers=self._workers,
+            queue_size=self._queue_size,
+            in_flight=self._in_flight,
+            queue_depth=max(self._in_flight - self._workers, 0),
+            rejected=self._rejected,
+            wait_time_p50=percentile(0.5),
+            wait_time_p99=percentile(0.99),
+            wait_time_max=percentile(1.0),
+        )
+
+    async def _report_metrics(self) -> None:
+        assert self._metrics_interval is not None
+        while True:
+            await asyncio.sleep(self._metrics_interval)
+            logger.info("Password hashing metrics %s", self.metrics().json())
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process,
+                initargs=(self._policy,),
+            )
+
+        return self._executor
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self._workers + self._queue_size:
+            self._rejected += 1
+            raise HashingQueueFull
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.monotonic()
+        executor = self._get_executor()
+        try:
+            future = executor.submit(_timed, fn, *args)
+        except BrokenProcessPool:
+            self._replace_broken_executor(executor)
+            raise HashingPoolBroken
+        self._in_flight += 1
+        # Call occupies pool until it is done, even if caller is cancelled
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self._release_call)
+        )
+
+        try:
+            started_at, result = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._replace_broken_executor(executor)
+            raise HashingPoolBroken
+        self._wait_times.append(started_at - submitted_at)
+
+        return result
+
+    def _replace_broken_executor(self, executor: ProcessPoolExecutor) -> None:
+        # Calls failed by the same broken pool must not drop its replacement
+        if self._executor is executor:
+            logger.error("Password hashing pool is broken, starting new one")
+            executor.shutdown(wait=False)
+            self._executor = None
+
+    def _release_call(self) -> None:
+        self._in_flight -= 1
@@ -0,0 +1,45 @@
+from typing import NamedTuple
+
+from passlib.context import CryptContext
+from pizza_store.enums.password_hash_scheme import PasswordHashScheme
+
+
+class HashingPolicy(NamedTuple):
+    """Password hashing scheme and cost parameters of both schemes.
+
+    New hashes use `scheme`. Hashes of the other scheme or with other
+    parameters are still verified, but need update, so they are replaced
+    on next sign in. Argon2 memory cost is in KiB.
+
+    Example:
+        >>> policy = HashingPolicy(PasswordHashScheme.ARGON2, bcrypt_rounds=12,
+        ...     argon2_time_cost=2, argon2_memory_cost=19456, argon2_parallelism=1)
+        >>> context = policy.crypt_context()
+        >>> context.needs_update("$2b$12$...")
+        True
+    """
+
+    scheme: PasswordHashScheme
+    bcrypt_rounds: int
+    argon2_time_cost: int
+    argon2_memory_cost: int
+    argon2_parallelism: int
+
+    def crypt_context(self) -> CryptContext:
+        """Returns passlib context which implements policy.
+
+        Returns:
+            CryptContext
+        """
+
+        schemes = [self.scheme.value]
+        schemes.extend(s.value for s in PasswordHashScheme if s is not self.scheme)
+
+        return CryptContext(
+            schemes=schemes,
+            deprecated="auto",
+            bcrypt__rounds=self.bcrypt_rounds,
+            argon2__time_cost=self.argon2_time_cost,
+            argon2__memory_cost=self.argon2_memory_cost,
+            argon2__parallelism=self.argon2_parallelism,
+        )
@@ -1,5 +1,15 @@
 from pizza_store.models.category import Category, CategoryCreate
-from pizza_store.models.product import Product, ProductCreate
+from pizza_store.models.menu import MenuCategory
+from pizza_store.models.metrics import PasswordHashingMetrics
+from pizza_store.models.product import (
+    Product,
+    ProductCreate,
+    ProductImport,
+    ProductImportReport,
+    ProductImportResult,
+    ProductImportRow,
+    ProductPage,
+)
 from pizza_store.models.user import (
     Token,
     TokenResponse,
@@ -20,6 +30,13 @@ __all__ = [
     "TokenResponse",
     "Category",
     "CategoryCreate",
+    "MenuCategory",
+    "PasswordHashingMetrics",
     "Product",
     "ProductCreate",
+    "ProductImport",
+    "ProductImportReport",
+    "ProductImportResult",
+    "ProductImportRow",
+    "ProductPage",
 ]
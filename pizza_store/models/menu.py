@@ -0,0 +1,8 @@
+from pizza_store.models.category import Category
+from pizza_store.models.product import Product
+
+
+class MenuCategory(Category):
+    """Category with its products"""
+
+    products: list[Product]
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class PasswordHashingMetrics(BaseModel):
+    """Password hashing pool state of worker.
+
+    Every worker has its own pool, `pid` tells which worker metrics are of.
+    Wait times are in milliseconds, computed from latest hashing calls.
+    """
+
+    pid: int
+    workers: int
+    queue_size: int
+    in_flight: int
+    queue_depth: int
+    rejected: int
+    wait_time_p50: float
+    wait_time_p99: float
+    wait_time_max: float
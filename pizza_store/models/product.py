@@ -1,5 +1,10 @@
+from typing import Optional
+
 from fastapi import UploadFile
-from pydantic import BaseModel
+from pizza_store.constants.db import MAX_SERIAL_ID
+from pizza_store.enums.catalog_format import CatalogFormat
+from pizza_store.enums.import_status import ImportStatus
+from pydantic import BaseModel, Field
 
 
 class ProductBase(BaseModel):
@@ -16,3 +21,54 @@ class ProductCreate(ProductBase):
 class Product(ProductBase):
     id: int
     image: str
+
+
+class ProductPage(BaseModel):
+    """Page of products.
+
+    `next` is cursor of the next page. If None it is the last page.
+    """
+
+    items: list[Product]
+    next: Optional[str]
+
+
+class ProductImport(BaseModel):
+    """Manifest of products with archive of their images.
+
+    Manifest rows have `category_id`, `name`, `weight`, `price` and `image` fields,
+    `image` is a file name in zip archive `images`.
+    """
+
+    manifest: UploadFile
+    images: UploadFile
+    format: CatalogFormat
+
+
+class ProductImportRow(ProductBase):
+    """Product row of import manifest."""
+
+    category_id: int = Field(..., ge=1, le=MAX_SERIAL_ID)
+    name: str = Field(..., max_length=30)
+    weight: int = Field(..., gt=0, le=MAX_SERIAL_ID)
+    price: int = Field(..., ge=0, le=MAX_SERIAL_ID)
+    image: str
+
+
+class ProductImportResult(BaseModel):
+    """Result of importing manifest row.
+
+    `row` is 1-based number of row in manifest, CSV header is not counted.
+    """
+
+    row: int
+    status: ImportStatus
+    product_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class ProductImportReport(BaseModel):
+    created: int
+    skipped: int
+    invalid: int
+    results: list[ProductImportResult]
@@ -1,11 +1,12 @@
 from typing import Optional
 
 import pizza_store.models as models
-from fastapi import APIRouter, Cookie, Depends, Response
+from fastapi import APIRouter, Cookie, Depends, Header, Request, Response
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
 from pizza_store.dependencies.services import get_auth_service
 from pizza_store.models import UserIn
 from pizza_store.services import IAuthService
+from pizza_store.utils.http import client_ip_address
 
 auth_router = APIRouter(prefix="/auth")
 router = auth_router
@@ -21,13 +22,17 @@ async def sign_up(
 
 @router.post("/sign-in", response_model=models.TokenResponse)
 async def sign_in(
+    request: Request,
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
+    user_agent: Optional[str] = Header(None),
     service: IAuthService = Depends(get_auth_service),
 ):
     return await service.sign_in(
         user_in=UserIn(username=form_data.username, password=form_data.password),
         response=response,
+        user_agent=user_agent,
+        ip_address=client_ip_address(request.client.host if request.client else None),
     )
 
 
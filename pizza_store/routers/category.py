@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Response, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Response, status
 from pizza_store import models
 from pizza_store.dependencies.services import get_category_service
 from pizza_store.enums.permissions import CategoryPermission
+from pizza_store.routers.responses import snapshot_response
 from pizza_store.services import AuthService, ICategoryService
 
 category_router = APIRouter(prefix="/category")
@@ -9,8 +12,15 @@ router = category_router
 
 
 @router.get("", response_model=list[models.Category])
-async def get_categories(service: ICategoryService = Depends(get_category_service)):
-    return await service.get_categories()
+async def get_categories(
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    service: ICategoryService = Depends(get_category_service),
+):
+    # Conditional request waits for fresh categories, so 304 is never stale
+    snapshot = await service.get_categories_snapshot(allow_stale=if_none_match is None)
+
+    return snapshot_response(snapshot, if_none_match, accept_encoding)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=models.Category)
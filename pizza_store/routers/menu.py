@@ -0,0 +1,22 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header
+from pizza_store import models
+from pizza_store.dependencies.services import get_menu_service
+from pizza_store.routers.responses import snapshot_response
+from pizza_store.services import IMenuService
+
+menu_router = APIRouter(prefix="/menu")
+router = menu_router
+
+
+@router.get("", response_model=list[models.MenuCategory])
+async def get_menu(
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    service: IMenuService = Depends(get_menu_service),
+):
+    # Conditional request waits for fresh menu, so 304 is never stale
+    snapshot = await service.get_menu_snapshot(allow_stale=if_none_match is None)
+
+    return snapshot_response(snapshot, if_none_match, accept_encoding)
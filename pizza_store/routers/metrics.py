@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+from pizza_store import models
+from pizza_store.dependencies.hashing import get_password_hasher
+from pizza_store.enums.permissions import MetricsPermission
+from pizza_store.hashing import PasswordHasher
+from pizza_store.services import AuthService
+
+metrics_router = APIRouter(prefix="/metrics")
+router = metrics_router
+
+
+@router.get("/password-hashing", response_model=models.PasswordHashingMetrics)
+async def get_password_hashing_metrics(
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    _: models.UserInToken = Depends(
+        AuthService.get_current_user(required_permissions=(MetricsPermission.READ,))
+    ),
+):
+    # Metrics of the worker which accepted connection, every worker
+    # also logs its own metrics periodically
+    return password_hasher.metrics()
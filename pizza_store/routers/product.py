@@ -1,18 +1,110 @@
-from fastapi import APIRouter, Depends, File, Form, Response, UploadFile, status
+from typing import Optional, Union
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    Path,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from pizza_store import models
+from pizza_store.constants.db import MAX_SERIAL_ID
+from pizza_store.constants.export import EXPORT_MEDIA_TYPES
+from pizza_store.constants.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from pizza_store.constants.search import AUTOCOMPLETE_LIMIT, SEARCH_LIMIT
 from pizza_store.dependencies.services import get_product_service
+from pizza_store.enums.catalog_format import CatalogFormat
 from pizza_store.enums.permissions import ProductPermission
+from pizza_store.enums.sort import ProductSort
+from pizza_store.routers.responses import snapshot_response
 from pizza_store.services import AuthService, IProductService
 
 product_router = APIRouter(prefix="/product")
 router = product_router
 
 
-@router.get("", response_model=list[models.Product])
+@router.get("", response_model=Union[list[models.Product], models.ProductPage])
 async def get_products(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    sort: Optional[ProductSort] = None,
+    category_id: Optional[int] = Query(None, ge=1, le=MAX_SERIAL_ID),
+    min_price: Optional[int] = Query(None, ge=0, le=MAX_SERIAL_ID),
+    max_price: Optional[int] = Query(None, ge=0, le=MAX_SERIAL_ID),
+    ids: Optional[str] = Query(None, regex=r"^\d{1,9}(,\d{1,9})*$"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    service: IProductService = Depends(get_product_service),
+):
+    if ids is not None:
+        return await service.get_products_by_ids(ids=[int(id) for id in ids.split(",")])
+
+    # Any query parameter switches to paginated response from db,
+    # without them whole catalog is returned from cache
+    query = (limit, cursor, sort, category_id, min_price, max_price)
+    if any(param is not None for param in query):
+        return await service.get_products_page(
+            limit=limit or DEFAULT_PAGE_LIMIT,
+            cursor=cursor,
+            sort=sort or ProductSort.ID,
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+        )
+
+    # Conditional request waits for fresh products, so 304 is never stale
+    snapshot = await service.get_products_snapshot(allow_stale=if_none_match is None)
+
+    return snapshot_response(snapshot, if_none_match, accept_encoding)
+
+
+@router.get("/search", response_model=list[models.Product])
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=30),
+    limit: int = Query(SEARCH_LIMIT, ge=1, le=SEARCH_LIMIT),
+    service: IProductService = Depends(get_product_service),
+):
+    return await service.search_products(query=q, limit=limit)
+
+
+@router.get("/autocomplete", response_model=list[models.Product])
+async def autocomplete_products(
+    q: str = Query(..., min_length=1, max_length=30),
+    limit: int = Query(AUTOCOMPLETE_LIMIT, ge=1, le=AUTOCOMPLETE_LIMIT),
+    service: IProductService = Depends(get_product_service),
+):
+    return await service.autocomplete_products(prefix=q, limit=limit)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_products(
+    format: CatalogFormat = CatalogFormat.NDJSON,
+    service: IProductService = Depends(get_product_service),
+    _: models.UserInToken = Depends(
+        AuthService.get_current_user(required_permissions=(ProductPermission.READ,))
+    ),
+):
+    return StreamingResponse(
+        service.export_products(format=format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="products.{format.value}"'
+        },
+    )
+
+
+@router.get("/{product_id}", response_model=models.Product)
+async def get_product(
+    product_id: int = Path(..., ge=1, le=MAX_SERIAL_ID),
     service: IProductService = Depends(get_product_service),
 ):
-    return await service.get_products()
+    return await service.get_product(product_id=product_id)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=models.Product)
@@ -33,11 +125,27 @@ async def add_product(
     return await service.add_product(product_create=product_create)
 
 
+@router.post("/import", response_model=models.ProductImportReport)
+async def import_products(
+    manifest: UploadFile = File(...),
+    images: UploadFile = File(...),
+    format: CatalogFormat = CatalogFormat.NDJSON,
+    service: IProductService = Depends(get_product_service),
+    _: models.UserInToken = Depends(
+        AuthService.get_current_user(required_permissions=(ProductPermission.CREATE,))
+    ),
+):
+    product_import = models.ProductImport(
+        manifest=manifest, images=images, format=format
+    )
+    return await service.import_products(product_import=product_import)
+
+
 @router.delete(
     "/{product_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response
 )
 async def delete_product(
-    product_id: int,
+    product_id: int = Path(..., ge=1, le=MAX_SERIAL_ID),
     service: IProductService = Depends(get_product_service),
     _: models.UserInToken = Depends(
         AuthService.get_current_user(required_permissions=(ProductPermission.DELETE,))
@@ -0,0 +1,36 @@
+from typing import Any, Optional
+
+from fastapi import Response, status
+from pizza_store.cache import CatalogSnapshot
+from pizza_store.utils.http import choose_encoding, etag_matches
+
+
+def snapshot_response(
+    snapshot: CatalogSnapshot[Any],
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str],
+) -> Response:
+    """Returns prerendered snapshot body in encoding preferred by client.
+
+    Returns 304 response if `if_none_match` matches representation ETag.
+
+    Args:
+        snapshot (CatalogSnapshot[Any])
+        if_none_match (Optional[str]): `If-None-Match` header value
+        accept_encoding (Optional[str]): `Accept-Encoding` header value
+
+    Returns:
+        Response
+    """
+
+    encoding = choose_encoding(accept_encoding, snapshot.encoded_bodies)
+    body, etag = snapshot.representation(encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type="application/json", headers=headers)
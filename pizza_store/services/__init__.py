@@ -1,5 +1,6 @@
 from pizza_store.services.auth import AuthService, IAuthService
 from pizza_store.services.category import CategoryService, ICategoryService
+from pizza_store.services.menu import IMenuService, MenuService
 from pizza_store.services.product import IProductService, ProductService
 
 __all__ = [
@@ -7,6 +8,8 @@ __all__ = [
     "IAuthService",
     "ICategoryService",
     "CategoryService",
+    "IMenuService",
+    "MenuService",
     "IProductService",
     "ProductService",
 ]
@@ -1,6 +1,6 @@
 import datetime
 import uuid
-from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Protocol
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Protocol, Tuple
 
 import pizza_store.models as models
 from fastapi import Response
@@ -62,31 +62,47 @@ class IAuthService(Protocol):
     def create_refresh_token(cls) -> uuid.UUID:
         """Creates refresh token.
 
-        Refresh token represents uuid4.
+        Refresh token is time ordered uuid7, so inserts stay localized in token index
+        and token is stored in partition of the day it was created.
 
         Returns:
-            str
+            uuid.UUID
         """
 
-    @classmethod
-    def verify_password(cls, password: str, password_hash: str) -> bool:
-        """Returns True if `password` hash match `password_hash`.
+    async def verify_and_update_password(
+        self, password: str, password_hash: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verifies `password` and rehashes it if `password_hash` is outdated.
+
+        Hash is outdated if it was created with other scheme or cost
+        than hashing policy has. Verification runs in password hasher pool,
+        off event loop.
 
         Args:
             password (str)
             password_hash (str)
 
+        Raises:
+            HTTPException: will be raised 503 http error if hashing queue is full
+                or pool is restarting.
+
         Returns:
-            bool
+            Tuple[bool, Optional[str]]: True if `password` hash match `password_hash`
+                and new hash if `password_hash` is outdated.
         """
 
-    @classmethod
-    def hash_password(cls, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Returns `password` hash.
 
+        Hashing runs in password hasher pool, off event loop.
+
         Args:
             password (str)
 
+        Raises:
+            HTTPException: will be raised 503 http error if hashing queue is full
+                or pool is restarting.
+
         Returns:
             str
         """
@@ -129,6 +145,8 @@ class IAuthService(Protocol):
         """Returns fastapi dependency.
 
         Dependency verifies access token, check user permissions and returns user from token.
+        Decoded tokens are cached by worker until they expire, so repeated requests
+        with the same token skip signature verification and validation.
 
         Args:
             required_permissions (Optional[Iterable[str]]): if None will be empty
@@ -144,25 +162,37 @@ class IAuthService(Protocol):
             user_create (models.UserCreate): model with user credentials
 
         Raises:
-            HTTPException: will be raised 409 http error if user already exists.
+            HTTPException: will be raised 409 http error if user already exists,
+                503 http error if password hashing queue is full
+                or pool is restarting.
 
         Returns:
             models.User: pydantic created user model.
         """
 
     async def sign_in(
-        self, user_in: models.UserIn, response: Response
+        self,
+        user_in: models.UserIn,
+        response: Response,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
     ) -> models.TokenResponse:
         """Creates access and refresh tokens for user.
 
         Access token will be in response. Refresh token will be setted to cookies.
+        Refresh tokens of other devices are kept up to the limit of settings.
+        Outdated password hash is replaced with hash of current policy.
 
         Args:
             user_in (models.UserIn): model with username and password
             response (Response): need for set refresh token to cookies
+            user_agent (Optional[str]): user agent of device
+            ip_address (Optional[str]): ip address of device
 
         Raises:
-            HTTPException: will be raised if invalid username or password
+            HTTPException: will be raised if invalid username or password,
+                503 http error if password hashing queue is full
+                or pool is restarting.
 
         Returns:
             models.TokenResponse
@@ -1,6 +1,6 @@
 import datetime
 import uuid
-from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 
 import jwt
 import pizza_store.db.models as tables
@@ -9,12 +9,16 @@ import sqlalchemy as sa
 from fastapi import Depends, Response, status
 from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from passlib.hash import bcrypt
+from pizza_store.cache import TokenCache
+from pizza_store.constants.hashing import PASSWORD_HASH_RETRY_AFTER
 from pizza_store.constants.roles import ROLES
 from pizza_store.db.crud import IRefreshTokenCRUD, IUserCRUD
+from pizza_store.db.unit_of_work import UnitOfWork
+from pizza_store.dependencies.cache import get_token_cache
 from pizza_store.enums.role import Role
+from pizza_store.hashing import HashingUnavailable, PasswordHasher
 from pizza_store.settings import settings
-from sqlalchemy.ext.asyncio import AsyncSession
+from pizza_store.utils.ids import uuid7
 
 oauth2_password_bearer_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/sign-in")
 
@@ -22,13 +26,15 @@ oauth2_password_bearer_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/sign-in
 class AuthService:
     def __init__(
         self,
-        session: AsyncSession,
+        uow: UnitOfWork,
         user_crud: IUserCRUD,
         refresh_token_crud: IRefreshTokenCRUD,
+        password_hasher: PasswordHasher,
     ) -> None:
-        self._session = session
+        self._uow = uow
         self._user_crud = user_crud
         self._refresh_token_crud = refresh_token_crud
+        self._password_hasher = password_hasher
 
     @classmethod
     def create_access_token(
@@ -122,42 +128,74 @@ class AuthService:
     def create_refresh_token(cls) -> uuid.UUID:
         """Creates refresh token.
 
-        Refresh token represents uuid4.
+        Refresh token is time ordered uuid7, so inserts stay localized in token index
+        and token is stored in partition of the day it was created.
 
         Returns:
-            str
+            uuid.UUID
         """
 
-        refresh_token = uuid.uuid4()
+        refresh_token = uuid7()
 
         return refresh_token
 
-    @classmethod
-    def verify_password(cls, password: str, password_hash: str) -> bool:
-        """Returns True if `password` hash match `password_hash`.
+    async def verify_and_update_password(
+        self, password: str, password_hash: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verifies `password` and rehashes it if `password_hash` is outdated.
+
+        Hash is outdated if it was created with other scheme or cost
+        than hashing policy has. Verification runs in password hasher pool,
+        off event loop.
 
         Args:
             password (str)
             password_hash (str)
 
+        Raises:
+            HTTPException: will be raised 503 http error if hashing queue is full
+                or pool is restarting.
+
         Returns:
-            bool
+            Tuple[bool, Optional[str]]: True if `password` hash match `password_hash`
+                and new hash if `password_hash` is outdated.
         """
 
-        return bcrypt.verify(password, password_hash)
+        try:
+            return await self._password_hasher.verify_and_update(
+                password, password_hash
+            )
+        except HashingUnavailable:
+            raise self._hashing_unavailable()
 
-    @classmethod
-    def hash_password(cls, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Returns `password` hash.
 
+        Hashing runs in password hasher pool, off event loop.
+
         Args:
             password (str)
 
+        Raises:
+            HTTPException: will be raised 503 http error if hashing queue is full
+                or pool is restarting.
+
         Returns:
             str
         """
 
-        return bcrypt.hash(password)
+        try:
+            return await self._password_hasher.hash(password)
+        except HashingUnavailable:
+            raise self._hashing_unavailable()
+
+    @classmethod
+    def _hashing_unavailable(cls) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign in requests, try again later",
+            headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)},
+        )
 
     @classmethod
     def decode_token(cls, token: str, key: str, algorithm: str) -> models.Token:
@@ -211,6 +249,8 @@ class AuthService:
         """Returns fastapi dependency.
 
         Dependency verifies access token, check user permissions and returns user from token.
+        Decoded tokens are cached by worker until they expire, so repeated requests
+        with the same token skip signature verification and validation.
 
         Args:
             required_permissions (Optional[Iterable[str]]): if None will be empty
@@ -227,10 +267,14 @@ class AuthService:
 
         def dependency(
             token: str = Depends(oauth2_password_bearer_scheme),
+            token_cache: TokenCache = Depends(get_token_cache),
         ) -> models.UserInToken:
-            token_data = cls.decode_token(
-                token, key=settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-            )
+            token_data = token_cache.get(token)
+            if token_data is None:
+                token_data = cls.decode_token(
+                    token, key=settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+                )
+                token_cache.set(token, token_data)
             user = token_data.user
 
             cls.check_permissions(ROLES[user.role], required_permissions)
@@ -246,37 +290,50 @@ class AuthService:
             user_create (models.UserCreate)
 
         Raises:
-            HTTPException: will be raised 409 http error if user already exists.
+            HTTPException: will be raised 409 http error if user already exists,
+                503 http error if password hashing queue is full
+                or pool is restarting.
 
         Returns:
             models.User: pydantic created user model.
         """
 
-        password_hash = self.hash_password(user_create.password)
+        password_hash = await self.hash_password(user_create.password)
         user_db = await self._add_user_to_db(user_create, password_hash)
+        await self._uow.commit()
         user = models.User.from_orm(user_db)
 
         return user
 
     async def sign_in(
-        self, user_in: models.UserIn, response: Response
+        self,
+        user_in: models.UserIn,
+        response: Response,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
     ) -> models.TokenResponse:
         """Creates access and refresh tokens for user.
 
         Access token will be in response. Refresh token will be setted to cookies.
+        Refresh tokens of other devices are kept up to the limit of settings.
+        Outdated password hash is replaced with hash of current policy.
 
         Args:
             form_data (OAuth2PasswordRequestForm): has user username and password
             response (Response): need for set refresh token to cookies
+            user_agent (Optional[str]): user agent of device
+            ip_address (Optional[str]): ip address of device
 
         Raises:
-            HTTPException: will be raised if invalid username or password
+            HTTPException: will be raised if invalid username or password,
+                503 http error if password hashing queue is full
+                or pool is restarting.
 
         Returns:
             models.TokenResponse
         """
 
-        session = self._session
+        session = self._uow.session
 
         exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -286,14 +343,30 @@ class AuthService:
         user_db = await self._user_crud.get_user_by_email(
             session, email=user_in.username
         )
-        if user_db is None or not self.verify_password(
+        if user_db is None:
+            raise exception
+
+        verified, password_hash = await self.verify_and_update_password(
             password=user_in.password, password_hash=user_db.password_hash
-        ):
+        )
+        if not verified:
             raise exception
 
         user_id = user_db.id
 
-        await self._make_refresh_token(user_id=user_id, response=response)
+        # Hash of outdated scheme or cost is replaced while password is known
+        if password_hash is not None:
+            await self._user_crud.update_password_hash(
+                session, id=user_id, password_hash=password_hash
+            )
+
+        await self._make_refresh_token(
+            user_id=user_id,
+            response=response,
+            user_agent=user_agent,
+            ip_address=ip_address,
+        )
+        await self._uow.commit()
 
         user = models.UserInToken.from_orm(user_db)
         token_response = self.create_token_response(user)
@@ -323,7 +396,7 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing refresh token"
             )
 
-        session = self._session
+        session = self._uow.session
 
         try:
             refresh_token = uuid.UUID(refresh_token_cookie)
@@ -332,85 +405,75 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
             )
 
-        refresh_token_db = await self._refresh_token_crud.get_refresh_token(
-            session, token=refresh_token
+        # Token is rotated and its user is fetched by single statement
+        new_refresh_token = self.create_refresh_token()
+        user_db = await self._refresh_token_crud.rotate_refresh_token(
+            session,
+            token=refresh_token,
+            new_token=new_refresh_token,
+            expires_at=self._refresh_token_expires_at(),
+            now=datetime.datetime.utcnow(),
         )
-        if (
-            refresh_token_db is None
-            or datetime.datetime.utcnow() > refresh_token_db.expires_at
-        ):
+        if user_db is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Refresh token is expired or does not exist",
             )
-
-        user_id = refresh_token_db.user_id
-
-        user_db = await self._user_crud.get_user(session, id=user_id)
-        assert user_db is not None
+        await self._uow.commit()
+        response.set_cookie("refresh_token", str(new_refresh_token), httponly=True)
 
         user = models.UserInToken.from_orm(user_db)
         token_response = self.create_token_response(user)
 
-        await self._make_refresh_token(user_id=user_id, response=response)
-
         return token_response
 
-    async def _make_refresh_token(self, user_id: uuid.UUID, response: Response) -> None:
-        """Deletes old user refresh token from db, then creates new, then writes it to db, then set to cookies.
+    async def _make_refresh_token(
+        self,
+        user_id: uuid.UUID,
+        response: Response,
+        user_agent: Optional[str],
+        ip_address: Optional[str],
+    ) -> None:
+        """Creates new refresh token of user device, writes it to db, then set to cookies.
+
+        The least recently refreshed tokens of user over the limit are revoked.
+        Changes are not committed, caller commits unit of work.
 
         Args:
             user_id (uuid.UUID)
             response (Response)
+            user_agent (Optional[str])
+            ip_address (Optional[str])
         """
 
-        await self._delete_refresh_token(user_id=user_id)
         refresh_token = self.create_refresh_token()
-        await self._add_refresh_token(user_id=user_id, token=refresh_token)
-        response.set_cookie("refresh_token", str(refresh_token), httponly=True)
-
-    async def _delete_refresh_token(self, user_id: uuid.UUID) -> None:
-        """Deletes refresh token for user with `user_id` from db.
-
-        Args:
-            user_id (uuid.UUID)
-        """
-
-        session = self._session
-
-        await self._refresh_token_crud.delete_refresh_token(
-            self._session, user_id=user_id
+        await self._refresh_token_crud.issue_refresh_token(
+            self._uow.session,
+            user_id=user_id,
+            token=refresh_token,
+            expires_at=self._refresh_token_expires_at(),
+            user_agent=user_agent,
+            ip_address=ip_address,
+            limit=settings.JWT_REFRESH_TOKENS_PER_USER,
         )
-        await session.commit()
-
-    async def _add_refresh_token(
-        self, user_id: uuid.UUID, token: uuid.UUID
-    ) -> tables.RefreshToken:
-        """Adds refresh token for user with user_id to db.
+        response.set_cookie("refresh_token", str(refresh_token), httponly=True)
 
-        Sets expires at.
+    @classmethod
+    def _refresh_token_expires_at(cls) -> datetime.datetime:
+        """Returns expiration datetime of refresh token created now.
 
-        Args:
-            user_id (uuid.UUID)
+        Returns:
+            datetime.datetime: naive utc datetime
         """
 
-        session = self._session
-
-        expires_at = datetime.datetime.utcnow() + datetime.timedelta(
+        return datetime.datetime.utcnow() + datetime.timedelta(
             seconds=settings.JWT_REFRESH_EXPIRES_IN
         )
 
-        refresh_token = self._refresh_token_crud.add_refresh_token(
-            session, user_id=user_id, token=token, expires_at=expires_at
-        )
-        await session.commit()
-
-        return refresh_token
-
     async def _add_user_to_db(
         self, user_create: models.UserCreate, password_hash: str
     ) -> tables.User:
-        """Writes user to db.
+        """Writes user to db without committing.
 
         Args:
             user_create (models.UserCreate)
@@ -423,7 +486,7 @@ class AuthService:
             tables.User: user orm model
         """
 
-        session = self._session
+        session = self._uow.session
 
         user_db = self._user_crud.add_user(
             session,
@@ -433,7 +496,7 @@ class AuthService:
             role=Role.USER,
         )
         try:
-            await session.commit()
+            await self._uow.flush()
         except sa.exc.IntegrityError:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="User already exists"
@@ -1,18 +1,31 @@
 from typing import List, Protocol
 
 from pizza_store import models
+from pizza_store.cache import CatalogSnapshot
 
 
 class ICategoryService(Protocol):
     """Category service interface"""
 
     async def get_categories(self) -> List[models.Category]:
-        """Returns list of categories from db.
+        """Returns list of categories from catalog cache.
 
         Returns:
             List[models.Category]
         """
 
+    async def get_categories_snapshot(
+        self, allow_stale: bool = True
+    ) -> CatalogSnapshot[models.Category]:
+        """Returns categories with their ETag from catalog cache.
+
+        Args:
+            allow_stale (bool): if False waits for reload of invalidated categories
+
+        Returns:
+            CatalogSnapshot[models.Category]
+        """
+
     async def add_category(
         self, category_create: models.CategoryCreate
     ) -> models.Category:
@@ -3,28 +3,38 @@ from typing import List
 import sqlalchemy as sa
 from fastapi import HTTPException, status
 from pizza_store import models
+from pizza_store.cache import CatalogCache, CatalogSnapshot
+from pizza_store.constants.cache import CATEGORIES_CACHE_KEY
 from pizza_store.db.crud import ICategoryCRUD
+from pizza_store.db.unit_of_work import UnitOfWork
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 
 class CategoryService:
     """Category service interface
 
     Example:
-        >>> service = CategoryService(session, category_crud)
+        >>> service = CategoryService(session, category_crud, catalog_cache)
         >>> await service.get_categories()
         [Category(id=1, name="Pizzas"), Category(id=2, name="Sushi")]
     """
 
-    def __init__(self, session: AsyncSession, category_crud: ICategoryCRUD) -> None:
-        self._session = session
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        category_crud: ICategoryCRUD,
+        catalog_cache: CatalogCache,
+    ) -> None:
+        self._uow = uow
         self._category_crud = category_crud
+        self._catalog_cache = catalog_cache
 
     async def get_categories(self) -> List[models.Category]:
-        """Returns list of categories from db.
+        """Returns list of categories from catalog cache.
 
         Example:
-            >>> service = CategoryService(session, category_crud)
+            >>> service = CategoryService(session, category_crud, catalog_cache)
             >>> await service.get_categories()
             [Category(id=1, name="Pizza"), Category(id=2, name="Sushi")]
 
@@ -32,13 +42,30 @@ class CategoryService:
             List[models.Category]
         """
 
-        db_categories = await self._category_crud.get_categories(self._session)
-        categories = [
-            models.Category(id=category.id, name=category.name)
-            for category in db_categories
-        ]
+        snapshot = await self.get_categories_snapshot()
+        return list(snapshot.items)
+
+    async def get_categories_snapshot(
+        self, allow_stale: bool = True
+    ) -> CatalogSnapshot[models.Category]:
+        """Returns categories with their ETag from catalog cache.
+
+        Example:
+            >>> service = CategoryService(session, category_crud, catalog_cache)
+            >>> snapshot = await service.get_categories_snapshot()
+            >>> snapshot.etag
+            '"9f2c4b7a1e0d8c6b5a3f2e1d0c9b8a7f"'
 
-        return categories
+        Args:
+            allow_stale (bool): if False waits for reload of invalidated categories
+
+        Returns:
+            CatalogSnapshot[models.Category]
+        """
+
+        return await self._catalog_cache.get(
+            CATEGORIES_CACHE_KEY, self._load_categories, allow_stale=allow_stale
+        )
 
     async def add_category(
         self, category_create: models.CategoryCreate
@@ -46,7 +73,7 @@ class CategoryService:
         """Creates category, add to db.
 
         Example:
-            >>> service = CategoryService(session, category_crud)
+            >>> service = CategoryService(session, category_crud, catalog_cache)
             >>> await service.add_category(category_create=CategoryCreate(name="Pizza"))
             Category(id=1, name="Pizza")
 
@@ -57,17 +84,20 @@ class CategoryService:
             models.Category: created category
         """
 
-        session = self._session
+        session = self._uow.session
 
         db_category = self._category_crud.add_category(
             session, name=category_create.name
         )
         try:
-            await session.commit()
+            await self._uow.flush()
         except sa.exc.IntegrityError:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="Category already exists"
             )
+        await self._catalog_cache.notify(session)
+        self._uow.after_commit(self._catalog_cache.invalidate)
+        await self._uow.commit()
 
         category = models.Category(id=db_category.id, name=db_category.name)
 
@@ -77,14 +107,36 @@ class CategoryService:
         """Deletes category from db.
 
         Example:
-            >>> service = CategoryService(session, category_crud)
+            >>> service = CategoryService(session, category_crud, catalog_cache)
             >>> await service.delete_category(id=1)
 
         Args:
             id (int): category id
         """
 
-        session = self._session
+        session = self._uow.session
 
         await self._category_crud.delete_category(session, id=id)
-        await session.commit()
+        await self._catalog_cache.notify(session)
+        self._uow.after_commit(self._catalog_cache.invalidate)
+        await self._uow.commit()
+
+    async def _load_categories(
+        self, session: AsyncSession
+    ) -> CatalogSnapshot[models.Category]:
+        """Fetches categories from db.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+
+        Returns:
+            CatalogSnapshot[models.Category]
+        """
+
+        db_categories = await self._category_crud.get_categories(session)
+        categories = [
+            models.Category(id=category.id, name=category.name)
+            for category in db_categories
+        ]
+
+        return await run_in_threadpool(CatalogSnapshot.from_items, categories)
@@ -0,0 +1,25 @@
+from typing import Union
+
+import pizza_store.db.models as tables
+from pizza_store import models
+from sqlalchemy.engine import Row
+
+
+def product_from_db(db_product: Union[tables.Product, Row]) -> models.Product:
+    """Converts product orm model or row to pydantic model.
+
+    Args:
+        db_product (Union[tables.Product, Row])
+
+    Returns:
+        models.Product
+    """
+
+    return models.Product(
+        id=db_product.id,
+        category_id=db_product.category_id,
+        name=db_product.name,
+        weight=db_product.weight,
+        price=db_product.price,
+        image=db_product.image,
+    )
@@ -0,0 +1,4 @@
+from pizza_store.services.menu.interface import IMenuService
+from pizza_store.services.menu.service import MenuService
+
+__all__ = ["IMenuService", "MenuService"]
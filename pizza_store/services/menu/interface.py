@@ -0,0 +1,27 @@
+from typing import List, Protocol
+
+from pizza_store import models
+from pizza_store.cache import CatalogSnapshot
+
+
+class IMenuService(Protocol):
+    """Menu service interface"""
+
+    async def get_menu(self) -> List[models.MenuCategory]:
+        """Returns categories with their products from catalog cache.
+
+        Returns:
+            List[models.MenuCategory]
+        """
+
+    async def get_menu_snapshot(
+        self, allow_stale: bool = True
+    ) -> CatalogSnapshot[models.MenuCategory]:
+        """Returns menu with its ETag from catalog cache.
+
+        Args:
+            allow_stale (bool): if False waits for reload of invalidated menu
+
+        Returns:
+            CatalogSnapshot[models.MenuCategory]
+        """
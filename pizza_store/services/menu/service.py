@@ -0,0 +1,80 @@
+from typing import List
+
+from pizza_store import models
+from pizza_store.cache import CatalogCache, CatalogSnapshot
+from pizza_store.constants.cache import MENU_CACHE_KEY
+from pizza_store.db.crud import ICategoryCRUD
+from pizza_store.services.converters import product_from_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+
+class MenuService:
+    """Menu service. Menu is categories with their products.
+
+    Example:
+        >>> service = MenuService(category_crud, catalog_cache)
+        >>> await service.get_menu()
+        [MenuCategory(id=1, name="Pizzas", products=[Product(id=1, category_id=1, name="Pepperoni", ...)])]
+    """
+
+    def __init__(
+        self, category_crud: ICategoryCRUD, catalog_cache: CatalogCache
+    ) -> None:
+        self._category_crud = category_crud
+        self._catalog_cache = catalog_cache
+
+    async def get_menu(self) -> List[models.MenuCategory]:
+        """Returns categories with their products from catalog cache.
+
+        Example:
+            >>> service = MenuService(category_crud, catalog_cache)
+            >>> await service.get_menu()
+            [MenuCategory(id=1, name="Pizzas", products=[Product(id=1, category_id=1, name="Pepperoni", ...)])]
+
+        Returns:
+            List[models.MenuCategory]
+        """
+
+        snapshot = await self.get_menu_snapshot()
+        return list(snapshot.items)
+
+    async def get_menu_snapshot(
+        self, allow_stale: bool = True
+    ) -> CatalogSnapshot[models.MenuCategory]:
+        """Returns menu with its ETag from catalog cache.
+
+        Args:
+            allow_stale (bool): if False waits for reload of invalidated menu
+
+        Returns:
+            CatalogSnapshot[models.MenuCategory]
+        """
+
+        return await self._catalog_cache.get(
+            MENU_CACHE_KEY, self._load_menu, allow_stale=allow_stale
+        )
+
+    async def _load_menu(
+        self, session: AsyncSession
+    ) -> CatalogSnapshot[models.MenuCategory]:
+        """Fetches menu from db in single query.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+
+        Returns:
+            CatalogSnapshot[models.MenuCategory]
+        """
+
+        db_categories = await self._category_crud.get_categories_with_products(session)
+        menu = [
+            models.MenuCategory(
+                id=category.id,
+                name=category.name,
+                products=[product_from_db(p) for p in category.products],
+            )
+            for category in db_categories
+        ]
+
+        return await run_in_threadpool(CatalogSnapshot.from_items, menu)
@@ -1,18 +1,124 @@
-from typing import Protocol
+from typing import AsyncIterator, Optional, Protocol, Sequence
 
 from pizza_store import models
+from pizza_store.cache import CatalogSnapshot
+from pizza_store.enums.catalog_format import CatalogFormat
+from pizza_store.enums.sort import ProductSort
 
 
 class IProductService(Protocol):
     """Product service interface"""
 
     async def get_products(self) -> list[models.Product]:
-        """Returns list of products from db.
+        """Returns list of products from catalog cache.
 
         Returns:
             list[models.Product]
         """
 
+    async def get_products_snapshot(
+        self, allow_stale: bool = True
+    ) -> CatalogSnapshot[models.Product]:
+        """Returns products with their ETag from catalog cache.
+
+        Args:
+            allow_stale (bool): if False waits for reload of invalidated products
+
+        Returns:
+            CatalogSnapshot[models.Product]
+        """
+
+    async def get_product(self, product_id: int) -> models.Product:
+        """Returns product by id from catalog cache.
+
+        Args:
+            product_id (int)
+
+        Raises:
+            HTTPException: will be raised 404 http error if product does not exist.
+
+        Returns:
+            models.Product
+        """
+
+    async def get_products_by_ids(self, ids: Sequence[int]) -> list[models.Product]:
+        """Returns products by ids from catalog cache.
+
+        Args:
+            ids (Sequence[int]): product ids
+
+        Raises:
+            HTTPException: will be raised 400 http error if more than
+                `MAX_PAGE_LIMIT` ids are passed.
+
+        Returns:
+            list[models.Product]: products in order of `ids`,
+                not existing products are omitted
+        """
+
+    async def get_products_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: ProductSort = ProductSort.ID,
+        category_id: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> models.ProductPage:
+        """Returns filtered page of products ordered by `sort` key from db.
+
+        Args:
+            limit (int): max amount of products
+            cursor (Optional[str]): `next` cursor of previous page. If None returns first page.
+            sort (ProductSort): sort key
+            category_id (Optional[int]): if not None returns only products of category
+            min_price (Optional[int]): min price in cents inclusive
+            max_price (Optional[int]): max price in cents inclusive
+
+        Raises:
+            HTTPException: will be raised 400 http error if cursor is malformed
+                or was created for another sort.
+
+        Returns:
+            models.ProductPage
+        """
+
+    async def search_products(self, query: str, limit: int) -> list[models.Product]:
+        """Returns products which names fuzzy match `query` from db.
+
+        Args:
+            query (str): search query
+            limit (int): max amount of products
+
+        Returns:
+            list[models.Product]: most similar first
+        """
+
+    async def autocomplete_products(
+        self, prefix: str, limit: int
+    ) -> list[models.Product]:
+        """Returns products which names have word starting with `prefix`.
+
+        Served from in-memory index of catalog cache.
+
+        Args:
+            prefix (str)
+            limit (int): max amount of products
+
+        Returns:
+            list[models.Product]
+        """
+
+    def export_products(self, format: CatalogFormat) -> AsyncIterator[str]:
+        """Streams all products from db rendered in `format`.
+
+        Args:
+            format (CatalogFormat)
+
+        Yields:
+            str: chunk of export
+        """
+
     async def add_product(self, product_create: models.ProductCreate) -> models.Product:
         """Add product to db.
 
@@ -23,6 +129,22 @@ class IProductService(Protocol):
             models.Product: created product
         """
 
+    async def import_products(
+        self, product_import: models.ProductImport
+    ) -> models.ProductImportReport:
+        """Adds products from manifest to db with single statement.
+
+        Args:
+            product_import (models.ProductImport): manifest and images archive
+
+        Raises:
+            HTTPException: will be raised 400 http error if manifest
+                or archive can not be read or manifest has too many rows.
+
+        Returns:
+            models.ProductImportReport
+        """
+
     async def delete_product(self, product_id: int) -> None:
         """Deletes product from db.
 
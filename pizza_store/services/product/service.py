@@ -1,34 +1,94 @@
+import codecs
+import csv
+import functools
+import io
+import json
+import zipfile
 from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
+import pizza_store.db.models as tables
 import sqlalchemy
 from fastapi import HTTPException, status
 from pizza_store import models
+from pizza_store.cache import CatalogCache, CatalogSnapshot
+from pizza_store.constants.cache import (
+    AUTOCOMPLETE_CACHE_KEY,
+    PRODUCT_CACHE_PREFIX,
+    PRODUCTS_CACHE_KEY,
+)
+from pizza_store.constants.export import EXPORT_FETCH_SIZE, PRODUCT_EXPORT_FIELDS
 from pizza_store.constants.files import IMAGE_READ_BUFFER
+from pizza_store.constants.imports import IMPORT_MAX_ROWS
+from pizza_store.constants.pagination import (
+    MAX_PAGE_LIMIT,
+    PRODUCT_SORT_KEY_RANGES,
+    PRODUCT_SORT_KEYS,
+)
 from pizza_store.constants.paths import IMAGE_FOLDER_PATH
 from pizza_store.db.crud import IProductCRUD
-from pizza_store.utils.files import get_binary_file_hash, write_binary_file
+from pizza_store.db.unit_of_work import UnitOfWork
+from pizza_store.enums.catalog_format import CatalogFormat
+from pizza_store.enums.import_status import ImportStatus
+from pizza_store.enums.sort import ProductSort
+from pizza_store.services.converters import product_from_db
+from pizza_store.utils.cursor import decode_cursor, encode_cursor
+from pizza_store.utils.files import (
+    extract_zip_member,
+    get_binary_file_hash,
+    get_zip_member_hash,
+    write_binary_file,
+)
+from pizza_store.utils.prefix_index import PrefixIndex
+from pydantic import ValidationError
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+
+class _ImportRow(NamedTuple):
+    row: int
+    product: models.ProductImportRow
+    image_path: Path
 
 
 class ProductService:
     """Product service interface
 
     Example:
-        >>> service = ProductService(session, product_crud)
+        >>> service = ProductService(session, product_crud, catalog_cache)
         >>> await service.get_products()
         [models.Product(id=1, category_id=1, name="Pizza", weight=500, price=1000, image="/static/img/pizza.jpg"),
          models.Product(id=2, category_id=2, name="Sushi", weight=500, price=1000, image="/static/img/sushi.jpg")]
     """
 
-    def __init__(self, session: AsyncSession, product_crud: IProductCRUD) -> None:
-        self._session = session
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        product_crud: IProductCRUD,
+        catalog_cache: CatalogCache,
+    ) -> None:
+        self._uow = uow
         self._product_crud = product_crud
+        self._catalog_cache = catalog_cache
+        # Batch loader is kept by catalog cache, so it must not hold the service
+        self._products_by_ids_loader = functools.partial(
+            self._load_products_by_ids, product_crud
+        )
 
     async def get_products(self) -> list[models.Product]:
-        """Returns list of products from db.
+        """Returns list of products from catalog cache.
 
         Example:
-            >>> service = ProductService(session, product_crud)
+            >>> service = ProductService(session, product_crud, catalog_cache)
             >>> await service.get_products()
             [models.Product(id=1, category_id=1, name="Pizza", weight=500, price=1000, image="/static/img/pizza.jpg"),
              models.Product(id=2, category_id=2, name="Sushi", weight=500, price=1000, image="/static/img/sushi.jpg")]
@@ -37,20 +97,235 @@ class ProductService:
             list[models.Product]
         """
 
-        db_products = await self._product_crud.get_products(self._session)
-        products = [
-            models.Product(
-                id=p.id,
-                category_id=p.category_id,
-                name=p.name,
-                weight=p.weight,
-                price=p.price,
-                image=p.image,
+        snapshot = await self.get_products_snapshot()
+        return list(snapshot.items)
+
+    async def get_products_snapshot(
+        self, allow_stale: bool = True
+    ) -> CatalogSnapshot[models.Product]:
+        """Returns products with their ETag from catalog cache.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> snapshot = await service.get_products_snapshot()
+            >>> snapshot.etag
+            '"3b1e9c0f4a7d2e6b8c5f1a0d9e7b6c4a"'
+
+        Args:
+            allow_stale (bool): if False waits for reload of invalidated products
+
+        Returns:
+            CatalogSnapshot[models.Product]
+        """
+
+        return await self._catalog_cache.get(
+            PRODUCTS_CACHE_KEY, self._load_products, allow_stale=allow_stale
+        )
+
+    async def get_product(self, product_id: int) -> models.Product:
+        """Returns product by id from catalog cache.
+
+        Concurrent lookups of products missing in cache are fetched
+        from db with one query.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> await service.get_product(product_id=1)
+            models.Product(id=1, category_id=1, name="Pizza", weight=500, price=1000, image="/static/img/pizza.jpg")
+
+        Args:
+            product_id (int)
+
+        Raises:
+            HTTPException: will be raised 404 http error if product does not exist.
+
+        Returns:
+            models.Product
+        """
+
+        products = await self._catalog_cache.get_items(
+            PRODUCT_CACHE_PREFIX, [product_id], self._products_by_ids_loader
+        )
+        if product_id not in products:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Product not found."
+            )
+
+        return products[product_id]
+
+    async def get_products_by_ids(self, ids: Sequence[int]) -> list[models.Product]:
+        """Returns products by ids from catalog cache.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> await service.get_products_by_ids(ids=[2, 99, 1])
+            [models.Product(id=2, category_id=2, name="Sushi", weight=500, price=1000, image="/static/img/sushi.jpg"),
+             models.Product(id=1, category_id=1, name="Pizza", weight=500, price=1000, image="/static/img/pizza.jpg")]
+
+        Args:
+            ids (Sequence[int]): product ids
+
+        Raises:
+            HTTPException: will be raised 400 http error if more than
+                `MAX_PAGE_LIMIT` ids are passed.
+
+        Returns:
+            list[models.Product]: products in order of `ids`,
+                not existing products are omitted
+        """
+
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > MAX_PAGE_LIMIT:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_PAGE_LIMIT} ids can be requested.",
+            )
+
+        products = await self._catalog_cache.get_items(
+            PRODUCT_CACHE_PREFIX, ids, self._products_by_ids_loader
+        )
+
+        return [products[id] for id in ids if id in products]
+
+    async def get_products_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: ProductSort = ProductSort.ID,
+        category_id: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> models.ProductPage:
+        """Returns filtered page of products ordered by `sort` key from db.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> page = await service.get_products_page(limit=1, sort=ProductSort.PRICE)
+            >>> page
+            ProductPage(items=[models.Product(id=1, category_id=1, name="Pizza", weight=500, price=1000, image="/static/img/pizza.jpg")], next="WyJwcmljZSIsMTAwMCwxXQ")
+            >>> await service.get_products_page(limit=1, cursor=page.next, sort=ProductSort.PRICE)
+            ProductPage(items=[models.Product(id=2, category_id=2, name="Sushi", weight=500, price=1200, image="/static/img/sushi.jpg")], next=None)
+
+        Args:
+            limit (int): max amount of products
+            cursor (Optional[str]): `next` cursor of previous page. If None returns first page.
+            sort (ProductSort): sort key
+            category_id (Optional[int]): if not None returns only products of category
+            min_price (Optional[int]): min price in cents inclusive
+            max_price (Optional[int]): max price in cents inclusive
+
+        Raises:
+            HTTPException: will be raised 400 http error if cursor is malformed,
+                its values are out of column range or it was created for another sort.
+
+        Returns:
+            models.ProductPage
+        """
+
+        key_fields = PRODUCT_SORT_KEYS[sort]
+        after = self._decode_page_cursor(cursor, sort) if cursor is not None else None
+
+        # Fetch one extra product to know whether next page exists
+        db_products = await self._product_crud.get_products_page(
+            self._uow.session,
+            limit=limit + 1,
+            after=after,
+            sort=sort,
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+        )
+        products = [product_from_db(p) for p in db_products[:limit]]
+
+        next_cursor = None
+        if len(db_products) > limit:
+            last = products[-1]
+            next_cursor = encode_cursor(
+                [sort.value, *(getattr(last, field) for field in key_fields)]
             )
-            for p in db_products
-        ]
 
-        return products
+        return models.ProductPage(items=products, next=next_cursor)
+
+    async def search_products(self, query: str, limit: int) -> list[models.Product]:
+        """Returns products which names fuzzy match `query` from db.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> await service.search_products(query="peperoni", limit=10)
+            [models.Product(id=1, category_id=1, name="Pepperoni", weight=500, price=1000, image="/static/img/pepperoni.jpg")]
+
+        Args:
+            query (str): search query
+            limit (int): max amount of products
+
+        Returns:
+            list[models.Product]: most similar first
+        """
+
+        db_products = await self._product_crud.search_products(
+            self._uow.session, query=query, limit=limit
+        )
+
+        return [product_from_db(p) for p in db_products]
+
+    async def autocomplete_products(
+        self, prefix: str, limit: int
+    ) -> list[models.Product]:
+        """Returns products which names have word starting with `prefix`.
+
+        Served from in-memory index of catalog cache, never queries db
+        unless catalog is not loaded yet.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> await service.autocomplete_products(prefix="pep", limit=10)
+            [models.Product(id=1, category_id=1, name="Pepperoni", weight=500, price=1000, image="/static/img/pepperoni.jpg")]
+
+        Args:
+            prefix (str)
+            limit (int): max amount of products
+
+        Returns:
+            list[models.Product]
+        """
+
+        index = await self._catalog_cache.get(
+            AUTOCOMPLETE_CACHE_KEY, self._load_autocomplete_index
+        )
+
+        return index.search(prefix, limit=limit)
+
+    async def export_products(self, format: CatalogFormat) -> AsyncIterator[str]:
+        """Streams all products from db rendered in `format`.
+
+        Products are fetched through server side cursor in batches of
+        `EXPORT_FETCH_SIZE` rows, so memory usage does not depend on
+        catalog size. One chunk is yielded per batch.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> async for chunk in service.export_products(CatalogFormat.CSV):
+            ...     print(chunk, end="")
+            id,category_id,name,weight,price,image
+            1,1,Pizza,500,1000,/static/img/pizza.jpg
+
+        Args:
+            format (CatalogFormat)
+
+        Yields:
+            str: chunk of export
+        """
+
+        if format is CatalogFormat.CSV:
+            yield self._render_csv([PRODUCT_EXPORT_FIELDS])
+
+        async for rows in self._product_crud.stream_products(
+            self._uow.session, fetch_size=EXPORT_FETCH_SIZE
+        ):
+            if format is CatalogFormat.CSV:
+                yield self._render_csv(rows)
+            else:
+                yield self._render_ndjson(rows)
 
     async def add_product(self, product_create: models.ProductCreate) -> models.Product:
         """Add product to db.
@@ -62,7 +337,7 @@ class ProductService:
             models.Product: created product
         """
 
-        session = self._session
+        session = self._uow.session
         image_file = product_create.image
 
         image_hash = await get_binary_file_hash(image_file, IMAGE_READ_BUFFER)
@@ -79,12 +354,15 @@ class ProductService:
             image=str(image_path),
         )
         try:
-            await session.commit()
+            await self._uow.flush()
         except sqlalchemy.exc.IntegrityError:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Product already exists or category does not exists.",
             )
+        await self._catalog_cache.notify(session)
+        self._uow.after_commit(self._catalog_cache.invalidate)
+        await self._uow.commit()
 
         if not image_path.exists():
             await image_file.seek(0)
@@ -92,29 +370,383 @@ class ProductService:
                 path=image_path, file=image_file, read_buffer=IMAGE_READ_BUFFER
             )
 
-        product = models.Product(
-            id=db_product.id,
-            category_id=db_product.category_id,
-            name=db_product.name,
-            weight=db_product.weight,
-            price=db_product.price,
-            image=db_product.image,
-        )
+        product = product_from_db(db_product)
 
         return product
 
+    async def import_products(
+        self, product_import: models.ProductImport
+    ) -> models.ProductImportReport:
+        """Adds products from manifest to db with single statement.
+
+        Invalid rows and rows which product can not be added are reported
+        and do not fail the import. Images of added products are extracted
+        from archive after commit.
+
+        Example:
+            >>> service = ProductService(session, product_crud, catalog_cache)
+            >>> await service.import_products(product_import)
+            ProductImportReport(created=1, skipped=1, invalid=0, results=[
+                ProductImportResult(row=1, status=ImportStatus.CREATED, product_id=3, detail=None),
+                ProductImportResult(row=2, status=ImportStatus.SKIPPED, product_id=None, detail="Product already exists or category does not exist.")])
+
+        Args:
+            product_import (models.ProductImport): manifest and images archive
+
+        Raises:
+            HTTPException: will be raised 400 http error if manifest
+                or archive can not be read or manifest has too many rows.
+
+        Returns:
+            models.ProductImportReport
+        """
+
+        session = self._uow.session
+
+        rows, results = await run_in_threadpool(self._read_import, product_import)
+
+        db_products = []
+        if rows:
+            db_products = await self._product_crud.add_products(
+                session,
+                [{**row.product.dict(), "image": str(row.image_path)} for row in rows],
+            )
+        if db_products:
+            await self._catalog_cache.notify(session)
+            self._uow.after_commit(self._catalog_cache.invalidate)
+            await self._uow.commit()
+
+        # Manifest can repeat name, only its first row is created
+        product_ids = {p.name: p.id for p in db_products}
+        created_rows = []
+        for row in rows:
+            product_id = product_ids.pop(row.product.name, None)
+            if product_id is not None:
+                created_rows.append(row)
+                results.append(
+                    models.ProductImportResult(
+                        row=row.row, status=ImportStatus.CREATED, product_id=product_id
+                    )
+                )
+            else:
+                results.append(
+                    models.ProductImportResult(
+                        row=row.row,
+                        status=ImportStatus.SKIPPED,
+                        detail="Product already exists or category does not exist.",
+                    )
+                )
+
+        await run_in_threadpool(
+            self._extract_images, product_import.images.file, created_rows
+        )
+
+        results.sort(key=lambda result: result.row)
+        statuses = [result.status for result in results]
+        return models.ProductImportReport(
+            created=statuses.count(ImportStatus.CREATED),
+            skipped=statuses.count(ImportStatus.SKIPPED),
+            invalid=statuses.count(ImportStatus.INVALID),
+            results=results,
+        )
+
     async def delete_product(self, product_id: int) -> None:
         """Deletes product from db.
 
         Example:
-            >>> service = ProductService(session, product_crud)
+            >>> service = ProductService(session, product_crud, catalog_cache)
             >>> await service.delete_product(product_id=1)
 
         Args:
             product_id (int)
         """
 
-        session = self._session
+        session = self._uow.session
 
         await self._product_crud.delete_product(session, id=product_id)
-        await session.commit()
+        await self._catalog_cache.notify(session)
+        self._uow.after_commit(self._catalog_cache.invalidate)
+        await self._uow.commit()
+
+    async def _load_products(
+        self, session: AsyncSession
+    ) -> CatalogSnapshot[models.Product]:
+        """Fetches products from db.
+
+        Args:
+            session (AsyncSession): sqlalchemy session
+
+        Returns:
+            CatalogSnapshot[models.Product]
+        """
+
+        db_products = await self._product_crud.get_products(session)
+        products = [product_from_db(p) for p in db_products]
+
+        return await run_in_threadpool(CatalogSnapshot.from_items, products)
+
+    @staticmethod
+    async def _load_products_by_ids(
+        product_crud: IProductCRUD, session: AsyncSession, ids: list[int]
+    ) -> dict[int, models.Product]:
+        """Fetches products by ids from db.
+
+        Batch loader of catalog cache is shared by requests of the worker,
+        so it does not hold service of the request, its unit of work or session.
+
+        Args:
+            product_crud (IProductCRUD)
+            session (AsyncSession): sqlalchemy session
+            ids (list[int])
+
+        Returns:
+            dict[int, models.Product]: products by id
+        """
+
+        db_products = await product_crud.get_products_by_ids(session, ids=ids)
+
+        return {p.id: product_from_db(p) for p in db_products}
+
+    async def _load_autocomplete_index(
+        self, session: AsyncSession
+    ) -> PrefixIndex[models.Product]:
+        """Builds autocomplete index from current products.
+
+        Args:
+            session (AsyncSession): unused, products are taken from catalog cache
+
+        Returns:
+            PrefixIndex[models.Product]
+        """
+
+        # Index must not be built from stale products,
+        # otherwise it stays stale until next catalog change
+        snapshot = await self.get_products_snapshot(allow_stale=False)
+
+        return PrefixIndex((p.name, p) for p in snapshot.items)
+
+    @staticmethod
+    def _decode_page_cursor(cursor: str, sort: ProductSort) -> list[Any]:
+        """Decodes page cursor to sort key of last product.
+
+        Args:
+            cursor (str)
+            sort (ProductSort): sort of requested page
+
+        Raises:
+            HTTPException: will be raised 400 http error if cursor is malformed
+                or was created for another sort.
+
+        Returns:
+            list[Any]: sort key
+        """
+
+        exception = HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+        try:
+            cursor_sort, *after = decode_cursor(cursor)
+        except ValueError:
+            raise exception
+
+        key_fields = PRODUCT_SORT_KEYS[sort]
+        if cursor_sort != sort.value or len(after) != len(key_fields):
+            raise exception
+        for field, value in zip(key_fields, after):
+            if not isinstance(value, models.Product.__fields__[field].type_):
+                raise exception
+            if field in PRODUCT_SORT_KEY_RANGES:
+                low, high = PRODUCT_SORT_KEY_RANGES[field]
+                if isinstance(value, bool) or not low <= value <= high:
+                    raise exception
+
+        return after
+
+    @classmethod
+    def _read_import(
+        cls, product_import: models.ProductImport
+    ) -> tuple[list[_ImportRow], list[models.ProductImportResult]]:
+        """Validates manifest rows and hashes their images.
+
+        NOTE: blocking, run in threadpool.
+
+        Args:
+            product_import (models.ProductImport)
+
+        Raises:
+            HTTPException: will be raised 400 http error if manifest
+                or archive can not be read or manifest has too many rows.
+
+        Returns:
+            tuple[list[_ImportRow], list[models.ProductImportResult]]:
+                valid rows and results of invalid rows
+        """
+
+        try:
+            archive = zipfile.ZipFile(product_import.images.file)
+        except zipfile.BadZipFile:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Images must be a zip archive.",
+            )
+
+        rows: list[_ImportRow] = []
+        results: list[models.ProductImportResult] = []
+        with archive:
+            try:
+                for row, record in enumerate(
+                    cls._read_manifest(
+                        product_import.manifest.file, product_import.format
+                    ),
+                    start=1,
+                ):
+                    if row > IMPORT_MAX_ROWS:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Manifest must have at most {IMPORT_MAX_ROWS} rows.",
+                        )
+
+                    try:
+                        import_row = cls._prepare_import_row(archive, row, record)
+                    except ValueError as e:
+                        results.append(
+                            models.ProductImportResult(
+                                row=row, status=ImportStatus.INVALID, detail=str(e)
+                            )
+                        )
+                    else:
+                        rows.append(import_row)
+            except (UnicodeDecodeError, csv.Error):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Manifest must be UTF-8 encoded NDJSON or CSV.",
+                )
+
+        return rows, results
+
+    @staticmethod
+    def _read_manifest(file: IO[bytes], format: CatalogFormat) -> Iterator[Any]:
+        """Reads manifest records.
+
+        Malformed NDJSON line is returned as None.
+
+        Args:
+            file (IO[bytes]): manifest file
+            format (CatalogFormat)
+
+        Raises:
+            UnicodeDecodeError: will be raised if manifest is not UTF-8 encoded
+            csv.Error: will be raised if CSV manifest is malformed
+
+        Yields:
+            Any: record
+        """
+
+        lines = codecs.iterdecode(file, "utf-8-sig")
+        if format is CatalogFormat.CSV:
+            yield from csv.DictReader(lines)
+            return
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+
+    @staticmethod
+    def _prepare_import_row(
+        archive: zipfile.ZipFile, row: int, record: Any
+    ) -> _ImportRow:
+        """Validates manifest record and computes path of its image.
+
+        NOTE: blocking, run in threadpool.
+
+        Args:
+            archive (zipfile.ZipFile): images archive
+            row (int): row number
+            record (Any): manifest record
+
+        Raises:
+            ValueError: will be raised if record is invalid
+
+        Returns:
+            _ImportRow
+        """
+
+        if not isinstance(record, dict):
+            raise ValueError("Row must be a JSON object.")
+
+        try:
+            product = models.ProductImportRow.parse_obj(record)
+        except ValidationError as e:
+            raise ValueError(
+                "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                    for error in e.errors()
+                )
+            )
+
+        try:
+            image_hash = get_zip_member_hash(archive, product.image, IMAGE_READ_BUFFER)
+        except KeyError:
+            raise ValueError(f"Image {product.image} not found in archive.")
+
+        image_path = IMAGE_FOLDER_PATH / image_hash
+        image_path = image_path.with_suffix(Path(product.image).suffix)
+        if len(str(image_path)) > tables.Product.image.type.length:
+            raise ValueError(f"Image {product.image} has too long extension.")
+
+        return _ImportRow(row=row, product=product, image_path=image_path)
+
+    @staticmethod
+    def _extract_images(file: IO[bytes], rows: Sequence[_ImportRow]) -> None:
+        """Extracts images of rows from archive if they are not on disk yet.
+
+        NOTE: blocking, run in threadpool.
+
+        Args:
+            file (IO[bytes]): images archive
+            rows (Sequence[_ImportRow])
+        """
+
+        with zipfile.ZipFile(file) as archive:
+            for row in rows:
+                if not row.image_path.exists():
+                    extract_zip_member(
+                        archive, row.product.image, row.image_path, IMAGE_READ_BUFFER
+                    )
+
+    @staticmethod
+    def _render_csv(rows: Sequence[Sequence[Any]]) -> str:
+        """Renders rows as CSV lines.
+
+        Args:
+            rows (Sequence[Sequence[Any]])
+
+        Returns:
+            str
+        """
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _render_ndjson(rows: Sequence[Row]) -> str:
+        """Renders product rows as newline delimited JSON objects.
+
+        Args:
+            rows (Sequence[Row])
+
+        Returns:
+            str
+        """
+
+        return "".join(
+            json.dumps(row._asdict(), ensure_ascii=False, separators=(",", ":")) + "\n"
+            for row in rows
+        )
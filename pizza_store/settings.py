@@ -1,19 +1,49 @@
-from pydantic import BaseSettings
+from typing import Optional
+
+from pizza_store.enums.password_hash_scheme import PasswordHashScheme
+from pydantic import BaseSettings, Field
 
 
 class Settings(BaseSettings):
     SERVER_HOST: str
     SERVER_PORT: int
+    SERVER_WORKERS: Optional[int] = None
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRES_IN: int
     JWT_REFRESH_EXPIRES_IN: int
+    JWT_CACHE_SIZE: int = 1024
+    JWT_REFRESH_TOKENS_PER_USER: int = Field(5, ge=1)
+    PASSWORD_HASH_WORKERS: int = 1
+    PASSWORD_HASH_QUEUE_SIZE: int = 8
+    PASSWORD_HASH_METRICS_INTERVAL: Optional[float] = 60.0
+    PASSWORD_HASH_SCHEME: PasswordHashScheme = PasswordHashScheme.BCRYPT
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 2
+    PASSWORD_ARGON2_MEMORY_COST: int = 19_456
+    PASSWORD_ARGON2_PARALLELISM: int = 1
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_HOST: str
     POSTGRES_PORT: int
+    POSTGRES_REPLICA_DSN: Optional[str] = None
+    POSTGRES_REPLICA_STICKINESS: float = 5.0
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 500
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_WARMUP: Optional[int] = None
+    POSTGRES_CONNECTION_BUDGET: Optional[int] = None
+    POSTGRES_PGBOUNCER: bool = False
+    POSTGRES_LISTEN_DSN: Optional[str] = None
+
+    SQL_ECHO: bool = False
+    SQL_SAMPLE_RATE: float = 0.0
+    SQL_SLOW_THRESHOLD: float = 0.5
+    SQL_EXPLAIN_SLOW: bool = False
 
 
 settings = Settings(_env_file=".env", _env_file_encoding="utf-8")
@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+from typing import Any, Sequence
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes sort key values of last page item to opaque cursor.
+
+    Example:
+        >>> encode_cursor([42])
+        'WzQyXQ'
+
+    Args:
+        values (Sequence[Any]): json serializable sort key values
+
+    Returns:
+        str: url safe cursor
+    """
+
+    data = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decodes cursor created by `encode_cursor`.
+
+    Example:
+        >>> decode_cursor("WzQyXQ")
+        [42]
+
+    Args:
+        cursor (str)
+
+    Raises:
+        ValueError: if cursor is malformed
+
+    Returns:
+        list[Any]: sort key values
+    """
+
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if not isinstance(values, list):
+        raise ValueError("Malformed cursor")
+
+    return values
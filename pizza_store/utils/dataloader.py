@@ -0,0 +1,99 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoad = Callable[[list[K]], Awaitable[Mapping[K, V]]]
+
+
+class _Batch(Generic[K, V]):
+    def __init__(self) -> None:
+        self.keys: Dict[K, None] = {}
+        self.future: "asyncio.Future[Mapping[K, V]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesces loads requested within one event loop iteration into one batch.
+
+    First load of iteration schedules dispatch of the batch with `call_soon`,
+    so every task which is ready in the same iteration adds its keys
+    to this batch. Repeated keys are loaded once. `batch_load` omits keys
+    which values do not exist from its result.
+
+    Example:
+        >>> loader = DataLoader(load_products_by_ids)
+        >>> await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))  # one batch_load([1, 2])
+        [Product(id=1, ...), Product(id=2, ...), Product(id=1, ...)]
+    """
+
+    def __init__(self, batch_load: BatchLoad[K, V]) -> None:
+        self._batch_load = batch_load
+        self._batch: Optional[_Batch[K, V]] = None
+
+    async def load(self, key: K) -> Optional[V]:
+        """Returns value of `key`.
+
+        Args:
+            key (K)
+
+        Returns:
+            Optional[V]: if None value does not exist
+        """
+
+        values = await self.load_many([key])
+        return values.get(key)
+
+    async def load_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """Returns values of `keys`.
+
+        Args:
+            keys (Iterable[K])
+
+        Returns:
+            Dict[K, V]: keys which values do not exist are omitted
+        """
+
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+            asyncio.get_running_loop().call_soon(self._dispatch)
+        batch.keys.update(dict.fromkeys(keys))
+
+        # Shield shared batch from cancellation of a single reader
+        values = await asyncio.shield(batch.future)
+
+        return {key: values[key] for key in keys if key in values}
+
+    def _dispatch(self) -> None:
+        """Starts loading of current batch. New loads go to next batch."""
+
+        batch, self._batch = self._batch, None
+        if batch is not None:
+            asyncio.create_task(self._load(batch))
+
+    async def _load(self, batch: _Batch[K, V]) -> None:
+        try:
+            values = await self._batch_load(list(batch.keys))
+        except Exception as e:
+            batch.future.set_exception(e)
+            # Readers may be cancelled, do not log unretrieved exception
+            batch.future.exception()
+        else:
+            batch.future.set_result(values)
@@ -1,4 +1,6 @@
 import hashlib
+import shutil
+import zipfile
 from pathlib import Path
 
 import aiofiles
@@ -42,3 +44,48 @@ async def write_binary_file(path: Path, file: UploadFile, read_buffer: int) -> N
         while data:
             await dst_file.write(data)
             data = await file.read(read_buffer)
+
+
+def get_zip_member_hash(archive: zipfile.ZipFile, name: str, read_buffer: int) -> str:
+    """Read archive member and compute hash.
+
+    NOTE: blocking, run in threadpool.
+
+    Args:
+        archive (zipfile.ZipFile)
+        name (str): member name
+        read_buffer (int): max bytes for read
+
+    Raises:
+        KeyError: will be raised if archive has no member `name`
+
+    Returns:
+        str: computed hash
+    """
+
+    file_hash = hashlib.sha256()
+    with archive.open(name) as file:
+        data = file.read(read_buffer)
+        while data:
+            file_hash.update(data)
+            data = file.read(read_buffer)
+
+    return file_hash.hexdigest()
+
+
+def extract_zip_member(
+    archive: zipfile.ZipFile, name: str, path: Path, read_buffer: int
+) -> None:
+    """Writes archive member to disk.
+
+    NOTE: blocking, run in threadpool.
+
+    Args:
+        archive (zipfile.ZipFile)
+        name (str): member name
+        path (Path): future file path
+        read_buffer (int): max bytes for read
+    """
+
+    with archive.open(name) as file, open(path, "wb") as dst_file:
+        shutil.copyfileobj(file, dst_file, read_buffer)
@@ -0,0 +1,101 @@
+import ipaddress
+from typing import Dict, Iterable, Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Returns True if `If-None-Match` header value matches `etag`.
+
+    Uses weak comparison as RFC 7232 requires for `If-None-Match`.
+
+    Example:
+        >>> etag_matches('"abc", W/"def"', '"def"')
+        True
+
+    Args:
+        if_none_match (Optional[str]): `If-None-Match` header value
+        etag (str): current entity tag
+
+    Returns:
+        bool
+    """
+
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def choose_encoding(
+    accept_encoding: Optional[str], encodings: Iterable[str]
+) -> Optional[str]:
+    """Chooses content encoding from `encodings` preferred by client.
+
+    On equal quality earlier encoding from `encodings` wins.
+
+    Example:
+        >>> choose_encoding("gzip, br;q=0.9", ["br", "gzip"])
+        'gzip'
+        >>> choose_encoding("deflate", ["br", "gzip"]) is None
+        True
+
+    Args:
+        accept_encoding (Optional[str]): `Accept-Encoding` header value
+        encodings (Iterable[str]): available encodings in server preference order
+
+    Returns:
+        Optional[str]: encoding or None for identity
+    """
+
+    if not accept_encoding:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        param, _, value = params.partition("=")
+        if param.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def client_ip_address(host: Optional[str]) -> Optional[str]:
+    """Returns client host if it is ip address, so it can be stored as such.
+
+    Example:
+        >>> client_ip_address("127.0.0.1")
+        '127.0.0.1'
+        >>> client_ip_address("testclient") is None
+        True
+
+    Args:
+        host (Optional[str]): client host of connection
+
+    Returns:
+        Optional[str]
+    """
+
+    if host is None:
+        return None
+
+    try:
+        return str(ipaddress.ip_address(host))
+    except ValueError:
+        return None
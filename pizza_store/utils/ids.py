@@ -0,0 +1,76 @@
+import datetime
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Generates time ordered UUID version 7 (RFC 9562).
+
+    First 48 bits are unix time in milliseconds and next 12 bits are
+    fraction of millisecond, other 62 bits are random from `os.urandom`.
+    Ids are strictly increasing within process: if clock did not advance
+    since previous id, fraction of previous id is incremented and used as
+    counter, carrying into milliseconds (RFC 9562, section 6.2). Random bits
+    are always fresh, so id can not be guessed from previous one. B-tree
+    inserts always go to the rightmost page of index, which is split full
+    instead of in half.
+
+    Example:
+        >>> uuid7()
+        UUID('01920f3b-6f4a-7c3e-9d2b-5a8f0e4c7b21')
+        >>> uuid7().version
+        7
+
+    Returns:
+        uuid.UUID
+    """
+
+    global _last
+
+    timestamp_ns = time.time_ns()
+    timestamp_ms, fraction_ns = divmod(timestamp_ns, 1_000_000)
+    # 48 bits of ms and 12 bits of ms fraction
+    timestamp = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 12
+    timestamp |= fraction_ns * 4096 // 1_000_000
+    random_bits = int.from_bytes(os.urandom(8), "big") >> 2
+
+    with _lock:
+        if timestamp <= _last:
+            timestamp = _last + 1
+        _last = timestamp
+
+    return uuid.UUID(
+        int=(timestamp >> 12 << 80)  # ms
+        | (0x7 << 76)  # version
+        | ((timestamp & 0xFFF) << 64)  # ms fraction
+        | (0b10 << 62)  # variant
+        | random_bits  # random
+    )
+
+
+def min_uuid7(timestamp: datetime.datetime) -> uuid.UUID:
+    """Returns UUID which is less than every uuid7 generated since `timestamp`.
+
+    Every uuid7 generated before `timestamp` is less than it, so a pair
+    of these bounds selects ids generated within time range.
+
+    Example:
+        >>> min_uuid7(datetime.datetime(2026, 10, 18))
+        UUID('01a14c4e-e000-0000-0000-000000000000')
+
+    Args:
+        timestamp (datetime.datetime): naive utc datetime, precise to milliseconds
+
+    Returns:
+        uuid.UUID
+    """
+
+    timestamp_ms = (timestamp - datetime.datetime(1970, 1, 1)) // datetime.timedelta(
+        milliseconds=1
+    )
+    return uuid.UUID(int=(timestamp_ms & 0xFFFF_FFFF_FFFF) << 80)
@@ -0,0 +1,61 @@
+import bisect
+from typing import Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class PrefixIndex(Generic[T]):
+    """Immutable in-memory index for prefix autocomplete.
+
+    Every word of a key is indexed, so "pep" finds "Spicy Pepperoni".
+    Lookup is a binary search over sorted words.
+
+    Example:
+        >>> index = PrefixIndex([("Spicy Pepperoni", 1), ("Pepsi", 2), ("Tea", 3)])
+        >>> index.search("pep", limit=10)
+        [1, 2]
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, T]]) -> None:
+        entries: List[Tuple[str, int]] = []
+        self._values: List[T] = []
+        for position, (key, value) in enumerate(items):
+            self._values.append(value)
+            words = key.casefold().split()
+            # Index full key and every suffix starting at word boundary
+            for i in range(len(words)):
+                entries.append((" ".join(words[i:]), position))
+        entries.sort()
+        self._words = [word for word, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def search(self, prefix: str, limit: int) -> List[T]:
+        """Returns values which keys have word starting with `prefix`.
+
+        Args:
+            prefix (str)
+            limit (int): max amount of values
+
+        Returns:
+            List[T]: values ordered by matched word
+        """
+
+        prefix = " ".join(prefix.casefold().split())
+        if not prefix:
+            return []
+
+        found: List[T] = []
+        seen = set()
+        i = bisect.bisect_left(self._words, prefix)
+        while (
+            i < len(self._words)
+            and len(found) < limit
+            and self._words[i].startswith(prefix)
+        ):
+            position = self._positions[i]
+            if position not in seen:
+                seen.add(position)
+                found.append(self._values[position])
+            i += 1
+
+        return found
@@ -0,0 +1,94 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from pizza_store.cache import CatalogCache
+
+
+def make_cache() -> CatalogCache:
+    session_factory = mock.MagicMock()
+    session_factory.return_value.__aenter__.return_value = "session"
+    return CatalogCache(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_get_loads_value_once() -> None:
+    cache = make_cache()
+    loader = mock.AsyncMock(return_value=[1, 2])
+
+    assert await cache.get("products", loader) == [1, 2]
+    assert await cache.get("products", loader) == [1, 2]
+    loader.assert_awaited_once_with("session")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_gets_share_one_load() -> None:
+    cache = make_cache()
+    loader = mock.AsyncMock(return_value=[1, 2])
+
+    results = await asyncio.gather(*(cache.get("products", loader) for _ in range(5)))
+    assert results == [[1, 2]] * 5
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidated_entry_is_served_stale_while_reloading() -> None:
+    cache = make_cache()
+    loader = mock.AsyncMock(side_effect=[[1], [1, 2]])
+
+    assert await cache.get("products", loader) == [1]
+    cache.invalidate()
+    assert await cache.get("products", loader) == [1]
+
+    await asyncio.sleep(0)
+    assert await cache.get("products", loader) == [1, 2]
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_keeps_entry_stale() -> None:
+    cache = make_cache()
+
+    async def loader(session: str) -> int:
+        cache.invalidate()
+        return cache.version
+
+    assert await cache.get("version", loader) == 1
+    assert await cache.get("version", loader) == 1
+    await asyncio.sleep(0)
+    assert await cache.get("version", loader) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_without_stale_waits_for_reload() -> None:
+    cache = make_cache()
+    loader = mock.AsyncMock(side_effect=[[1], [1, 2]])
+
+    assert await cache.get("products", loader) == [1]
+    cache.invalidate()
+    assert await cache.get("products", loader, allow_stale=False) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_items_loads_missing_items_in_one_batch() -> None:
+    cache = make_cache()
+    loader = mock.AsyncMock(side_effect=lambda session, keys: {k: -k for k in keys})
+
+    results = await asyncio.gather(
+        cache.get_items("product", [1, 2], loader),
+        cache.get_items("product", [3], loader),
+    )
+    assert results == [{1: -1, 2: -2}, {3: -3}]
+    assert await cache.get_items("product", [1, 3], loader) == {1: -1, 3: -3}
+    loader.assert_awaited_once_with("session", [1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_get_items_reloads_invalidated_items() -> None:
+    cache = make_cache()
+    loader = mock.AsyncMock(side_effect=[{1: "old"}, {}])
+
+    assert await cache.get_items("product", [1], loader) == {1: "old"}
+    cache.invalidate()
+    assert await cache.get_items("product", [1], loader) == {}
+    assert loader.await_count == 2
@@ -0,0 +1,32 @@
+import gzip
+import json
+
+import brotli
+from pizza_store import models
+from pizza_store.cache import CatalogSnapshot
+
+
+def test_from_items_renders_body_once() -> None:
+    snapshot = CatalogSnapshot.from_items([models.Category(id=1, name="Pizza")])
+
+    assert json.loads(snapshot.body) == [{"id": 1, "name": "Pizza"}]
+    assert gzip.decompress(snapshot.encoded_bodies["gzip"]) == snapshot.body
+    assert brotli.decompress(snapshot.encoded_bodies["br"]) == snapshot.body
+
+
+def test_etag_depends_on_content_only() -> None:
+    first = CatalogSnapshot.from_items([models.Category(id=1, name="Pizza")])
+    second = CatalogSnapshot.from_items([models.Category(id=1, name="Pizza")])
+    changed = CatalogSnapshot.from_items([models.Category(id=1, name="Sushi")])
+
+    assert first.etag == second.etag
+    assert first.etag != changed.etag
+
+
+def test_representation_has_own_etag() -> None:
+    snapshot = CatalogSnapshot.from_items([models.Category(id=1, name="Pizza")])
+
+    assert snapshot.representation(None) == (snapshot.body, snapshot.etag)
+    body, etag = snapshot.representation("gzip")
+    assert body == snapshot.encoded_bodies["gzip"]
+    assert etag == f'{snapshot.etag[:-1]}-gzip"'
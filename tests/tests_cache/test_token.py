@@ -0,0 +1,50 @@
+import datetime
+import time
+import uuid
+from unittest import mock
+
+from pizza_store import models
+from pizza_store.cache import TokenCache
+from pizza_store.enums import Role
+
+
+def make_token_data(expires_in: float) -> models.Token:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return models.Token(
+        exp=now + datetime.timedelta(seconds=expires_in),
+        iat=now,
+        user=models.UserInToken(
+            id=uuid.uuid4(), username="test", email="test@example.com", role=Role.USER
+        ),
+    )
+
+
+def test_get_until_token_expires() -> None:
+    cache = TokenCache(maxsize=2)
+    token_data = make_token_data(expires_in=60)
+    cache.set("token", token_data)
+
+    assert cache.get("token") is token_data
+    assert cache.get("other") is None
+    with mock.patch("time.time", return_value=time.time() + 60):
+        assert cache.get("token") is None
+    assert cache.get("token") is None
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = TokenCache(maxsize=2)
+    for token in ("a", "b"):
+        cache.set(token, make_token_data(expires_in=60))
+    cache.get("a")
+    cache.set("c", make_token_data(expires_in=60))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_zero_size_disables_cache() -> None:
+    cache = TokenCache(maxsize=0)
+    cache.set("token", make_token_data(expires_in=60))
+
+    assert cache.get("token") is None
@@ -0,0 +1,107 @@
+import logging
+from unittest import mock
+
+import pytest
+from pizza_store.db.instrumentation import SQLInstrumentation
+
+
+def execute(
+    instrumentation: SQLInstrumentation,
+    statement: str,
+    duration: float,
+    conn: mock.Mock = None,
+) -> None:
+    context = mock.Mock()
+    args = (conn or mock.Mock(), mock.Mock(), statement, (1,), context, False)
+    with mock.patch("time.perf_counter", side_effect=[10.0, 10.0 + duration]):
+        instrumentation._before_cursor_execute(*args)
+        instrumentation._after_cursor_execute(*args)
+
+
+def test_fast_statement_is_not_logged_without_sampling(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    instrumentation = SQLInstrumentation(sample_rate=0, slow_threshold=0.5)
+
+    with caplog.at_level(logging.INFO):
+        execute(instrumentation, "SELECT 1", duration=0.1)
+    assert caplog.records == []
+
+
+def test_sampled_statement_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    instrumentation = SQLInstrumentation(sample_rate=1, slow_threshold=0.5)
+
+    with caplog.at_level(logging.INFO):
+        execute(instrumentation, "SELECT 1", duration=0.1)
+    assert caplog.messages == ["Statement 100.0 ms: SELECT 1"]
+
+
+def test_slow_select_is_logged_with_plan(caplog: pytest.LogCaptureFixture) -> None:
+    instrumentation = SQLInstrumentation(
+        sample_rate=0, slow_threshold=0.5, explain_slow=True
+    )
+    conn = mock.Mock()
+    cursor = conn.connection.cursor.return_value
+    cursor.fetchall.return_value = [("Seq Scan on products",)]
+
+    execute(instrumentation, "SELECT * FROM products", duration=1, conn=conn)
+    assert caplog.records[0].levelno == logging.WARNING
+    assert caplog.messages == [
+        "Slow statement 1000.0 ms: SELECT * FROM products\nSeq Scan on products"
+    ]
+    assert cursor.execute.call_args_list[1] == mock.call(
+        "EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM products", (1,)
+    )
+    cursor.close.assert_called_once()
+
+
+def test_slow_write_is_not_explained(caplog: pytest.LogCaptureFixture) -> None:
+    instrumentation = SQLInstrumentation(
+        sample_rate=0, slow_threshold=0.5, explain_slow=True
+    )
+    conn = mock.Mock()
+
+    execute(instrumentation, "DELETE FROM products", duration=1, conn=conn)
+    assert caplog.messages == ["Slow statement 1000.0 ms: DELETE FROM products"]
+    conn.connection.cursor.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "SELECT pg_notify($1, $2)",
+        "SELECT products.id FROM products WHERE products.id = $1 FOR UPDATE",
+        "SELECT * FROM users WHERE id = $1 FOR NO KEY UPDATE",
+        "SELECT nextval('products_id_seq')",
+    ],
+)
+def test_slow_select_with_side_effects_is_explained_without_analyze(
+    caplog: pytest.LogCaptureFixture, statement: str
+) -> None:
+    instrumentation = SQLInstrumentation(
+        sample_rate=0, slow_threshold=0.5, explain_slow=True
+    )
+    conn = mock.Mock()
+    cursor = conn.connection.cursor.return_value
+    cursor.fetchall.return_value = [("Result",)]
+
+    execute(instrumentation, statement, duration=1, conn=conn)
+    assert cursor.execute.call_args_list[1] == mock.call(f"EXPLAIN {statement}", (1,))
+
+
+def test_slow_read_with_read_only_functions_is_analyzed() -> None:
+    instrumentation = SQLInstrumentation(
+        sample_rate=0, slow_threshold=0.5, explain_slow=True
+    )
+    conn = mock.Mock()
+    cursor = conn.connection.cursor.return_value
+    cursor.fetchall.return_value = [("Seq Scan on users",)]
+    statement = (
+        "SELECT users.id FROM users WHERE lower(users.email) = lower($1) "
+        "AND users.id IN ($2, $3) AND NOT EXISTS (SELECT count(*) FROM products)"
+    )
+
+    execute(instrumentation, statement, duration=1, conn=conn)
+    assert cursor.execute.call_args_list[1] == mock.call(
+        f"EXPLAIN (ANALYZE, BUFFERS) {statement}", (1,)
+    )
@@ -0,0 +1,35 @@
+from unittest import mock
+
+import pytest
+from alembic.script import ScriptDirectory
+from pizza_store.db.migrate import check_schema_version, get_alembic_config
+
+
+def engine_at_revision(*revisions: str) -> mock.MagicMock:
+    connection = mock.AsyncMock()
+    connection.run_sync.return_value = revisions
+    engine = mock.MagicMock()
+    engine.connect.return_value.__aenter__.return_value = connection
+    return engine
+
+
+def test_migrations_have_single_head() -> None:
+    script = ScriptDirectory.from_config(get_alembic_config())
+
+    assert len(script.get_heads()) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_schema_version_at_head() -> None:
+    head = ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+    await check_schema_version(engine_at_revision(head))
+
+
+@pytest.mark.asyncio
+async def test_check_schema_version_not_migrated() -> None:
+    with pytest.raises(RuntimeError):
+        await check_schema_version(engine_at_revision())
+
+    with pytest.raises(RuntimeError):
+        await check_schema_version(engine_at_revision("0001"))
@@ -0,0 +1,47 @@
+from unittest import mock
+
+import pytest
+from pizza_store.db.pool import PoolSize, get_worker_pool_size, get_workers_count
+
+
+def test_get_workers_count() -> None:
+    assert get_workers_count(3) == 3
+    with mock.patch("multiprocessing.cpu_count", return_value=32):
+        assert get_workers_count() == 65
+
+
+def test_get_worker_pool_size_without_budget() -> None:
+    assert get_worker_pool_size(
+        pool_size=5, max_overflow=10, budget=None, workers=65, reserved=1
+    ) == PoolSize(pool_size=5, max_overflow=10)
+
+
+@pytest.mark.parametrize(
+    "budget,workers,reserved,expected",
+    [
+        (1000, 10, 1, PoolSize(pool_size=5, max_overflow=10)),
+        (200, 25, 1, PoolSize(pool_size=5, max_overflow=2)),
+        (300, 65, 1, PoolSize(pool_size=3, max_overflow=0)),
+        (130, 65, 0, PoolSize(pool_size=2, max_overflow=0)),
+    ],
+)
+def test_get_worker_pool_size_with_budget(
+    budget: int, workers: int, reserved: int, expected: PoolSize
+) -> None:
+    pool_size = get_worker_pool_size(
+        pool_size=5,
+        max_overflow=10,
+        budget=budget,
+        workers=workers,
+        reserved=reserved,
+    )
+
+    assert pool_size == expected
+    assert (pool_size.pool_size + pool_size.max_overflow + reserved) * workers <= budget
+
+
+def test_get_worker_pool_size_too_small_budget() -> None:
+    with pytest.raises(ValueError):
+        get_worker_pool_size(
+            pool_size=5, max_overflow=10, budget=100, workers=65, reserved=1
+        )
@@ -0,0 +1,41 @@
+from unittest import mock
+
+import pytest
+from pizza_store.db.unit_of_work import UnitOfWork
+
+
+@pytest.mark.asyncio
+async def test_commit_calls_after_commit_callbacks() -> None:
+    calls = []
+    session = mock.AsyncMock()
+    session.commit.side_effect = lambda: calls.append("commit")
+    uow = UnitOfWork(session)
+    uow.after_commit(lambda: calls.append("invalidate"))
+
+    await uow.flush()
+    await uow.commit()
+
+    session.flush.assert_awaited_once()
+    assert calls == ["commit", "invalidate"]
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_does_not_call_callbacks() -> None:
+    session = mock.AsyncMock()
+    session.commit.side_effect = ConnectionError
+    callback = mock.Mock()
+    uow = UnitOfWork(session)
+    uow.after_commit(callback)
+
+    with pytest.raises(ConnectionError):
+        await uow.commit()
+    callback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_commit_twice() -> None:
+    uow = UnitOfWork(mock.AsyncMock())
+
+    await uow.commit()
+    with pytest.raises(RuntimeError):
+        await uow.commit()
@@ -0,0 +1,84 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from pizza_store.db.warmup import warm_up_pool
+from sqlalchemy.dialects import postgresql
+
+
+class SessionStub:
+    """Session which counts sessions open at the same time."""
+
+    open_sessions = 0
+    max_open_sessions = 0
+    statements: list = []
+
+    def __init__(self, engine: mock.Mock) -> None:
+        pass
+
+    async def __aenter__(self) -> "SessionStub":
+        cls = type(self)
+        cls.open_sessions += 1
+        cls.max_open_sessions = max(cls.max_open_sessions, cls.open_sessions)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        type(self).open_sessions -= 1
+
+    async def execute(self, statement: object) -> mock.MagicMock:
+        type(self).statements.append(statement)
+        # Let other sessions open their connections
+        await asyncio.sleep(0)
+        return mock.MagicMock()
+
+
+@pytest.fixture
+def session_stub() -> type[SessionStub]:
+    SessionStub.open_sessions = SessionStub.max_open_sessions = 0
+    SessionStub.statements = []
+    with mock.patch("pizza_store.db.warmup.AsyncSession", SessionStub):
+        yield SessionStub
+
+
+def engine_with_pool(size: int) -> mock.Mock:
+    engine = mock.Mock()
+    engine.sync_engine.pool.size.return_value = size
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_opens_whole_pool(session_stub: type[SessionStub]) -> None:
+    await warm_up_pool(engine_with_pool(5))
+
+    assert session_stub.max_open_sessions == 5
+    assert len(session_stub.statements) == 5 * 4
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_is_limited_by_pool_size(
+    session_stub: type[SessionStub],
+) -> None:
+    await warm_up_pool(engine_with_pool(3), connections=10)
+
+    assert session_stub.max_open_sessions == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_up_replica_pool_only_reads(
+    session_stub: type[SessionStub],
+) -> None:
+    await warm_up_pool(engine_with_pool(2), replica=True)
+
+    assert len(session_stub.statements) == 2
+    for statement in session_stub.statements:
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT")
+        assert "products" in sql
+        assert "DELETE" not in sql and "INSERT" not in sql
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_disabled(session_stub: type[SessionStub]) -> None:
+    await warm_up_pool(engine_with_pool(5), connections=0)
+
+    assert session_stub.statements == []
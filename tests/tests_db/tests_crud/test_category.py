@@ -5,22 +5,21 @@ import pytest
 from pizza_store.db.crud.category import CategoryCRUD
 from pizza_store.db.models import Category, Product
 from sqlalchemy import delete, select
+from sqlalchemy.orm import joinedload
 
 CATEGORY_CRUD_MODULE_PATH: Final[str] = "pizza_store.db.crud.category.crud"
 
 
 @pytest.mark.asyncio
 async def test_get_categories() -> None:
-    scalars = mock.Mock()
-    scalars.all.return_value = [1, 2]
     result = mock.Mock()
-    result.scalars.return_value = scalars
+    result.all.return_value = [1, 2]
     session = mock.AsyncMock()
     session.execute.return_value = result
 
     res = await CategoryCRUD.get_categories(session)
     assert res == [1, 2]
-    assert str(session.execute.await_args.args[0]) == str(select(Category))
+    assert str(session.execute.await_args.args[0]) == str(select(Category.__table__))
 
 
 @pytest.mark.asyncio
@@ -39,6 +38,22 @@ async def test_get_category() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_get_categories_with_products() -> None:
+    scalars = mock.Mock()
+    scalars.all.return_value = [1, 2]
+    result = mock.Mock()
+    result.unique.return_value.scalars.return_value = scalars
+    session = mock.AsyncMock()
+    session.execute.return_value = result
+
+    res = await CategoryCRUD.get_categories_with_products(session)
+    assert res == [1, 2]
+    assert str(session.execute.await_args.args[0]) == str(
+        select(Category).options(joinedload(Category.products)).order_by(Category.id)
+    )
+
+
 def test_add_category() -> None:
     session = mock.Mock()
 
@@ -3,7 +3,10 @@ from unittest import mock
 import pytest
 from pizza_store.db.crud.product import ProductCRUD
 from pizza_store.db.models.product import Product
-from sqlalchemy import delete, select
+from pizza_store.enums import ProductSort
+from sqlalchemy import Integer, any_, cast, delete, func, or_, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY
 
 
 def test_add_product() -> None:
@@ -17,19 +20,28 @@ def test_add_product() -> None:
 
 @pytest.mark.asyncio
 async def test_get_products() -> None:
-    scalars = mock.Mock()
-    scalars.all.return_value = [1, 2]
     result = mock.Mock()
-    result.scalars.return_value = scalars
+    result.all.return_value = [1, 2]
     session = mock.AsyncMock()
     session.execute.return_value = result
 
     res = await ProductCRUD.get_products(session, limit=2, offset=0)
     assert res == [1, 2]
-    assert str(session.execute.await_args.args[0]) == str(
-        select(Product).limit(2).offset(0)
+    stmt = session.execute.await_args.args[0]
+    assert str(stmt.compile(compile_kwargs={"literal_binds": True})) == str(
+        select(Product.__table__)
+        .order_by(Product.__table__.c.id)
+        .limit(2)
+        .offset(0)
+        .compile(compile_kwargs={"literal_binds": True})
     )
 
+    # Statement is cached, other values are passed as parameters
+    await ProductCRUD.get_products(session, limit=5, offset=10)
+    other_stmt = session.execute.await_args.args[0]
+    assert stmt._generate_cache_key() == other_stmt._generate_cache_key()
+    assert other_stmt.compile().params == {"limit_1": 5, "offset_1": 10}
+
 
 @pytest.mark.asyncio
 async def test_get_product() -> None:
@@ -55,3 +67,149 @@ async def test_delete_product() -> None:
     assert str(session.execute.await_args.args[0]) == str(
         delete(Product).where(Product.id == 1)
     )
+
+
+@pytest.mark.asyncio
+async def test_get_products_page() -> None:
+    result = mock.Mock()
+    result.all.return_value = [1, 2]
+    session = mock.AsyncMock()
+    session.execute.return_value = result
+
+    res = await ProductCRUD.get_products_page(session, limit=2, after=[5])
+    assert res == [1, 2]
+    assert str(session.execute.await_args.args[0]) == str(
+        select(Product.__table__)
+        .where(Product.__table__.c.id > 5)
+        .order_by(Product.__table__.c.id)
+        .limit(2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_products_page_filtered_by_price() -> None:
+    session = mock.AsyncMock()
+    session.execute.return_value = mock.Mock()
+
+    await ProductCRUD.get_products_page(
+        session,
+        limit=2,
+        after=[1000, 5],
+        sort=ProductSort.PRICE,
+        category_id=1,
+        min_price=500,
+        max_price=2000,
+    )
+    assert str(session.execute.await_args.args[0]) == str(
+        select(Product.__table__)
+        .where(Product.__table__.c.category_id == 1)
+        .where(Product.__table__.c.price >= 500)
+        .where(Product.__table__.c.price <= 2000)
+        .where(
+            tuple_(Product.__table__.c.price, Product.__table__.c.id) > tuple_(1000, 5)
+        )
+        .order_by(Product.__table__.c.price, Product.__table__.c.id)
+        .limit(2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_products() -> None:
+    result = mock.Mock()
+    result.all.return_value = [1]
+    session = mock.AsyncMock()
+    session.execute.return_value = result
+
+    res = await ProductCRUD.search_products(session, query="50%_off", limit=10)
+    assert res == [1]
+    stmt = session.execute.await_args.args[0]
+    assert str(stmt) == str(
+        select(Product.__table__)
+        .where(
+            or_(
+                Product.__table__.c.name.ilike("x"),
+                Product.__table__.c.name.op("%")("50%_off"),
+            )
+        )
+        .order_by(
+            func.similarity(Product.__table__.c.name, "50%_off").desc(),
+            Product.__table__.c.id,
+        )
+        .limit(10)
+    )
+    assert "%50\\%\\_off%" in stmt.compile().params.values()
+
+
+@pytest.mark.asyncio
+async def test_stream_products() -> None:
+    async def partitions(size):
+        yield [1, 2]
+        yield [3]
+
+    result = mock.Mock()
+    result.partitions = partitions
+    session = mock.AsyncMock()
+    session.stream.return_value = result
+
+    batches = [rows async for rows in ProductCRUD.stream_products(session, 2)]
+    assert batches == [[1, 2], [3]]
+    stmt = session.stream.await_args.args[0]
+    assert str(stmt) == str(
+        select(
+            Product.id,
+            Product.category_id,
+            Product.name,
+            Product.weight,
+            Product.price,
+            Product.image,
+        ).order_by(Product.id)
+    )
+    assert stmt.get_execution_options()["yield_per"] == 2
+
+
+@pytest.mark.asyncio
+async def test_add_products() -> None:
+    result = mock.Mock()
+    result.all.return_value = [(1, "Tea")]
+    session = mock.AsyncMock()
+    session.execute.return_value = result
+    products = [
+        {"category_id": 1, "name": "Tea", "weight": 100, "price": 500, "image": "a"},
+        {"category_id": 2, "name": "Cola", "weight": 330, "price": 700, "image": "b"},
+    ]
+
+    res = await ProductCRUD.add_products(session, products)
+    assert res == [(1, "Tea")]
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "FROM categories" in sql
+    assert sql.endswith(
+        "ON CONFLICT (name) DO NOTHING RETURNING products.id, products.name"
+    )
+    # One array parameter per column whatever amount of products
+    assert list(stmt.compile().params.values()) == [
+        [1, 2],
+        ["Tea", "Cola"],
+        [100, 330],
+        [500, 700],
+        ["a", "b"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_products_by_ids() -> None:
+    result = mock.Mock()
+    result.all.return_value = [1]
+    session = mock.AsyncMock()
+    session.execute.return_value = result
+
+    res = await ProductCRUD.get_products_by_ids(session, ids=[3, 1])
+    assert res == [1]
+    stmt = session.execute.await_args.args[0]
+    assert str(stmt) == str(
+        select(Product.__table__).where(
+            Product.__table__.c.id == any_(cast([3, 1], ARRAY(Integer)))
+        )
+    )
+    assert "= ANY (CAST(" in str(stmt.compile(dialect=postgresql.dialect()))
+    assert stmt.compile().params == {"param_1": [3, 1]}
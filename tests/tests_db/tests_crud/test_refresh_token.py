@@ -7,6 +7,8 @@ import pytest
 from pizza_store.db.crud.refresh_token.crud import RefreshTokenCRUD
 from pizza_store.db.models import RefreshToken
 from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
 
 CATEGORY_CRUD_MODULE_PATH: Final[str] = "pizza_store.db.crud.refresh_token.crud"
 
@@ -55,3 +57,92 @@ async def test_delete_refresh_token() -> None:
             RefreshToken.user_id == uuid.UUID("ee2a39ce-3812-4872-b17a-35b9c43667d3")
         )
     )
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_refresh_tokens() -> None:
+    session = mock.AsyncMock()
+    session.execute.return_value.rowcount = 3
+
+    deleted = await RefreshTokenCRUD.delete_expired_refresh_tokens(
+        session, now=datetime.datetime(2020, 12, 12, 15)
+    )
+    assert deleted == 3
+    assert str(session.execute.await_args.args[0]) == (
+        "DELETE FROM refresh_tokens_default "
+        "WHERE refresh_tokens_default.expires_at < :expires_at_1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_issue_refresh_token() -> None:
+    session = mock.AsyncMock()
+    user_id = uuid.UUID("ee2a39ce-3812-4872-b17a-35b9c43667d3")
+    values = {
+        "user_id": user_id,
+        "token": uuid.UUID("1edb2f0e-9d5c-4a4f-8f0f-0c3b1a2b3c4d"),
+        "expires_at": datetime.datetime(2020, 12, 12, 15),
+        "user_agent": "Mozilla/5.0",
+        "ip_address": "127.0.0.1",
+    }
+
+    await RefreshTokenCRUD.issue_refresh_token(session, **values, limit=5)
+    refresh_tokens = RefreshToken.__table__
+    inserted = insert(refresh_tokens).values(**values).cte("inserted")
+    kept = (
+        select(refresh_tokens.c.token)
+        .where(refresh_tokens.c.user_id == user_id)
+        .order_by(refresh_tokens.c.expires_at.desc())
+        .limit(4)
+    )
+    stmt = (
+        delete(refresh_tokens)
+        .where(refresh_tokens.c.user_id == user_id, refresh_tokens.c.token.not_in(kept))
+        .add_cte(inserted)
+    )
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    assert str(compiled) == str(stmt.compile(dialect=postgresql.dialect()))
+    assert compiled.params["param_6"] == 4
+
+
+@pytest.mark.asyncio
+async def test_issue_refresh_token_truncates_user_agent() -> None:
+    session = mock.AsyncMock()
+
+    await RefreshTokenCRUD.issue_refresh_token(
+        session,
+        user_id=uuid.UUID("ee2a39ce-3812-4872-b17a-35b9c43667d3"),
+        token=uuid.UUID("1edb2f0e-9d5c-4a4f-8f0f-0c3b1a2b3c4d"),
+        expires_at=datetime.datetime(2020, 12, 12, 15),
+        user_agent="x" * 1000,
+        ip_address=None,
+        limit=5,
+    )
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    assert compiled.params["param_4"] == "x" * 255
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token() -> None:
+    result = mock.Mock()
+    result.first.return_value = 1
+    session = mock.AsyncMock()
+    session.execute.return_value = result
+    token = uuid.UUID("ee2a39ce-3812-4872-b17a-35b9c43667d3")
+    new_token = uuid.UUID("1edb2f0e-9d5c-4a4f-8f0f-0c3b1a2b3c4d")
+    now = datetime.datetime(2020, 12, 12, 15)
+
+    res = await RefreshTokenCRUD.rotate_refresh_token(
+        session,
+        token=token,
+        new_token=new_token,
+        expires_at=now + datetime.timedelta(days=1),
+        now=now,
+    )
+    assert res == 1
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH deleted AS \n(DELETE FROM refresh_tokens WHERE")
+    assert "RETURNING refresh_tokens.user_id, refresh_tokens.signed_in_at" in sql
+    assert "inserted AS \n(INSERT INTO refresh_tokens" in sql
+    assert "FROM deleted RETURNING refresh_tokens.user_id" in sql
+    assert sql.endswith("FROM users JOIN inserted ON users.id = inserted.user_id")
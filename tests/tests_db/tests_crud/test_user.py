@@ -4,7 +4,7 @@ from unittest import mock
 import pytest
 from pizza_store.db.crud.user import UserCRUD
 from pizza_store.db.models import User
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select, update
 
 
 def test_add_user() -> None:
@@ -22,10 +22,8 @@ def test_add_user() -> None:
 
 @pytest.mark.asyncio
 async def test_get_user() -> None:
-    scalars = mock.Mock()
-    scalars.first.return_value = 1
     result = mock.Mock()
-    result.scalars.return_value = scalars
+    result.first.return_value = 1
     session = mock.AsyncMock()
     session.execute.return_value = result
 
@@ -34,39 +32,40 @@ async def test_get_user() -> None:
     )
     assert res == 1
     assert str(session.execute.await_args.args[0]) == str(
-        select(User).where(User.id == uuid.UUID("7076a9b6-3a67-46cf-889d-f1ddc2cb2e68"))
+        select(User.__table__).where(
+            User.__table__.c.id == uuid.UUID("7076a9b6-3a67-46cf-889d-f1ddc2cb2e68")
+        )
     )
 
 
 @pytest.mark.asyncio
 async def test_get_user_by_name() -> None:
-    scalars = mock.Mock()
-    scalars.first.return_value = 1
     result = mock.Mock()
-    result.scalars.return_value = scalars
+    result.first.return_value = 1
     session = mock.AsyncMock()
     session.execute.return_value = result
 
     res = await UserCRUD.get_user_by_name(session, username="John")
     assert res == 1
     assert str(session.execute.await_args.args[0]) == str(
-        select(User).where(User.username == "John")
+        select(User.__table__).where(User.__table__.c.username == "John")
     )
 
 
 @pytest.mark.asyncio
 async def test_get_user_by_email() -> None:
-    scalars = mock.Mock()
-    scalars.first.return_value = 1
     result = mock.Mock()
-    result.scalars.return_value = scalars
+    result.first.return_value = 1
     session = mock.AsyncMock()
     session.execute.return_value = result
 
-    res = await UserCRUD.get_user_by_email(session, email="example@example.com")
+    res = await UserCRUD.get_user_by_email(session, email="Example@example.com")
     assert res == 1
-    assert str(session.execute.await_args.args[0]) == str(
-        select(User).where(User.email == "example@example.com")
+    stmt = session.execute.await_args.args[0]
+    assert str(stmt.compile(compile_kwargs={"literal_binds": True})) == str(
+        select(User.__table__)
+        .where(func.lower(User.__table__.c.email) == func.lower("Example@example.com"))
+        .compile(compile_kwargs={"literal_binds": True})
     )
 
 
@@ -80,3 +79,19 @@ async def test_delete_user() -> None:
     assert str(session.execute.await_args.args[0]) == str(
         delete(User).where(User.id == uuid.UUID("7076a9b6-3a67-46cf-889d-f1ddc2cb2e68"))
     )
+
+
+@pytest.mark.asyncio
+async def test_update_password_hash() -> None:
+    session = mock.AsyncMock()
+
+    await UserCRUD.update_password_hash(
+        session,
+        id=uuid.UUID("7076a9b6-3a67-46cf-889d-f1ddc2cb2e68"),
+        password_hash="hash",
+    )
+    assert str(session.execute.await_args.args[0]) == str(
+        update(User.__table__)
+        .where(User.__table__.c.id == uuid.UUID("7076a9b6-3a67-46cf-889d-f1ddc2cb2e68"))
+        .values(password_hash="hash")
+    )
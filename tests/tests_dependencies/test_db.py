@@ -0,0 +1,65 @@
+import time
+from typing import Optional
+from unittest import mock
+
+import pytest
+from fastapi import Request, Response
+from pizza_store.constants.db import PRIMARY_UNTIL_COOKIE
+from pizza_store.dependencies import db
+
+
+def make_request(method: str, primary_until: Optional[float] = None) -> Request:
+    headers = []
+    if primary_until is not None:
+        headers.append((b"cookie", f"{PRIMARY_UNTIL_COOKIE}={primary_until}".encode()))
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+async def resolve_session(request: Request, response: Response) -> str:
+    session_dependency = db.get_session(request, response)
+    session = await session_dependency.__anext__()
+    await session_dependency.aclose()
+    return session
+
+
+@pytest.fixture(autouse=True)
+def session_factories(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("async_session", "replica_async_session"):
+        session_factory = mock.MagicMock()
+        session_factory.return_value.__aenter__.return_value = name
+        monkeypatch.setattr(db, name, session_factory)
+
+
+@pytest.mark.asyncio
+async def test_get_session_reads_from_replica() -> None:
+    response = Response()
+
+    assert (
+        await resolve_session(make_request("GET"), response) == "replica_async_session"
+    )
+    assert "set-cookie" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_session_writes_to_primary_and_sets_stickiness() -> None:
+    response = Response()
+
+    assert await resolve_session(make_request("POST"), response) == "async_session"
+    assert PRIMARY_UNTIL_COOKIE in response.headers["set-cookie"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "offset, session",
+    [
+        (1, "async_session"),
+        (-1, "replica_async_session"),
+        (3600, "replica_async_session"),
+    ],
+)
+async def test_get_session_reads_from_primary_after_write(
+    offset: float, session: str
+) -> None:
+    request = make_request("GET", primary_until=time.time() + offset)
+
+    assert await resolve_session(request, Response()) == session
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import os
+import signal
+from typing import Iterator
+
+import pytest
+from pizza_store.enums import PasswordHashScheme
+from pizza_store.hashing import (
+    HashingPolicy,
+    HashingPoolBroken,
+    HashingQueueFull,
+    PasswordHasher,
+)
+
+# Lowest costs, tests check behaviour not strength
+POLICY = HashingPolicy(
+    scheme=PasswordHashScheme.BCRYPT,
+    bcrypt_rounds=4,
+    argon2_time_cost=1,
+    argon2_memory_cost=8,
+    argon2_parallelism=1,
+)
+
+
+@pytest.fixture
+def hasher() -> Iterator[PasswordHasher]:
+    hasher = PasswordHasher(workers=1, queue_size=1, policy=POLICY)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(hasher: PasswordHasher) -> None:
+    await hasher.start()
+    password_hash = await hasher.hash("secret")
+
+    assert await hasher.verify("secret", password_hash)
+    assert not await hasher.verify("wrong", password_hash)
+    assert await hasher.verify_and_update("secret", password_hash) == (True, None)
+    metrics = hasher.metrics()
+    assert (metrics.in_flight, metrics.queue_depth, metrics.rejected) == (0, 0, 0)
+    assert 0 <= metrics.wait_time_p50 <= metrics.wait_time_max
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_at_once(hasher: PasswordHasher) -> None:
+    running = asyncio.ensure_future(hasher.hash("first"))
+    queued = asyncio.ensure_future(hasher.hash("second"))
+    await asyncio.sleep(0)
+    metrics = hasher.metrics()
+    assert (metrics.in_flight, metrics.queue_depth) == (2, 1)
+
+    with pytest.raises(HashingQueueFull):
+        await hasher.hash("third")
+
+    await asyncio.gather(running, queued)
+    # Pool slots are released by callbacks scheduled from executor thread
+    await asyncio.sleep(0.01)
+    metrics = hasher.metrics()
+    assert (metrics.in_flight, metrics.rejected) == (0, 1)
+    assert metrics.wait_time_max >= metrics.wait_time_p50 > 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_logged_with_worker_pid(caplog) -> None:
+    hasher = PasswordHasher(
+        workers=1, queue_size=1, policy=POLICY, metrics_interval=0.01
+    )
+    try:
+        with caplog.at_level(logging.INFO, logger="pizza_store.hashing.hasher"):
+            await hasher.start()
+            await asyncio.sleep(0.05)
+    finally:
+        hasher.shutdown()
+
+    assert hasher.metrics().pid == os.getpid()
+    assert f'"pid": {os.getpid()}' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_pool_is_replaced_after_process_is_killed(
+    hasher: PasswordHasher,
+) -> None:
+    await hasher.start()
+    executor = hasher._executor
+    assert executor is not None
+    for pid in list(executor._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    with pytest.raises(HashingPoolBroken):
+        # Pool notices dead process asynchronously, in flight call or
+        # submit of the next one fails
+        for _ in range(100):
+            await hasher.hash("secret")
+            await asyncio.sleep(0.01)
+
+    password_hash = await hasher.hash("secret")
+    assert await hasher.verify("secret", password_hash)
+    assert hasher._executor is not executor
@@ -0,0 +1,48 @@
+from pizza_store.enums import PasswordHashScheme
+from pizza_store.hashing import HashingPolicy
+from pizza_store.hashing.calibrate import calibrate
+
+BCRYPT_POLICY = HashingPolicy(
+    scheme=PasswordHashScheme.BCRYPT,
+    bcrypt_rounds=4,
+    argon2_time_cost=1,
+    argon2_memory_cost=8,
+    argon2_parallelism=1,
+)
+ARGON2_POLICY = BCRYPT_POLICY._replace(scheme=PasswordHashScheme.ARGON2)
+
+
+def test_hash_of_other_scheme_is_rehashed() -> None:
+    password_hash = BCRYPT_POLICY.crypt_context().hash("secret")
+    context = ARGON2_POLICY.crypt_context()
+
+    verified, new_hash = context.verify_and_update("secret", password_hash)
+
+    assert verified
+    assert new_hash is not None and new_hash.startswith("$argon2id$")
+    assert context.verify_and_update("wrong", password_hash) == (False, None)
+    assert not context.needs_update(new_hash)
+
+
+def test_hash_with_other_cost_is_rehashed() -> None:
+    password_hash = BCRYPT_POLICY.crypt_context().hash("secret")
+    context = BCRYPT_POLICY._replace(bcrypt_rounds=5).crypt_context()
+
+    assert not BCRYPT_POLICY.crypt_context().needs_update(password_hash)
+    assert context.needs_update(password_hash)
+
+
+def test_calibrate_picks_highest_cost_within_target() -> None:
+    # Each bcrypt round doubles hash time
+    policy = calibrate(
+        BCRYPT_POLICY, 300, measure=lambda p: 100 * 2 ** (p.bcrypt_rounds - 10)
+    )
+    assert policy.bcrypt_rounds == 11
+
+    policy = calibrate(ARGON2_POLICY, 300, measure=lambda p: 70 * p.argon2_time_cost)
+    assert policy.argon2_time_cost == 4
+
+
+def test_calibrate_when_lowest_cost_is_too_slow() -> None:
+    policy = calibrate(BCRYPT_POLICY, 10, measure=lambda p: 100)
+    assert policy.bcrypt_rounds == 10
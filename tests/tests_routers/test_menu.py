@@ -0,0 +1,71 @@
+from typing import Iterator
+from unittest import mock
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from pizza_store.app import app
+from pizza_store.cache import CatalogCache
+from pizza_store.db.models import Category, Product
+from pizza_store.dependencies.services import get_menu_service
+from pizza_store.services import MenuService
+
+
+@pytest.fixture
+def category_crud() -> mock.AsyncMock:
+    category_crud = mock.AsyncMock()
+    category_crud.get_categories_with_products.side_effect = [
+        [Category(id=1, name="Pizza", products=[])],
+        [
+            Category(
+                id=1,
+                name="Pizza",
+                products=[
+                    Product(
+                        id=1,
+                        category_id=1,
+                        name="Pepperoni",
+                        weight=500,
+                        price=1000,
+                        image="x",
+                    )
+                ],
+            )
+        ],
+    ]
+    return category_crud
+
+
+@pytest.fixture
+def catalog_cache(category_crud: mock.AsyncMock) -> Iterator[CatalogCache]:
+    session_factory = mock.MagicMock()
+    session_factory.return_value.__aenter__.return_value = mock.AsyncMock()
+    catalog_cache = CatalogCache(session_factory)
+    app.dependency_overrides[get_menu_service] = lambda: MenuService(
+        category_crud, catalog_cache
+    )
+    yield catalog_cache
+    app.dependency_overrides.pop(get_menu_service)
+
+
+def test_get_menu_is_cached_until_invalidated(
+    category_crud: mock.AsyncMock, catalog_cache: CatalogCache
+) -> None:
+    client = TestClient(app)
+
+    res = client.get("/api/menu")
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == [{"id": 1, "name": "Pizza", "products": []}]
+    etag = res.headers["ETag"]
+
+    res = client.get("/api/menu", headers={"If-None-Match": etag})
+    assert res.status_code == status.HTTP_304_NOT_MODIFIED
+    assert category_crud.get_categories_with_products.await_count == 1
+
+    # Conditional request waits for reload, so it never gets stale 304
+    catalog_cache.invalidate()
+    res = client.get("/api/menu", headers={"If-None-Match": etag})
+    assert res.status_code == status.HTTP_200_OK
+    assert res.headers["ETag"] != etag
+    assert [p["name"] for p in res.json()[0]["products"]] == ["Pepperoni"]
+    assert category_crud.get_categories_with_products.await_count == 2
@@ -0,0 +1,45 @@
+import uuid
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from pizza_store import models
+from pizza_store.app import app
+from pizza_store.enums import Role
+from pizza_store.services import AuthService
+from pizza_store.settings import settings
+
+
+def access_token(role: Role) -> str:
+    user = models.UserInToken(
+        id=uuid.uuid4(), username="test", email="test@example.com", role=role
+    )
+    return AuthService.create_access_token_for_user(
+        user,
+        key=settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+        expires_in=settings.JWT_EXPIRES_IN,
+    )
+
+
+@pytest.mark.parametrize(
+    "role, status_code",
+    [(Role.USER, status.HTTP_403_FORBIDDEN), (Role.ADMIN, status.HTTP_200_OK)],
+)
+def test_password_hashing_metrics_are_admin_only(role: Role, status_code: int) -> None:
+    client = TestClient(app)
+
+    res = client.get(
+        "/api/metrics/password-hashing",
+        headers={"Authorization": f"Bearer {access_token(role)}"},
+    )
+
+    assert res.status_code == status_code
+
+
+def test_password_hashing_metrics_without_token() -> None:
+    client = TestClient(app)
+
+    res = client.get("/api/metrics/password-hashing")
+
+    assert res.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,30 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from pizza_store.app import app
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "category_id=0",
+        "category_id=2147483648",
+        "min_price=2147483648",
+        "max_price=2147483648",
+    ],
+)
+def test_get_products_with_filter_out_of_int4_range(query: str) -> None:
+    client = TestClient(app)
+
+    res = client.get(f"/api/product?{query}")
+
+    assert res.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize("product_id", ["0", "2147483648"])
+def test_get_product_with_id_out_of_int4_range(product_id: str) -> None:
+    client = TestClient(app)
+
+    res = client.get(f"/api/product/{product_id}")
+
+    assert res.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
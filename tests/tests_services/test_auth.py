@@ -1,11 +1,14 @@
 import datetime
 import uuid
+from unittest import mock
 
 import jwt
 import pytest
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Response, status
 from pizza_store import models
+from pizza_store.cache import TokenCache
 from pizza_store.enums import ProductPermission, Role
+from pizza_store.hashing import HashingPoolBroken, HashingQueueFull
 from pizza_store.services import AuthService
 from pizza_store.settings import settings
 
@@ -26,7 +29,7 @@ def test_get_current_user_with_valid_token() -> None:
         jwt_payload, key=settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
     )
 
-    result = AuthService.get_current_user()(token)
+    result = AuthService.get_current_user()(token, TokenCache(maxsize=16))
     assert result == models.UserInToken(
         username="test",
         email="test@example.com",
@@ -50,7 +53,7 @@ def test_get_current_user_with_invalid_secret_key() -> None:
     token = jwt.encode(jwt_payload, key="invalid key", algorithm=settings.JWT_ALGORITHM)
 
     with pytest.raises(HTTPException) as excinfo:
-        AuthService.get_current_user()(token)
+        AuthService.get_current_user()(token, TokenCache(maxsize=16))
     assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
@@ -71,7 +74,7 @@ def test_get_current_user_with_expired_token() -> None:
     )
 
     with pytest.raises(HTTPException) as excinfo:
-        AuthService.get_current_user()(token)
+        AuthService.get_current_user()(token, TokenCache(maxsize=16))
     assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
@@ -93,7 +96,7 @@ def test_get_current_user_with_valid_required_permissions() -> None:
 
     result = AuthService.get_current_user(
         required_permissions=(ProductPermission.READ,)
-    )(token)
+    )(token, TokenCache(maxsize=16))
     assert result == models.UserInToken(
         username="test",
         email="test@example.com",
@@ -120,7 +123,165 @@ def test_get_current_user_with_invalid_required_permissions() -> None:
 
     with pytest.raises(HTTPException) as excinfo:
         AuthService.get_current_user(required_permissions=(ProductPermission.CREATE,))(
-            token
+            token, TokenCache(maxsize=16)
         )
 
     assert excinfo.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_current_user_caches_decoded_token() -> None:
+    current_datetime = datetime.datetime.utcnow()
+    jwt_payload = {
+        "exp": current_datetime + datetime.timedelta(seconds=settings.JWT_EXPIRES_IN),
+        "iat": current_datetime,
+        "user": {
+            "id": "ec3365b2-b014-4b2e-ba00-a7fe119d5e09",
+            "username": "test",
+            "email": "test@example.com",
+            "role": Role.USER,
+        },
+    }
+    token = jwt.encode(
+        jwt_payload, key=settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+    )
+    token_cache = TokenCache(maxsize=16)
+    dependency = AuthService.get_current_user()
+
+    user = dependency(token, token_cache)
+    with mock.patch("jwt.decode") as decode:
+        assert dependency(token, token_cache) is user
+    decode.assert_not_called()
+
+    # Permissions are checked on every request
+    with pytest.raises(HTTPException) as excinfo:
+        AuthService.get_current_user(required_permissions=(ProductPermission.CREATE,))(
+            token, token_cache
+        )
+    assert excinfo.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [HashingQueueFull, HashingPoolBroken])
+async def test_sign_in_when_hashing_is_unavailable(error: Exception) -> None:
+    user_crud = mock.AsyncMock()
+    password_hasher = mock.Mock(verify_and_update=mock.AsyncMock(side_effect=error))
+    service = AuthService(mock.Mock(), user_crud, mock.AsyncMock(), password_hasher)
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.sign_in(
+            models.UserIn(username="test@example.com", password="secret"), Response()
+        )
+    assert excinfo.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert "Retry-After" in excinfo.value.headers
+
+
+@pytest.mark.asyncio
+async def test_sign_in_rehashes_outdated_password_hash() -> None:
+    user_crud = mock.AsyncMock()
+    user_crud.get_user_by_email.return_value = mock.Mock(
+        id=uuid.UUID("ec3365b2-b014-4b2e-ba00-a7fe119d5e09"),
+        username="test",
+        email="test@example.com",
+        role=Role.USER,
+        password_hash="old hash",
+    )
+    password_hasher = mock.Mock(
+        verify_and_update=mock.AsyncMock(return_value=(True, "new hash"))
+    )
+    refresh_token_crud = mock.AsyncMock()
+    uow = mock.AsyncMock()
+    service = AuthService(uow, user_crud, refresh_token_crud, password_hasher)
+
+    await service.sign_in(
+        models.UserIn(username="test@example.com", password="secret"), Response()
+    )
+
+    password_hasher.verify_and_update.assert_awaited_once_with("secret", "old hash")
+    user_crud.update_password_hash.assert_awaited_once_with(
+        uow.session,
+        id=uuid.UUID("ec3365b2-b014-4b2e-ba00-a7fe119d5e09"),
+        password_hash="new hash",
+    )
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sign_in_issues_refresh_token_of_device() -> None:
+    user_crud = mock.AsyncMock()
+    user_crud.get_user_by_email.return_value = mock.Mock(
+        id=uuid.UUID("ec3365b2-b014-4b2e-ba00-a7fe119d5e09"),
+        username="test",
+        email="test@example.com",
+        role=Role.USER,
+        password_hash="hash",
+    )
+    password_hasher = mock.Mock(
+        verify_and_update=mock.AsyncMock(return_value=(True, None))
+    )
+    refresh_token_crud = mock.AsyncMock()
+    uow = mock.AsyncMock()
+    service = AuthService(uow, user_crud, refresh_token_crud, password_hasher)
+    response = Response()
+
+    with mock.patch.object(settings, "JWT_REFRESH_TOKENS_PER_USER", 3):
+        await service.sign_in(
+            models.UserIn(username="test@example.com", password="secret"),
+            response,
+            user_agent="Mozilla/5.0",
+            ip_address="127.0.0.1",
+        )
+
+    kwargs = refresh_token_crud.issue_refresh_token.await_args.kwargs
+    assert kwargs["user_id"] == uuid.UUID("ec3365b2-b014-4b2e-ba00-a7fe119d5e09")
+    assert kwargs["user_agent"] == "Mozilla/5.0"
+    assert kwargs["ip_address"] == "127.0.0.1"
+    assert kwargs["limit"] == 3
+    assert str(kwargs["token"]) in response.headers["set-cookie"]
+    assert not user_crud.update_password_hash.called
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_rotates_with_single_statement() -> None:
+    refresh_token_crud = mock.AsyncMock()
+    refresh_token_crud.rotate_refresh_token.return_value = mock.Mock(
+        id=uuid.UUID("ec3365b2-b014-4b2e-ba00-a7fe119d5e09"),
+        username="test",
+        email="test@example.com",
+        role=Role.USER,
+    )
+    user_crud = mock.AsyncMock()
+    uow = mock.AsyncMock()
+    service = AuthService(uow, user_crud, refresh_token_crud, mock.Mock())
+    response = Response()
+
+    token_response = await service.refresh_tokens(
+        response, refresh_token_cookie="ee2a39ce-3812-4872-b17a-35b9c43667d3"
+    )
+
+    assert token_response.access_token
+    kwargs = refresh_token_crud.rotate_refresh_token.await_args.kwargs
+    assert kwargs["token"] == uuid.UUID("ee2a39ce-3812-4872-b17a-35b9c43667d3")
+    assert str(kwargs["new_token"]) in response.headers["set-cookie"]
+    assert refresh_token_crud.method_calls == [
+        mock.call.rotate_refresh_token(uow.session, **kwargs)
+    ]
+    assert not user_crud.method_calls
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_with_expired_token() -> None:
+    refresh_token_crud = mock.AsyncMock()
+    refresh_token_crud.rotate_refresh_token.return_value = None
+    uow = mock.AsyncMock()
+    service = AuthService(uow, mock.AsyncMock(), refresh_token_crud, mock.Mock())
+    response = Response()
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.refresh_tokens(
+            response, refresh_token_cookie="ee2a39ce-3812-4872-b17a-35b9c43667d3"
+        )
+    assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert "set-cookie" not in response.headers
+    uow.commit.assert_not_awaited()
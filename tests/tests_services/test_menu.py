@@ -0,0 +1,59 @@
+from unittest import mock
+
+import pytest
+from pizza_store.cache import CatalogCache
+from pizza_store.db.models import Category, Product
+from pizza_store.services import MenuService
+
+
+def make_category(id: int, name: str, product_names: list[str]) -> Category:
+    products = [
+        Product(id=i, category_id=id, name=n, weight=500, price=1000, image="x")
+        for i, n in enumerate(product_names, start=id * 10)
+    ]
+    return Category(id=id, name=name, products=products)
+
+
+def make_catalog_cache() -> CatalogCache:
+    session_factory = mock.MagicMock()
+    session_factory.return_value.__aenter__.return_value = mock.AsyncMock()
+    return CatalogCache(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_get_menu_is_loaded_once() -> None:
+    category_crud = mock.AsyncMock()
+    category_crud.get_categories_with_products.return_value = [
+        make_category(1, "Pizza", ["Pepperoni", "Margherita"]),
+        make_category(2, "Drinks", []),
+    ]
+    service = MenuService(category_crud, make_catalog_cache())
+
+    menu = await service.get_menu()
+    assert await service.get_menu() == menu
+
+    assert [(c.name, [p.name for p in c.products]) for c in menu] == [
+        ("Pizza", ["Pepperoni", "Margherita"]),
+        ("Drinks", []),
+    ]
+    assert menu[0].products[0].category_id == 1
+    category_crud.get_categories_with_products.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_menu_is_reloaded_after_invalidation() -> None:
+    category_crud = mock.AsyncMock()
+    category_crud.get_categories_with_products.side_effect = [
+        [make_category(1, "Pizza", ["Pepperoni"])],
+        [make_category(1, "Pizza", ["Pepperoni", "Margherita"])],
+    ]
+    catalog_cache = make_catalog_cache()
+    service = MenuService(category_crud, catalog_cache)
+    snapshot = await service.get_menu_snapshot()
+
+    catalog_cache.invalidate()
+    fresh = await service.get_menu_snapshot(allow_stale=False)
+
+    assert fresh.etag != snapshot.etag
+    assert [p.name for p in fresh.items[0].products] == ["Pepperoni", "Margherita"]
+    assert category_crud.get_categories_with_products.await_count == 2
@@ -0,0 +1,316 @@
+import asyncio
+import gc
+import io
+import weakref
+import zipfile
+from collections import namedtuple
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException, UploadFile, status
+from pizza_store.cache import CatalogCache
+from pizza_store.constants.pagination import MAX_PAGE_LIMIT
+from pizza_store.constants.paths import IMAGE_FOLDER_PATH
+from pizza_store.db.models import Product
+from pizza_store.db.unit_of_work import UnitOfWork
+from pizza_store.enums import CatalogFormat, ImportStatus, ProductSort
+from pizza_store.models import ProductImport
+from pizza_store.services import ProductService
+from pizza_store.utils.cursor import encode_cursor
+
+
+def make_product(id: int, price: int) -> Product:
+    return Product(
+        id=id, category_id=1, name=f"Pizza {id}", weight=500, price=price, image="x"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_products_page_returns_next_cursor() -> None:
+    product_crud = mock.AsyncMock()
+    product_crud.get_products_page.return_value = [
+        make_product(1, 500),
+        make_product(2, 700),
+        make_product(3, 900),
+    ]
+    service = ProductService(mock.AsyncMock(), product_crud, mock.Mock())
+
+    page = await service.get_products_page(limit=2, sort=ProductSort.PRICE)
+    assert [p.id for p in page.items] == [1, 2]
+    assert page.next == encode_cursor(["price", 700, 2])
+    assert product_crud.get_products_page.await_args.kwargs["limit"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_products_page_passes_cursor_key() -> None:
+    product_crud = mock.AsyncMock()
+    product_crud.get_products_page.return_value = [make_product(3, 900)]
+    service = ProductService(mock.AsyncMock(), product_crud, mock.Mock())
+
+    page = await service.get_products_page(
+        limit=2, cursor=encode_cursor(["price", 700, 2]), sort=ProductSort.PRICE
+    )
+    assert page.next is None
+    assert product_crud.get_products_page.await_args.kwargs["after"] == [700, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "garbage",
+        encode_cursor(["id", 2]),
+        encode_cursor(["price", "700", 2]),
+        encode_cursor(["price", 2**40, 2]),
+        encode_cursor(["price", -1, 2]),
+        encode_cursor(["price", 700, 2**31]),
+        encode_cursor(["price", 700, 0]),
+        encode_cursor(["price", True, 2]),
+    ],
+)
+async def test_get_products_page_with_invalid_cursor(cursor: str) -> None:
+    service = ProductService(mock.Mock(), mock.Mock(), mock.Mock())
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.get_products_page(limit=2, cursor=cursor, sort=ProductSort.PRICE)
+    assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_products_uses_fresh_catalog() -> None:
+    product_crud = mock.AsyncMock()
+    product_crud.get_products.return_value = [
+        make_product(1, 500),
+        make_product(2, 700),
+    ]
+    session_factory = mock.MagicMock()
+    cache = CatalogCache(session_factory)
+    service = ProductService(mock.Mock(), product_crud, cache)
+
+    products = await service.autocomplete_products(prefix="pizza 2", limit=10)
+    assert [p.id for p in products] == [2]
+    product_crud.get_products.assert_awaited_once()
+
+    await service.autocomplete_products(prefix="pizza", limit=10)
+    product_crud.get_products.assert_awaited_once()
+
+
+ProductRow = namedtuple(
+    "ProductRow", ["id", "category_id", "name", "weight", "price", "image"]
+)
+
+
+def make_product_crud_streaming(*batches: list) -> mock.Mock:
+    async def stream_products(session, fetch_size):
+        for rows in batches:
+            yield rows
+
+    product_crud = mock.Mock()
+    product_crud.stream_products = stream_products
+    return product_crud
+
+
+@pytest.mark.asyncio
+async def test_export_products_csv() -> None:
+    product_crud = make_product_crud_streaming(
+        [ProductRow(1, 1, "Pizza, large", 500, 1000, "x")],
+        [ProductRow(2, 1, "Sushi", 300, 900, "y")],
+    )
+    service = ProductService(mock.Mock(), product_crud, mock.Mock())
+
+    chunks = [chunk async for chunk in service.export_products(CatalogFormat.CSV)]
+    assert chunks == [
+        "id,category_id,name,weight,price,image\r\n",
+        '1,1,"Pizza, large",500,1000,x\r\n',
+        "2,1,Sushi,300,900,y\r\n",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_products_ndjson() -> None:
+    product_crud = make_product_crud_streaming(
+        [ProductRow(1, 1, "Піца", 500, 1000, "x"), ProductRow(2, 1, "S", 3, 9, "y")]
+    )
+    service = ProductService(mock.Mock(), product_crud, mock.Mock())
+
+    chunks = [chunk async for chunk in service.export_products(CatalogFormat.NDJSON)]
+    assert chunks == [
+        '{"id":1,"category_id":1,"name":"Піца","weight":500,"price":1000,"image":"x"}\n'
+        '{"id":2,"category_id":1,"name":"S","weight":3,"price":9,"image":"y"}\n'
+    ]
+
+
+def make_product_import(
+    manifest: bytes, images: dict[str, bytes], format: CatalogFormat
+) -> ProductImport:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for name, data in images.items():
+            zip_file.writestr(name, data)
+    archive.seek(0)
+
+    return ProductImport(
+        manifest=UploadFile("products", io.BytesIO(manifest)),
+        images=UploadFile("images.zip", archive),
+        format=format,
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_products(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    IMAGE_FOLDER_PATH.mkdir(parents=True)
+    manifest = (
+        "category_id,name,weight,price,image\n"
+        "1,Pizza,500,1000,pizza.jpg\n"
+        "1,Sushi,0,1000,sushi.jpg\n"
+        "1,Pizza,500,1000,pizza.jpg\n"
+        "2,Tea,100,500,tea.jpg\n"
+        "1,Coffee,100,500,coffee.jpg\n"
+    ).encode()
+    product_import = make_product_import(
+        manifest, {"pizza.jpg": b"pizza", "tea.jpg": b"tea"}, CatalogFormat.CSV
+    )
+    product_crud = mock.AsyncMock()
+    product_crud.add_products.return_value = [ProductRow(7, 1, "Pizza", 500, 1000, "")]
+    catalog_cache = mock.Mock(notify=mock.AsyncMock())
+    session = mock.AsyncMock()
+    service = ProductService(UnitOfWork(session), product_crud, catalog_cache)
+
+    report = await service.import_products(product_import)
+
+    assert (report.created, report.skipped, report.invalid) == (1, 2, 2)
+    assert [(r.row, r.status, r.product_id) for r in report.results] == [
+        (1, ImportStatus.CREATED, 7),
+        (2, ImportStatus.INVALID, None),
+        (3, ImportStatus.SKIPPED, None),
+        (4, ImportStatus.SKIPPED, None),
+        (5, ImportStatus.INVALID, None),
+    ]
+    assert report.results[1].detail.startswith("weight:")
+    assert report.results[4].detail == "Image coffee.jpg not found in archive."
+
+    products = product_crud.add_products.await_args.args[1]
+    assert [p["name"] for p in products] == ["Pizza", "Pizza", "Tea"]
+    image_path = Path(products[0]["image"])
+    assert image_path.parent == IMAGE_FOLDER_PATH
+    assert image_path.read_bytes() == b"pizza"
+    assert not Path(products[2]["image"]).exists()
+    session.commit.assert_awaited_once()
+    catalog_cache.invalidate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_import_products_without_created_does_not_commit() -> None:
+    product_import = make_product_import(
+        b'{"category_id": 1}\nnot json\n', {}, CatalogFormat.NDJSON
+    )
+    product_crud = mock.AsyncMock()
+    session = mock.AsyncMock()
+    service = ProductService(UnitOfWork(session), product_crud, mock.Mock())
+
+    report = await service.import_products(product_import)
+
+    assert [r.status for r in report.results] == [ImportStatus.INVALID] * 2
+    assert report.results[1].detail == "Row must be a JSON object."
+    product_crud.add_products.assert_not_awaited()
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_import_products_with_values_out_of_int4_range() -> None:
+    manifest = (
+        "category_id,name,weight,price,image\n"
+        "2147483648,Pizza,500,1000,pizza.jpg\n"
+        "0,Pizza,500,1000,pizza.jpg\n"
+        "1,Pizza,2147483648,1000,pizza.jpg\n"
+        "1,Pizza,500,2147483648,pizza.jpg\n"
+    ).encode()
+    product_import = make_product_import(
+        manifest, {"pizza.jpg": b"pizza"}, CatalogFormat.CSV
+    )
+    product_crud = mock.AsyncMock()
+    service = ProductService(UnitOfWork(mock.AsyncMock()), product_crud, mock.Mock())
+
+    report = await service.import_products(product_import)
+
+    assert [r.status for r in report.results] == [ImportStatus.INVALID] * 4
+    assert [r.detail.split(":")[0] for r in report.results] == [
+        "category_id",
+        "category_id",
+        "weight",
+        "price",
+    ]
+    product_crud.add_products.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_import_products_with_invalid_archive() -> None:
+    product_import = ProductImport(
+        manifest=UploadFile("products", io.BytesIO(b"")),
+        images=UploadFile("images.zip", io.BytesIO(b"not zip")),
+        format=CatalogFormat.NDJSON,
+    )
+    service = ProductService(mock.AsyncMock(), mock.AsyncMock(), mock.Mock())
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.import_products(product_import)
+    assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def make_catalog_cache() -> CatalogCache:
+    session_factory = mock.MagicMock()
+    session_factory.return_value.__aenter__.return_value = mock.AsyncMock()
+    return CatalogCache(session_factory)
+
+
+@pytest.fixture
+def product_crud() -> mock.AsyncMock:
+    product_crud = mock.AsyncMock()
+    product_crud.get_products_by_ids.return_value = [
+        make_product(1, 500),
+        make_product(2, 700),
+    ]
+    return product_crud
+
+
+@pytest.mark.asyncio
+async def test_get_product_lookups_are_coalesced(product_crud: mock.AsyncMock) -> None:
+    service = ProductService(mock.AsyncMock(), product_crud, make_catalog_cache())
+
+    product, products = await asyncio.gather(
+        service.get_product(product_id=1),
+        service.get_products_by_ids(ids=[2, 99, 1, 2]),
+    )
+    assert product.id == 1
+    assert [p.id for p in products] == [2, 1]
+    assert product_crud.get_products_by_ids.await_args.kwargs["ids"] == [1, 2, 99]
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.get_product(product_id=99)
+    assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
+    assert product_crud.get_products_by_ids.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache_does_not_keep_product_service(
+    product_crud: mock.AsyncMock,
+) -> None:
+    catalog_cache = make_catalog_cache()
+    service = ProductService(mock.AsyncMock(), product_crud, catalog_cache)
+    await service.get_product(product_id=1)
+
+    service_ref = weakref.ref(service)
+    del service
+    gc.collect()
+    assert service_ref() is None
+
+
+@pytest.mark.asyncio
+async def test_get_products_by_ids_with_too_many_ids() -> None:
+    service = ProductService(mock.AsyncMock(), mock.AsyncMock(), mock.Mock())
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.get_products_by_ids(ids=range(MAX_PAGE_LIMIT + 1))
+    assert excinfo.value.status_code == status.HTTP_400_BAD_REQUEST
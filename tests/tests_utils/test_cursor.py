@@ -0,0 +1,16 @@
+import pytest
+from pizza_store.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    assert decode_cursor(encode_cursor([1000, "Margherita", 5])) == [
+        1000,
+        "Margherita",
+        5,
+    ]
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "bm90IGpzb24", "e30"])
+def test_decode_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,45 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from pizza_store.utils.dataloader import DataLoader
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_coalesced() -> None:
+    batch_load = mock.AsyncMock(side_effect=lambda keys: {k: k * 10 for k in keys})
+    loader = DataLoader(batch_load)
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(2), loader.load(1), loader.load_many([3, 2])
+    )
+    assert results == [10, 20, 10, {3: 30, 2: 20}]
+    batch_load.assert_awaited_once_with([1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_sequential_loads_are_separate_batches() -> None:
+    batch_load = mock.AsyncMock(side_effect=lambda keys: {k: k for k in keys})
+    loader = DataLoader(batch_load)
+
+    assert await loader.load(1) == 1
+    assert await loader.load(2) == 2
+    assert batch_load.await_args_list == [mock.call([1]), mock.call([2])]
+
+
+@pytest.mark.asyncio
+async def test_missing_keys_are_omitted() -> None:
+    loader = DataLoader(mock.AsyncMock(return_value={1: "a"}))
+
+    assert await loader.load_many([1, 2]) == {1: "a"}
+    assert await loader.load(2) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_error_is_raised_to_every_reader() -> None:
+    loader = DataLoader(mock.AsyncMock(side_effect=RuntimeError))
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(2), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
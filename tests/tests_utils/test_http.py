@@ -0,0 +1,46 @@
+import pytest
+from pizza_store.utils.http import choose_encoding, client_ip_address, etag_matches
+
+
+@pytest.mark.parametrize(
+    "if_none_match,expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"def", "abc"', True),
+        ("*", True),
+        ('"def"', False),
+    ],
+)
+def test_etag_matches(if_none_match, expected) -> None:
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        (None, None),
+        ("", None),
+        ("gzip, deflate, br", "br"),
+        ("gzip, br;q=0.5", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("deflate", None),
+    ],
+)
+def test_choose_encoding(accept_encoding, expected) -> None:
+    assert choose_encoding(accept_encoding, ["br", "gzip"]) == expected
+
+
+@pytest.mark.parametrize(
+    "host,expected",
+    [
+        (None, None),
+        ("127.0.0.1", "127.0.0.1"),
+        ("::1", "::1"),
+        ("testclient", None),
+    ],
+)
+def test_client_ip_address(host, expected) -> None:
+    assert client_ip_address(host) == expected
@@ -0,0 +1,62 @@
+import datetime
+import time
+import uuid
+from unittest import mock
+
+from pizza_store.utils.ids import min_uuid7, uuid7
+
+
+def test_uuid7_version_and_variant() -> None:
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_starts_with_unix_time_ms() -> None:
+    with mock.patch("time.time_ns", return_value=1_700_000_000_123_456_789):
+        with mock.patch("pizza_store.utils.ids._last", 0):
+            value = uuid7()
+
+    assert value.int >> 80 == 1_700_000_000_123
+    assert value.int >> 64 & 0xFFF == 456_789 * 4096 // 1_000_000
+
+
+def test_uuid7_is_monotonic_when_clock_does_not_advance() -> None:
+    with mock.patch("time.time_ns", return_value=1_700_000_000_123_456_789):
+        with mock.patch("pizza_store.utils.ids._last", 0):
+            values = [uuid7() for _ in range(1_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert all(value.version == 7 for value in values)
+
+
+def test_uuid7_increments_ms_fraction_when_clock_does_not_advance() -> None:
+    with mock.patch("time.time_ns", return_value=1_700_000_000_123_999_999):
+        with mock.patch("pizza_store.utils.ids._last", 0):
+            first, second, third = uuid7(), uuid7(), uuid7()
+
+    # Fraction is a counter carrying into ms, random bits are not derived
+    assert first.int >> 64 & 0xFFF == 0xFFF
+    assert second.int >> 80 == third.int >> 80 == 1_700_000_000_124
+    assert [second.int >> 64 & 0xFFF, third.int >> 64 & 0xFFF] == [0, 1]
+
+
+def test_uuid7_is_time_ordered() -> None:
+    earlier = [uuid7() for _ in range(100)]
+    time.sleep(0.002)
+    later = uuid7()
+
+    assert all(value < later for value in earlier)
+    assert len(set(earlier)) == len(earlier)
+
+
+def test_min_uuid7_bounds_ids_of_later_time() -> None:
+    with mock.patch("time.time_ns", return_value=1_700_000_000_000_000_000):
+        with mock.patch("pizza_store.utils.ids._last", 0):
+            value = uuid7()
+
+    at = datetime.datetime(2023, 11, 14, 22, 13, 20)
+    assert min_uuid7(at) <= value < min_uuid7(at + datetime.timedelta(milliseconds=1))
+    assert min_uuid7(at).int >> 80 == 1_700_000_000_000
@@ -0,0 +1,27 @@
+from pizza_store.utils.prefix_index import PrefixIndex
+
+
+def test_search_matches_any_word_prefix() -> None:
+    index = PrefixIndex([("Spicy Pepperoni", 1), ("Pepsi", 2), ("Tea", 3)])
+
+    assert index.search("pep", limit=10) == [1, 2]
+    assert index.search("spicy pe", limit=10) == [1]
+    assert index.search("coffee", limit=10) == []
+
+
+def test_search_is_case_insensitive_and_limited() -> None:
+    index = PrefixIndex([("Pepperoni", 1), ("Pepsi", 2)])
+
+    assert index.search("PEP", limit=1) == [1]
+
+
+def test_search_returns_value_once() -> None:
+    index = PrefixIndex([("Pepper pepperoni", 1)])
+
+    assert index.search("pepper", limit=10) == [1]
+
+
+def test_search_with_blank_prefix() -> None:
+    index = PrefixIndex([("Tea", 1)])
+
+    assert index.search("  ", limit=10) == []